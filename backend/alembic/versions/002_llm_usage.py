@@ -0,0 +1,47 @@
+"""llm_usage ledger
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:12:40.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_usage',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('source_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('data_sources.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('stage', sa.String(30), nullable=False),
+        sa.Column('platform', sa.String(30), nullable=True),
+        sa.Column('model', sa.String(60), nullable=False),
+        sa.Column('input_tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('output_tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('cached_tokens', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('latency_ms', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('outcome', sa.String(20), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index('ix_llm_usage_user_id_created_at', 'llm_usage', ['user_id', 'created_at'])
+    op.create_index('ix_llm_usage_stage_created_at', 'llm_usage', ['stage', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_llm_usage_stage_created_at', table_name='llm_usage')
+    op.drop_index('ix_llm_usage_user_id_created_at', table_name='llm_usage')
+    op.drop_table('llm_usage')
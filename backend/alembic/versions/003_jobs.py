@@ -0,0 +1,44 @@
+"""jobs queue
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 10:31:02.114867
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('queue', sa.String(30), nullable=False),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('payload', postgresql.JSONB, nullable=False, server_default='{}'),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('attempts', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer, nullable=False, server_default='3'),
+        sa.Column('run_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('locked_by', sa.String(100), nullable=True),
+        sa.Column('last_error', sa.Text, nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index('ix_jobs_queue_status_run_at', 'jobs', ['queue', 'status', 'run_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_queue_status_run_at', table_name='jobs')
+    op.drop_table('jobs')
@@ -0,0 +1,31 @@
+"""jobs dedupe key
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 11:05:47.309214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('dedupe_key', sa.String(100), nullable=True))
+    op.create_index(
+        'ux_jobs_dedupe_key_queued', 'jobs', ['dedupe_key'],
+        unique=True, postgresql_where=sa.text("status = 'queued'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_jobs_dedupe_key_queued', table_name='jobs')
+    op.drop_column('jobs', 'dedupe_key')
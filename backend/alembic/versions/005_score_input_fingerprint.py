@@ -0,0 +1,26 @@
+"""career_scores input fingerprint
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 11:48:13.662090
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('career_scores', sa.Column('input_fingerprint', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('career_scores', 'input_fingerprint')
@@ -0,0 +1,29 @@
+"""career_scores phase
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 12:20:36.845571
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'career_scores',
+        sa.Column('phase', sa.String(20), nullable=False, server_default='final'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('career_scores', 'phase')
@@ -0,0 +1,51 @@
+"""pipeline runs and checkpoints
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 13:42:18.027733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'data_sources',
+        sa.Column('run_id', postgresql.UUID(as_uuid=True), nullable=False,
+                  server_default=sa.text('gen_random_uuid()')),
+    )
+    op.alter_column('data_sources', 'run_id', server_default=None)
+    op.add_column('data_sources', sa.Column('lease_owner', sa.String(100), nullable=True))
+    op.add_column('data_sources', sa.Column('lease_until', sa.DateTime(timezone=True), nullable=True))
+
+    op.create_table(
+        'pipeline_checkpoints',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('source_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('data_sources.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('run_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('stage', sa.String(20), nullable=False),
+        sa.Column('idempotency_key', sa.String(120), nullable=False, unique=True),
+        sa.Column('artifact', postgresql.JSONB, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index('ix_pipeline_checkpoints_source_id', 'pipeline_checkpoints', ['source_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipeline_checkpoints_source_id', table_name='pipeline_checkpoints')
+    op.drop_table('pipeline_checkpoints')
+    op.drop_column('data_sources', 'lease_until')
+    op.drop_column('data_sources', 'lease_owner')
+    op.drop_column('data_sources', 'run_id')
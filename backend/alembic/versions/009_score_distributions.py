@@ -0,0 +1,90 @@
+"""score distributions
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 19:27:05.318461
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'score_distribution_buckets',
+        sa.Column('job_category', sa.String(50), primary_key=True),
+        sa.Column('years_band', sa.String(10), primary_key=True),
+        sa.Column('area', sa.String(20), primary_key=True),
+        sa.Column('bucket', sa.SmallInteger, primary_key=True),
+        sa.Column('count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('score_sum', sa.Numeric(14, 2), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'score_distribution_members',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('score_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('job_category', sa.String(50), nullable=False),
+        sa.Column('years_band', sa.String(10), nullable=False),
+        sa.Column('scores', postgresql.JSONB, nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    )
+
+    # 기존 데이터 채우기: 유저별 최신 스코어 1건 (python -m app.services.score_distribution rebuild 와 동일)
+    op.execute("""
+        INSERT INTO score_distribution_members
+            (user_id, score_id, job_category, years_band, scores, updated_at)
+        SELECT DISTINCT ON (cs.user_id)
+            cs.user_id,
+            cs.id,
+            COALESCE(u.job_category, 'other'),
+            CASE
+                WHEN COALESCE(u.years_of_experience, 0) <= 2 THEN '0-2'
+                WHEN u.years_of_experience <= 5 THEN '3-5'
+                WHEN u.years_of_experience <= 9 THEN '6-9'
+                WHEN u.years_of_experience <= 14 THEN '10-14'
+                ELSE '15+'
+            END,
+            jsonb_strip_nulls(jsonb_build_object(
+                'total', cs.total_score::float8,
+                'expertise', cs.expertise_score::float8,
+                'influence', cs.influence_score::float8,
+                'consistency', cs.consistency_score::float8,
+                'marketability', cs.marketability_score::float8,
+                'potential', cs.potential_score::float8
+            )),
+            now()
+        FROM career_scores cs
+        JOIN users u ON u.id = cs.user_id
+        ORDER BY cs.user_id, cs.scored_at DESC
+    """)
+    op.execute("""
+        INSERT INTO score_distribution_buckets
+            (job_category, years_band, area, bucket, count, score_sum)
+        SELECT
+            m.job_category,
+            b.band,
+            s.key,
+            LEAST(GREATEST(FLOOR(s.value::numeric), 0), 100)::smallint,
+            COUNT(*),
+            SUM(s.value::numeric)
+        FROM score_distribution_members m
+        CROSS JOIN LATERAL jsonb_each_text(m.scores) s
+        CROSS JOIN LATERAL (VALUES (m.years_band), ('all')) b(band)
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('score_distribution_members')
+    op.drop_table('score_distribution_buckets')
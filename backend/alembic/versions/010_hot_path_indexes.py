@@ -0,0 +1,61 @@
+"""hot path indexes and latest score pointer
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 20:11:52.740318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 단일 컬럼 user_id 인덱스는 복합 인덱스의 접두어로 대체
+    op.create_index('ix_career_scores_user_id_scored_at', 'career_scores', ['user_id', 'scored_at'])
+    op.drop_index('ix_career_scores_user_id', table_name='career_scores')
+    op.create_index('ix_data_sources_user_id_status', 'data_sources', ['user_id', 'status'])
+    op.drop_index('ix_data_sources_user_id', table_name='data_sources')
+    op.create_index('ix_score_history_user_id_created_at', 'score_history', ['user_id', 'created_at'])
+    op.drop_index('ix_score_history_user_id', table_name='score_history')
+
+    op.add_column(
+        'users',
+        sa.Column('latest_score_id', postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        'fk_users_latest_score_id', 'users', 'career_scores',
+        ['latest_score_id'], ['id'], ondelete='SET NULL',
+    )
+    # 유저별 상관 서브쿼리 대신 career_scores 를 한 번만 읽어 조인
+    op.execute("""
+        UPDATE users u
+        SET latest_score_id = latest.id
+        FROM (
+            SELECT DISTINCT ON (user_id) id, user_id
+            FROM career_scores
+            ORDER BY user_id, scored_at DESC
+        ) latest
+        WHERE latest.user_id = u.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_users_latest_score_id', 'users', type_='foreignkey')
+    op.drop_column('users', 'latest_score_id')
+
+    op.create_index('ix_score_history_user_id', 'score_history', ['user_id'])
+    op.drop_index('ix_score_history_user_id_created_at', table_name='score_history')
+    op.create_index('ix_data_sources_user_id', 'data_sources', ['user_id'])
+    op.drop_index('ix_data_sources_user_id_status', table_name='data_sources')
+    op.create_index('ix_career_scores_user_id', 'career_scores', ['user_id'])
+    op.drop_index('ix_career_scores_user_id_scored_at', table_name='career_scores')
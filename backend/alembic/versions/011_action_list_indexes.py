@@ -0,0 +1,46 @@
+"""action list keyset and tag indexes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 21:02:17.384105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 정렬 키 인덱스가 user_id 단일 인덱스를 대체
+    op.create_index(
+        'ix_action_recommendations_user_id_created_at',
+        'action_recommendations',
+        ['user_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_action_recommendations_user_id_impact',
+        'action_recommendations',
+        ['user_id', sa.text('coalesce(impact_percent, -1)'), 'created_at', 'id'],
+    )
+    op.drop_index('ix_action_recommendations_user_id', table_name='action_recommendations')
+    op.create_index(
+        'ix_action_recommendations_tags',
+        'action_recommendations',
+        ['tags'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_action_recommendations_tags', table_name='action_recommendations')
+    op.create_index('ix_action_recommendations_user_id', 'action_recommendations', ['user_id'])
+    op.drop_index('ix_action_recommendations_user_id_impact', table_name='action_recommendations')
+    op.drop_index('ix_action_recommendations_user_id_created_at', table_name='action_recommendations')
@@ -2,12 +2,13 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import decode_token
 from app.models.user import User
+from app.services.user_cache import get_user
 
 security = HTTPBearer()
 
@@ -32,8 +33,7 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
-    user = result.scalar_one_or_none()
+    user = await get_user(db, UUID(user_id))
 
     if user is None:
         raise HTTPException(
@@ -42,3 +42,12 @@ async def get_current_user(
         )
 
     return user
+
+
+async def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    if user.email not in settings.ADMIN_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return user
@@ -1,86 +1,87 @@
 """
 액션 추천 API 엔드포인트
-- 액션 목록 (필터/정렬)
+- 액션 목록 (필터/정렬, 키셋 커서 페이지네이션)
 - 액션 완료 토글 (+ 재스캔 트리거)
 - 액션 북마크 토글
+- 목록은 액션 버전 + 쿼리 파라미터 ETag 로 조건부 응답, 변경 시 버전 증가
 """
 
-import asyncio
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, desc, asc
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 from app.models.action_recommendation import ActionRecommendation
 from app.api.deps import get_current_user
-from app.services.analysis import run_scoring
+from app.services import action_list
+from app.services.job_queue import enqueue_scoring
+from app.services.serializers import serialize_action
+from app.services.versions import (
+    bump_actions_version,
+    cache_headers,
+    etag_matches,
+    load_versions,
+    make_etag,
+    not_modified,
+)
 
 router = APIRouter(prefix="/actions", tags=["actions"])
 
 
 @router.get("")
 async def get_actions(
+    response: Response,
     tag: str | None = Query(None, description="태그 필터"),
     area: str | None = Query(None, description="영역 필터 (expertise, influence, ...)"),
     sort: str = Query("impact", description="정렬: impact, difficulty, recent"),
     completed: bool | None = Query(None, description="완료 상태 필터"),
     bookmarked: bool | None = Query(None, description="북마크 필터"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(
+        settings.ACTIONS_PAGE_SIZE, ge=1, le=settings.ACTIONS_PAGE_MAX, description="페이지 크기"
+    ),
+    if_none_match: str | None = Header(None),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """추천 액션 목록을 조회합니다."""
-    query = select(ActionRecommendation).where(
-        ActionRecommendation.user_id == user.id
+    """
+    추천 액션 목록을 조회합니다. next_cursor 가 있으면 다음 페이지가 있습니다.
+    첫 페이지의 totals 는 태그 / 영역 필터 안의 진행 중 / 완료 개수입니다.
+    """
+    versions = await load_versions(db, user.id)
+    etag = make_etag(
+        "actions", versions.actions_version, tag, area, sort, completed, bookmarked, cursor, limit
     )
-
-    # 필터
-    if area:
-        query = query.where(ActionRecommendation.target_area == area)
-    if completed is not None:
-        query = query.where(ActionRecommendation.is_completed == completed)
-    if bookmarked is not None:
-        query = query.where(ActionRecommendation.is_bookmarked == bookmarked)
-
-    # 정렬
-    if sort == "impact":
-        query = query.order_by(desc(ActionRecommendation.impact_percent))
-    elif sort == "difficulty":
-        difficulty_order = {"easy": 1, "medium": 2, "hard": 3}
-        query = query.order_by(asc(ActionRecommendation.difficulty))
-    else:
-        query = query.order_by(desc(ActionRecommendation.created_at))
-
-    result = await db.execute(query)
-    actions = result.scalars().all()
-
-    # 태그 필터 (DB 배열 필터보다 Python에서 처리)
-    if tag:
-        actions = [a for a in actions if a.tags and tag in a.tags]
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    try:
+        actions, next_cursor = await action_list.list_actions(
+            db,
+            user.id,
+            sort=sort,
+            cursor=cursor,
+            limit=limit,
+            tag=tag,
+            area=area,
+            completed=completed,
+            bookmarked=bookmarked,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 개수는 첫 페이지에서만 집계 (다음 페이지는 목록만)
+    totals = None if cursor else await action_list.count_by_status(db, user.id, tag=tag, area=area)
+    response.headers.update(cache_headers(etag))
 
     return {
         "count": len(actions),
-        "actions": [
-            {
-                "id": str(a.id),
-                "title": a.title,
-                "description": a.description,
-                "impact_percent": float(a.impact_percent) if a.impact_percent else None,
-                "target_area": a.target_area,
-                "difficulty": a.difficulty,
-                "estimated_duration": a.estimated_duration,
-                "tags": a.tags or [],
-                "cta_label": a.cta_label,
-                "cta_url": a.cta_url,
-                "is_completed": a.is_completed,
-                "completed_at": a.completed_at.isoformat() if a.completed_at else None,
-                "is_bookmarked": a.is_bookmarked,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-            }
-            for a in actions
-        ],
+        "actions": [serialize_action(a) for a in actions],
+        "next_cursor": next_cursor,
+        "totals": totals,
     }
 
 
@@ -104,11 +105,13 @@ async def toggle_complete(
 
     action.is_completed = not action.is_completed
     action.completed_at = datetime.now(timezone.utc) if action.is_completed else None
-    await db.commit()
 
-    # 완료 시 백그라운드에서 재스코어링
+    await bump_actions_version(db, user.id)
+
+    # 완료 시 워커에서 재스코어링
     if action.is_completed:
-        asyncio.create_task(run_scoring(user.id))
+        await enqueue_scoring(db, user.id)
+    await db.commit()
 
     return {
         "id": str(action.id),
@@ -137,6 +140,7 @@ async def toggle_bookmark(
         raise HTTPException(status_code=404, detail="Action not found")
 
     action.is_bookmarked = not action.is_bookmarked
+    await bump_actions_version(db, user.id)
     await db.commit()
 
     return {
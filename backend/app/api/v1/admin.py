@@ -0,0 +1,120 @@
+"""
+관리자 API 엔드포인트
+- LLM 토큰/지연시간 원장 조회 (유저/단계/플랫폼/모델별 집계)
+- LLM 호출과 파이프라인 DB 작업은 워커에서 실행되므로, 그 프로세스 메트릭(LLM 누적 / 풀)은
+  워커의 WORKER_METRICS_PORT /metrics 에서 조회 (API 프로세스 값은 API /metrics)
+- 이벤트 루프 지연 / 블로킹 호출 보고
+- 프로세스 내 캐시 적중률
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select, func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import engine, get_db
+from app.core.loop_monitor import loop_monitor
+from app.core.pool_metrics import pool_stats
+from app.models.user import User
+from app.models.llm_usage import LLMUsage
+from app.api.deps import get_admin_user
+from app.services.score_cache import distribution_cache, latest_score_cache
+from app.services.user_cache import user_cache
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+GROUP_COLUMNS = {
+    "user": LLMUsage.user_id,
+    "stage": LLMUsage.stage,
+    "platform": LLMUsage.platform,
+    "model": LLMUsage.model,
+    "outcome": LLMUsage.outcome,
+}
+
+
+@router.get("/llm-usage")
+async def get_llm_usage(
+    group_by: str = Query("stage", pattern="^(user|stage|platform|model|outcome)$"),
+    user_id: UUID | None = Query(None, description="특정 유저로 한정"),
+    stage: str | None = Query(None, description="특정 단계로 한정 (parse, calibration, actions)"),
+    days: int = Query(7, ge=1, le=90, description="조회 기간 (일)"),
+    limit: int = Query(50, ge=1, le=500),
+    admin: User = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """LLM 호출 원장을 기간/조건별로 집계합니다."""
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    key = GROUP_COLUMNS[group_by]
+    total_tokens = func.sum(LLMUsage.input_tokens + LLMUsage.output_tokens)
+
+    query = (
+        select(
+            key.label("key"),
+            func.count().label("calls"),
+            func.sum(LLMUsage.input_tokens).label("input_tokens"),
+            func.sum(LLMUsage.output_tokens).label("output_tokens"),
+            func.sum(LLMUsage.cached_tokens).label("cached_tokens"),
+            func.sum(LLMUsage.latency_ms).label("latency_ms_total"),
+            func.max(LLMUsage.latency_ms).label("latency_ms_max"),
+            func.count().filter(LLMUsage.outcome != "ok").label("failed_calls"),
+        )
+        .where(LLMUsage.created_at >= since)
+        .group_by(key)
+        .order_by(desc(total_tokens))
+        .limit(limit)
+    )
+    if user_id:
+        query = query.where(LLMUsage.user_id == user_id)
+    if stage:
+        query = query.where(LLMUsage.stage == stage)
+
+    result = await db.execute(query)
+    rows = result.all()
+
+    return {
+        "group_by": group_by,
+        "since": since.isoformat(),
+        "rows": [
+            {
+                "key": str(row.key) if row.key is not None else None,
+                "calls": row.calls,
+                "failed_calls": row.failed_calls,
+                "input_tokens": int(row.input_tokens or 0),
+                "output_tokens": int(row.output_tokens or 0),
+                "cached_tokens": int(row.cached_tokens or 0),
+                "latency_ms_total": int(row.latency_ms_total or 0),
+                "latency_ms_avg": round((row.latency_ms_total or 0) / row.calls, 1),
+                "latency_ms_max": int(row.latency_ms_max or 0),
+            }
+            for row in rows
+        ],
+    }
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(admin: User = Depends(get_admin_user)):
+    """이 프로세스의 DB 커넥션 풀 상태와 체크아웃 대기/보유 시간"""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **pool_stats.snapshot(),
+    }
+
+
+@router.get("/event-loop")
+async def get_event_loop_stats(admin: User = Depends(get_admin_user)):
+    """이 프로세스의 이벤트 루프 지연과 최근 블로킹 보고 (원인 함수, 스택)"""
+    return loop_monitor.snapshot()
+
+
+@router.get("/caches")
+async def get_cache_stats(admin: User = Depends(get_admin_user)):
+    """이 프로세스의 캐시 크기와 적중률 (L1 + Redis L2)"""
+    return {
+        cache.name: cache.stats()
+        for cache in (user_cache, latest_score_cache, distribution_cache)
+    }
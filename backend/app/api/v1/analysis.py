@@ -1,15 +1,20 @@
 import asyncio
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import async_session, get_db
 from app.models.user import User
+from app.models.career_score import CareerScore
 from app.models.data_source import DataSource
 from app.api.deps import get_current_user
-from app.services.analysis import process_all_sources
+from app.services.job_queue import enqueue
+from app.services.progress import format_sse, progress_broker
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
@@ -30,8 +35,9 @@ async def run_analysis(
     if total == 0:
         raise HTTPException(status_code=400, detail="No sources registered")
 
-    # Trigger processing in background
-    asyncio.create_task(process_all_sources(user.id))
+    # Queue processing for the worker
+    await enqueue(db, "process_all_sources", {"user_id": str(user.id)})
+    await db.commit()
 
     return {
         "status": "processing",
@@ -55,7 +61,68 @@ async def analysis_status(
         .group_by(DataSource.status)
     )
     status_counts = {row.status: row.count for row in result}
+    return summarize_status(status_counts)
 
+
+@router.get("/events")
+async def analysis_events(user: User = Depends(get_current_user)):
+    """
+    분석 진행 상황을 Server-Sent Events 로 전달합니다.
+
+    연결 직후 현재 소스 상태 + 최신 스코어 스냅샷(snapshot)을 보내고, 이후 워커가 발행하는
+    소스 단계 전이(source) / 스코어링 단계(scoring) / 액션 생성(actions) 이벤트를 그대로 전달합니다.
+    스트림이 끝나면 클라이언트가 재연결해 스냅샷부터 다시 받습니다.
+    스코어링이 이미 끝난 뒤 접속하면 snapshot.score.is_current 로 바로 알 수 있습니다.
+    """
+    return StreamingResponse(
+        _progress_stream(user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _progress_stream(user_id: UUID):
+    # 구독을 먼저 시작해 스냅샷 조회 중 발생한 이벤트도 놓치지 않음
+    async with progress_broker.subscribe(user_id) as queue:
+        async with async_session() as db:
+            result = await db.execute(
+                select(DataSource.id, DataSource.status, DataSource.last_scraped_at)
+                .where(DataSource.user_id == user_id)
+            )
+            rows = result.all()
+            score_result = await db.execute(
+                select(CareerScore.id, CareerScore.phase, CareerScore.scored_at)
+                .join(User, User.latest_score_id == CareerScore.id)
+                .where(User.id == user_id)
+            )
+            score = score_result.first()
+
+        sources = {str(row.id): row.status for row in rows}
+        status_counts: dict[str, int] = {}
+        for source_status in sources.values():
+            status_counts[source_status] = status_counts.get(source_status, 0) + 1
+        scraped = [row.last_scraped_at for row in rows if row.last_scraped_at]
+        yield format_sse("snapshot", {
+            **summarize_status(status_counts),
+            "sources": sources,
+            "score": summarize_score(score, max(scraped, default=None)),
+        })
+
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), settings.PROGRESS_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                return
+            yield format_sse(event.get("type", "message"), event)
+
+
+def summarize_status(status_counts: dict[str, int]) -> dict:
+    """소스 상태별 개수 → 진행률 요약"""
     total = sum(status_counts.values())
     completed = status_counts.get("completed", 0)
     failed = status_counts.get("failed", 0)
@@ -73,3 +140,21 @@ async def analysis_status(
         "total": total,
         "status_breakdown": status_counts,
     }
+
+
+def summarize_score(score, last_scraped_at: datetime | None) -> dict | None:
+    """
+    최신 스코어 요약. is_current: 보정까지 끝난(final / fallback) 스코어가
+    마지막 소스 수집 이후에 매겨졌으면 True (더 기다릴 스코어링 이벤트가 없음)
+    """
+    if score is None:
+        return None
+    is_current = score.phase in ("final", "fallback") and (
+        last_scraped_at is None or score.scored_at >= last_scraped_at
+    )
+    return {
+        "id": str(score.id),
+        "phase": score.phase,
+        "scored_at": score.scored_at.isoformat(),
+        "is_current": is_current,
+    }
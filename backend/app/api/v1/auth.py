@@ -19,6 +19,9 @@ from app.schemas.auth import (
     UserResponse,
 )
 from app.api.deps import get_current_user
+from app.services.score_cache import invalidate_scores
+from app.services.score_distribution import remove_member
+from app.services.user_cache import invalidate_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -34,7 +37,7 @@ async def signup(req: SignupRequest, db: AsyncSession = Depends(get_db)):
 
     user = User(
         email=req.email,
-        password_hash=hash_password(req.password),
+        password_hash=await hash_password(req.password),
         name=req.name,
         auth_provider="email",
     )
@@ -59,12 +62,19 @@ async def login(req: LoginRequest, db: AsyncSession = Depends(get_db)):
             detail="Invalid email or password",
         )
 
-    if not verify_password(req.password, user.password_hash):
+    valid, new_hash = await verify_password(req.password, user.password_hash)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
+    # Transparent rehash when the bcrypt cost changed
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+        await invalidate_user(user.id)
+
     return TokenResponse(
         access_token=create_access_token(str(user.id)),
         refresh_token=create_refresh_token(str(user.id)),
@@ -112,5 +122,8 @@ async def delete_account(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    await remove_member(db, user.id)
     await db.delete(user)
     await db.commit()
+    await invalidate_user(user.id)
+    await invalidate_scores(user.id, user.job_category)
@@ -0,0 +1,29 @@
+"""
+대시보드 API 엔드포인트
+- 메인 화면에 필요한 소스 / 최신 스코어 / 포지셔닝 / 히스토리 / 액션을 한 번의 요청으로 반환
+- ETag + If-None-Match 로 변경이 없으면 304
+"""
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import JSONResponse
+
+from app.models.user import User
+from app.api.deps import get_current_user
+from app.services.dashboard import etag_for, load_dashboard
+from app.services.versions import cache_headers, etag_matches, not_modified
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("")
+async def get_dashboard(
+    actions_limit: int = Query(3, ge=1, le=50, description="미완료 액션 개수 (영향도 순)"),
+    if_none_match: str | None = Header(None),
+    user: User = Depends(get_current_user),
+):
+    """대시보드 데이터를 한 번에 조회합니다."""
+    payload = await load_dashboard(user, actions_limit)
+    etag = etag_for(payload)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return JSONResponse(payload, headers=cache_headers(etag))
@@ -6,6 +6,9 @@ from app.models.user import User
 from app.schemas.onboarding import ProfileUpdateRequest
 from app.schemas.auth import UserResponse
 from app.api.deps import get_current_user
+from app.services.score_cache import invalidate_scores
+from app.services.score_distribution import update_member
+from app.services.user_cache import invalidate_user
 
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
@@ -16,11 +19,20 @@ async def update_profile(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    previous_category = user.job_category
+    previous_years = user.years_of_experience
     user.job_category = req.job_category
     user.years_of_experience = req.years_of_experience
     if req.name:
         user.name = req.name
 
+    moved = (previous_category, previous_years) != (user.job_category, user.years_of_experience)
+    if moved:
+        # 최신 스코어의 분포 기여분을 새 직군 / 연차 구간으로 이동
+        await update_member(db, user.id, user.job_category, user.years_of_experience)
     await db.commit()
+    await invalidate_user(user.id)
+    if moved:
+        await invalidate_scores(user.id, previous_category, user.job_category)
     await db.refresh(user)
     return user
@@ -6,6 +6,8 @@ from app.api.v1.sources import router as sources_router
 from app.api.v1.analysis import router as analysis_router
 from app.api.v1.scores import router as scores_router
 from app.api.v1.actions import router as actions_router
+from app.api.v1.dashboard import router as dashboard_router
+from app.api.v1.admin import router as admin_router
 
 api_router = APIRouter()
 api_router.include_router(auth_router)
@@ -14,3 +16,5 @@ api_router.include_router(sources_router)
 api_router.include_router(analysis_router)
 api_router.include_router(scores_router)
 api_router.include_router(actions_router)
+api_router.include_router(dashboard_router)
+api_router.include_router(admin_router)
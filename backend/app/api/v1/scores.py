@@ -2,13 +2,12 @@
 스코어 관련 API 엔드포인트
 - 최신 스코어 조회
 - 스코어 히스토리
+- 조회 응답은 스코어 버전 ETag 로 조건부 응답 (변경 없으면 본문 조회 없이 304)
 - 동일 직군 대비 포지셔닝
 - 수동 스코어링 재실행
 """
 
-import asyncio
-
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,55 +17,59 @@ from app.models.career_score import CareerScore
 from app.models.score_history import ScoreHistory
 from app.models.data_source import DataSource
 from app.api.deps import get_current_user
-from app.services.analysis import run_scoring
+from app.services.job_queue import enqueue_scoring
+from app.services import score_cache, score_distribution
+from app.services.serializers import (
+    serialize_history,
+    serialize_market_position,
+    serialize_score,
+)
+from app.services.versions import (
+    cache_headers,
+    etag_matches,
+    load_versions,
+    make_etag,
+    not_modified,
+)
 
 router = APIRouter(prefix="/scores", tags=["scores"])
 
 
 @router.get("/latest")
 async def get_latest_score(
+    response: Response,
+    if_none_match: str | None = Header(None),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """최신 커리어 스코어를 조회합니다."""
-    result = await db.execute(
-        select(CareerScore)
-        .where(CareerScore.user_id == user.id)
-        .order_by(desc(CareerScore.scored_at))
-        .limit(1)
-    )
-    score = result.scalar_one_or_none()
-
-    if not score:
+    versions = await load_versions(db, user.id)
+    etag = make_etag("scores/latest", versions.score)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
+    body = await score_cache.get_latest_score(user.id, expected_version=versions.score)
+    if not body["has_score"]:
         return {"has_score": False, "message": "아직 분석 결과가 없습니다."}
-
-    return {
-        "has_score": True,
-        "id": str(score.id),
-        "scores": {
-            "expertise": float(score.expertise_score or 0),
-            "influence": float(score.influence_score or 0),
-            "consistency": float(score.consistency_score or 0),
-            "marketability": float(score.marketability_score or 0),
-            "potential": float(score.potential_score or 0),
-            "total": float(score.total_score or 0),
-        },
-        "salary": {
-            "min": score.estimated_salary_min,
-            "max": score.estimated_salary_max,
-        },
-        "analysis_accuracy": float(score.analysis_accuracy or 0),
-        "insights": score.ai_insights or {},
-        "scored_at": score.scored_at.isoformat() if score.scored_at else None,
-    }
+    return body
 
 
 @router.get("/history")
 async def get_score_history(
+    response: Response,
+    if_none_match: str | None = Header(None),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """스코어 변화 히스토리를 조회합니다."""
+    # 히스토리는 스코어와 함께 생성/갱신되므로 스코어 버전을 그대로 사용
+    versions = await load_versions(db, user.id)
+    etag = make_etag("scores/history", versions.score)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
     result = await db.execute(
         select(ScoreHistory)
         .where(ScoreHistory.user_id == user.id)
@@ -77,24 +80,34 @@ async def get_score_history(
 
     return {
         "count": len(histories),
-        "history": [
-            {
-                "id": str(h.id),
-                "snapshot": h.snapshot,
-                "created_at": h.created_at.isoformat() if h.created_at else None,
-            }
-            for h in histories
-        ],
+        "history": [serialize_history(h) for h in histories],
     }
 
 
 @router.get("/detail/{score_id}")
 async def get_score_detail(
     score_id: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """특정 스코어의 상세 분석 결과를 조회합니다."""
+    # phase 만 먼저 조회 (ai_insights JSONB 는 읽지 않음)
+    phase = await db.scalar(
+        select(CareerScore.phase).where(
+            CareerScore.id == score_id,
+            CareerScore.user_id == user.id,
+        )
+    )
+    if phase is None:
+        raise HTTPException(status_code=404, detail="Score not found")
+
+    etag = make_etag("scores/detail", score_id, phase)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
+
     result = await db.execute(
         select(CareerScore).where(
             CareerScore.id == score_id,
@@ -106,24 +119,7 @@ async def get_score_detail(
     if not score:
         raise HTTPException(status_code=404, detail="Score not found")
 
-    return {
-        "id": str(score.id),
-        "scores": {
-            "expertise": float(score.expertise_score or 0),
-            "influence": float(score.influence_score or 0),
-            "consistency": float(score.consistency_score or 0),
-            "marketability": float(score.marketability_score or 0),
-            "potential": float(score.potential_score or 0),
-            "total": float(score.total_score or 0),
-        },
-        "salary": {
-            "min": score.estimated_salary_min,
-            "max": score.estimated_salary_max,
-        },
-        "analysis_accuracy": float(score.analysis_accuracy or 0),
-        "insights": score.ai_insights or {},
-        "scored_at": score.scored_at.isoformat() if score.scored_at else None,
-    }
+    return serialize_score(score)
 
 
 @router.get("/market-position")
@@ -132,48 +128,16 @@ async def get_market_position(
     db: AsyncSession = Depends(get_db),
 ):
     """동일 직군 대비 포지셔닝 정보를 조회합니다."""
-    # 최신 스코어 가져오기
-    result = await db.execute(
-        select(CareerScore)
-        .where(CareerScore.user_id == user.id)
-        .order_by(desc(CareerScore.scored_at))
-        .limit(1)
-    )
-    my_score = result.scalar_one_or_none()
-
-    if not my_score:
+    my_score = await score_cache.get_latest_score(user.id)
+    if not my_score["has_score"]:
         raise HTTPException(status_code=404, detail="No score data available")
 
-    # AI 인사이트에서 percentile 가져오기
-    insights = my_score.ai_insights or {}
-    percentile = insights.get("market_position_percentile", 50)
-
-    # 같은 직군 사용자들의 평균 점수 (간단한 구현)
-    same_category_result = await db.execute(
-        select(
-            func.avg(CareerScore.total_score),
-            func.count(CareerScore.id),
-        )
-        .join(User, User.id == CareerScore.user_id)
-        .where(User.job_category == user.job_category)
+    # 직군 / 연차 구간 분포에서 실제 백분위 (유저당 최신 스코어 기준)
+    distribution = await score_cache.get_distribution(user.job_category)
+    position = score_distribution.position(
+        distribution, user.years_of_experience, my_score["scores"]
     )
-    row = same_category_result.one()
-    avg_total = float(row[0]) if row[0] else 50.0
-    user_count = row[1] or 0
-
-    return {
-        "my_total_score": float(my_score.total_score or 0),
-        "job_category": user.job_category,
-        "years_of_experience": user.years_of_experience,
-        "percentile": percentile,
-        "category_avg_score": round(avg_total, 1),
-        "category_user_count": user_count,
-        "insights": {
-            "strengths": insights.get("strengths", []),
-            "weaknesses": insights.get("weaknesses", []),
-            "overall_summary": insights.get("overall_summary", ""),
-        },
-    }
+    return serialize_market_position(user, my_score, position)
 
 
 @router.post("/recalculate")
@@ -197,8 +161,9 @@ async def recalculate_scores(
             detail="No completed source data available for scoring",
         )
 
-    # 백그라운드에서 스코어링 실행
-    asyncio.create_task(run_scoring(user.id))
+    # 워커에서 스코어링 실행
+    await enqueue_scoring(db, user.id)
+    await db.commit()
 
     return {
         "status": "processing",
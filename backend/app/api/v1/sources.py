@@ -1,4 +1,4 @@
-import asyncio
+import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from sqlalchemy import select
@@ -9,8 +9,8 @@ from app.models.user import User
 from app.models.data_source import DataSource
 from app.schemas.source import SourceCreateRequest, SourceResponse, SourcePreviewResponse
 from app.api.deps import get_current_user
-from app.services.scraper import detect_platform
-from app.services.analysis import process_source
+from app.services.platforms import detect_platform
+from app.services.job_queue import enqueue
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
@@ -29,13 +29,17 @@ async def create_source(
         platform=platform,
         source_url=url_str,
         status="pending",
+        run_id=uuid.uuid4(),
     )
     db.add(source)
+    await db.flush()
+
+    # Queue scraping for the worker (same transaction as the source row)
+    await enqueue(
+        db, "process_source", {"source_id": str(source.id), "run_id": str(source.run_id)}
+    )
     await db.commit()
     await db.refresh(source)
-
-    # Trigger async scraping in background
-    asyncio.create_task(process_source(source.id))
     return source
 
 
@@ -68,13 +72,19 @@ async def rescan_source(
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
+    # New run supersedes any in-flight run of this source
     source.status = "pending"
     source.error_message = None
+    source.run_id = uuid.uuid4()
+    source.lease_owner = None
+    source.lease_until = None
+
+    # Queue re-scraping for the worker
+    await enqueue(
+        db, "process_source", {"source_id": str(source.id), "run_id": str(source.run_id)}
+    )
     await db.commit()
     await db.refresh(source)
-
-    # Trigger async re-scraping in background
-    asyncio.create_task(process_source(source.id))
     return source
 
 
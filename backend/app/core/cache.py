@@ -0,0 +1,354 @@
+"""
+캐시
+- TTLCache: 프로세스 내 LRU + TTL (최대 항목 수 초과 시 가장 오래 안 쓴 항목부터 제거)
+- SharedCache: TTLCache(L1) 앞단 + Redis(L2) 공유 계층, uvicorn 워커/프로세스 간 워밍 상태 공유
+  - 미스 시 스탬피드 방지: 프로세스 내 single-flight + Redis SET NX 잠금 (다른 프로세스는 잠시 대기 후 L2 재확인)
+  - 무효화: L1/L2 삭제 후 Redis pub/sub 으로 다른 프로세스의 L1 도 삭제
+  - L2 값에 키별 세대(generation)를 붙여 저장: 무효화는 세대를 올리므로, 무효화 전에 읽은
+    원본을 늦게 채우는 로드는 다른 세대로 기록되어 읽히지 않음 (L1 도 로드 중 무효화되면 채우지 않음)
+  - Redis 장애 시 잠시 L2 를 건너뛰고 L1 + 원본 조회로 동작 (다른 프로세스 L1 은 TTL 로 수렴)
+- 이벤트 루프 스레드에서만 사용 (잠금 없음)
+- 캐시별 적중/미스/제거 수를 /metrics 로 노출 (적중률 = hit / (hit + miss))
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import Counter, registry
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+CACHE_REQUESTS = registry.register(Counter(
+    "life_pilot_cache_requests_total",
+    "In-process cache lookups by result",
+    ("cache", "result"),
+))
+CACHE_EVICTIONS = registry.register(Counter(
+    "life_pilot_cache_evictions_total",
+    "In-process cache entries dropped for size",
+    ("cache",),
+))
+
+
+class TTLCache(Generic[V]):
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> V | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            CACHE_EVICTIONS.inc(cache=self.name)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+INVALIDATION_CHANNEL = "life_pilot:cache_invalidation"
+KEY_PREFIX = "life_pilot:cache"
+
+_redis: redis.Redis | None = None
+_redis_down_until = 0.0
+_shared_caches: dict[str, "SharedCache"] = {}
+
+
+def get_redis() -> redis.Redis | None:
+    """공유 Redis 클라이언트. 최근 장애 후 재시도 대기 중이면 None."""
+    global _redis
+    if not settings.REDIS_URL or time.monotonic() < _redis_down_until:
+        return None
+    if _redis is None:
+        _redis = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def _redis_failed(e: Exception) -> None:
+    global _redis_down_until
+    if time.monotonic() >= _redis_down_until:
+        logger.warning(
+            f"Redis unavailable ({type(e).__name__}: {e}); "
+            f"using in-process cache only for {settings.REDIS_RETRY_SECONDS:.0f}s"
+        )
+    _redis_down_until = time.monotonic() + settings.REDIS_RETRY_SECONDS
+
+
+class SharedCache(Generic[V]):
+    def __init__(
+        self,
+        name: str,
+        l1: TTLCache[V],
+        l2_ttl_seconds: float,
+        encode: Callable[[V], str] = json.dumps,
+        decode: Callable[[str], V] = json.loads,
+        lock_seconds: float = 5.0,
+        lock_wait_seconds: float = 1.0,
+        client: Callable[[], redis.Redis | None] = get_redis,
+    ):
+        self.name = name
+        self.l1 = l1
+        self.l2_ttl_seconds = l2_ttl_seconds
+        self._encode = encode
+        self._decode = decode
+        self.lock_seconds = lock_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+        self._client = client
+        self._inflight: dict[str, asyncio.Future] = {}
+        # 로드 중에 무효화된 키 (로드 결과를 L1 에 남기지 않음)
+        self._invalidated: set[str] = set()
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.loads = 0
+        _shared_caches[name] = self
+
+    def _key(self, key: Hashable) -> str:
+        return f"{KEY_PREFIX}:{self.name}:{key}"
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self._key(key)}:gen"
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        """L1 → L2 → loader 순으로 값을 찾습니다. 같은 키의 동시 미스는 한 번만 로드합니다."""
+        key = str(key)
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(key, loader)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+            self._invalidated.discard(key)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[V]]) -> V:
+        client = self._client()
+        if client is None:
+            return await self._from_source(key, loader, None)
+
+        redis_key = self._key(key)
+        try:
+            # 원본을 읽기 전의 세대로 기록해야 그 사이 무효화가 늦은 채우기를 무력화함
+            cached, generation = await self._read_l2(client, key)
+            if cached is not None:
+                return cached
+            locked = await client.set(
+                f"{redis_key}:lock", "1", nx=True, px=int(self.lock_seconds * 1000)
+            )
+            if not locked:
+                # 다른 프로세스가 로드 중: 결과가 L2 에 올라오길 잠시 기다림
+                deadline = time.monotonic() + self.lock_wait_seconds
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(0.05)
+                    cached, _ = await self._read_l2(client, key, count_miss=False)
+                    if cached is not None:
+                        return cached
+        except (RedisError, OSError) as e:
+            _redis_failed(e)
+            return await self._from_source(key, loader, None)
+
+        try:
+            return await self._from_source(key, loader, client, generation)
+        finally:
+            if locked:
+                try:
+                    await client.delete(f"{redis_key}:lock")
+                except (RedisError, OSError) as e:
+                    _redis_failed(e)
+
+    async def _read_l2(
+        self, client: redis.Redis, key: str, count_miss: bool = True
+    ) -> tuple[V | None, str]:
+        """L2 값과 현재 세대를 한 번에 읽습니다. 다른 세대로 기록된 값은 미스로 봅니다."""
+        raw, generation = await client.mget(self._key(key), self._generation_key(key))
+        generation = generation or "0"
+        stamp, _, body = (raw or "").partition(":")
+        if raw is None or stamp != generation:
+            if count_miss:
+                self.l2_misses += 1
+                CACHE_REQUESTS.inc(cache=f"{self.name}.redis", result="miss")
+            return None, generation
+        self.l2_hits += 1
+        CACHE_REQUESTS.inc(cache=f"{self.name}.redis", result="hit")
+        value = self._decode(body)
+        self._fill_l1(key, value)
+        return value, generation
+
+    async def _from_source(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[V]],
+        client: redis.Redis | None,
+        generation: str = "0",
+    ) -> V:
+        self.loads += 1
+        value = await loader()
+        self._fill_l1(key, value)
+        if client is not None:
+            try:
+                await client.set(
+                    self._key(key),
+                    f"{generation}:{self._encode(value)}",
+                    px=int(self.l2_ttl_seconds * 1000),
+                )
+            except (RedisError, OSError) as e:
+                _redis_failed(e)
+        return value
+
+    def _fill_l1(self, key: str, value: V) -> None:
+        if key not in self._invalidated:
+            self.l1.set(key, value)
+
+    def drop_local(self, key: Hashable) -> None:
+        key = str(key)
+        self.l1.invalidate(key)
+        if key in self._inflight:
+            self._invalidated.add(key)
+
+    async def invalidate(self, key: Hashable) -> None:
+        """모든 프로세스에서 키를 무효화합니다 (세대 증가 + L1/L2 삭제 + pub/sub 통지)."""
+        key = str(key)
+        self.drop_local(key)
+        client = self._client()
+        if client is None:
+            return
+        generation_key = self._generation_key(key)
+        try:
+            await client.incr(generation_key)
+            # 세대 키는 L2 값보다 오래 유지 (그 전에 기록된 값은 모두 만료된 뒤 사라짐)
+            await client.pexpire(generation_key, int(self.l2_ttl_seconds * 2000))
+            await client.delete(self._key(key))
+            await client.publish(
+                INVALIDATION_CHANNEL, json.dumps({"cache": self.name, "key": key})
+            )
+        except (RedisError, OSError) as e:
+            _redis_failed(e)
+
+    def clear(self) -> None:
+        self.l1.clear()
+
+    def stats(self) -> dict:
+        l2_lookups = self.l2_hits + self.l2_misses
+        return {
+            **self.l1.stats(),
+            "l2_hits": self.l2_hits,
+            "l2_misses": self.l2_misses,
+            "l2_hit_rate": round(self.l2_hits / l2_lookups, 4) if l2_lookups else 0.0,
+            "loads": self.loads,
+            "redis_available": time.monotonic() >= _redis_down_until,
+        }
+
+
+def handle_invalidation(message: str) -> None:
+    """다른 프로세스가 보낸 무효화 메시지로 이 프로세스의 L1 을 지웁니다."""
+    try:
+        data = json.loads(message)
+        cache = _shared_caches[data["cache"]]
+    except (ValueError, KeyError, TypeError):
+        logger.warning(f"Ignoring malformed cache invalidation: {message[:200]}")
+        return
+    cache.drop_local(data["key"])
+
+
+async def listen_for_invalidations() -> None:
+    """무효화 채널을 구독합니다 (API 프로세스 lifespan 에서 태스크로 실행, 끊기면 재연결)."""
+    if not settings.REDIS_URL:
+        return
+    while True:
+        # 구독 연결은 무기한 대기하므로 읽기 타임아웃이 없는 전용 클라이언트 사용
+        client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # 구독 전 놓친 무효화가 있을 수 있으므로 L1 을 비우고 시작
+                for cache in _shared_caches.values():
+                    cache.clear()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=None
+                    )
+                    if message is not None:
+                        handle_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except (RedisError, OSError) as e:
+            logger.warning(f"Cache invalidation subscription lost: {e}")
+            await asyncio.sleep(settings.REDIS_RETRY_SECONDS)
+        finally:
+            await client.aclose()
@@ -0,0 +1,33 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Hashable
+
+
+class KeyedLimiter:
+    """
+    키(유저 등)별 동시 실행 수 제한.
+    사용 중인 키의 세마포어만 유지하고, 마지막 사용자가 빠지면 정리합니다.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._slots: dict[Hashable, tuple[asyncio.Semaphore, int]] = {}
+
+    @asynccontextmanager
+    async def slot(self, key: Hashable):
+        sem, refs = self._slots.get(key, (None, 0))
+        if sem is None:
+            sem = asyncio.Semaphore(self.limit)
+        self._slots[key] = (sem, refs + 1)
+        try:
+            async with sem:
+                yield
+        finally:
+            sem, refs = self._slots[key]
+            if refs <= 1:
+                del self._slots[key]
+            else:
+                self._slots[key] = (sem, refs - 1)
+
+    def active_keys(self) -> int:
+        return len(self._slots)
@@ -4,24 +4,42 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
-
-# Neon DB requires SSL
-connect_args = {}
-if "neon.tech" in settings.DATABASE_URL or "sslmode" in settings.DATABASE_URL:
-    ssl_context = ssl.create_default_context()
-    connect_args["ssl"] = ssl_context
-
-# Convert standard postgresql:// to asyncpg format
-db_url = settings.DATABASE_URL
-if db_url.startswith("postgresql://"):
-    db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-# Strip query params that asyncpg doesn't understand
-if "?" in db_url:
-    db_url = db_url.split("?")[0]
-
-engine = create_async_engine(db_url, echo=settings.DEBUG, connect_args=connect_args)
-
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+from app.core.metrics import TimedAsyncSession
+from app.core.pool_metrics import TimedQueuePool, instrument_pool
+from app.core.tracing import trace_sql
+
+
+def asyncpg_url(url: str) -> str:
+    """DATABASE_URL 을 SQLAlchemy asyncpg URL 로 정규화합니다 (엔진 / LISTEN 연결 공용)."""
+    # Convert standard postgresql:// to asyncpg format
+    if url.startswith("postgresql://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    # Strip query params that asyncpg doesn't understand (e.g. channel_binding)
+    return url.split("?")[0]
+
+
+def asyncpg_connect_args(url: str) -> dict:
+    """asyncpg 연결 인자 (Neon / sslmode URL 은 SSL 필요)"""
+    if "neon.tech" in url or "sslmode" in url:
+        return {"ssl": ssl.create_default_context()}
+    return {}
+
+
+connect_args = asyncpg_connect_args(settings.DATABASE_URL)
+db_url = asyncpg_url(settings.DATABASE_URL)
+
+engine = create_async_engine(
+    db_url,
+    echo=settings.DEBUG,
+    connect_args=connect_args,
+    poolclass=TimedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+instrument_pool(engine)
+trace_sql(engine)
+
+async_session = async_sessionmaker(engine, class_=TimedAsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
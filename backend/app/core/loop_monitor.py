@@ -0,0 +1,138 @@
+"""
+이벤트 루프 지연 모니터 / 블로킹 호출 감지
+- 루프 안에서 주기적으로 깨어나 예정 시각 대비 지연(lag)을 히스토그램으로 기록
+- 별도 감시 스레드가 루프가 임계값 이상 멈춘 순간 루프 스레드의 스택을 캡처
+- 스택에서 원인 함수(app 코드 우선)를 골라 함수별 카운터 + 최근 보고(스택 포함) 보관
+- 동기 CPU 작업(BeautifulSoup, bcrypt, 대용량 json 등)이 모든 동시 요청을 멈추는지 확인용
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram, registry
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = APP_DIR.parent
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LOOP_LAG = registry.register(Histogram(
+    "life_pilot_event_loop_lag_seconds",
+    "Delay of the loop monitor wake-up versus its schedule",
+    buckets=LAG_BUCKETS,
+))
+LOOP_BLOCKED = registry.register(Counter(
+    "life_pilot_event_loop_blocked_total",
+    "Event loop stalls above the threshold by blocking function",
+    ("function",),
+))
+
+
+def blocking_function(stack: traceback.StackSummary) -> str:
+    """블로킹 중인 스택에서 원인 함수를 고릅니다 (가장 안쪽의 app 코드, 없으면 가장 안쪽 프레임)."""
+    for frame in reversed(stack):
+        path = Path(frame.filename)
+        if path.is_relative_to(APP_DIR) and path.name != Path(__file__).name:
+            return f"{path.relative_to(BACKEND_DIR).as_posix()}:{frame.name}"
+    if not stack:
+        return "unknown"
+    innermost = stack[-1]
+    return f"{Path(innermost.filename).name}:{innermost.name}"
+
+
+class LoopMonitor:
+    def __init__(self, interval: float, threshold: float, max_reports: int = 50):
+        self.interval = interval
+        self.threshold = threshold
+        self._reports: deque[dict] = deque(maxlen=max_reports)
+        self._last_tick = 0.0
+        self._max_lag = 0.0
+        self._thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """실행 중인 루프 안에서 호출합니다."""
+        if self._task is not None:
+            return
+        self._thread_id = threading.get_ident()
+        self._last_tick = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._sample())
+        threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            self._last_tick = now
+            self._max_lag = max(self._max_lag, lag)
+            LOOP_LAG.observe(lag)
+
+    def _watch(self) -> None:
+        reported_tick = None
+        while not self._stop.wait(self.interval / 2):
+            tick = self._last_tick
+            stalled = time.perf_counter() - tick - self.interval
+            # 멈춘 구간마다 한 번만 보고
+            if stalled >= self.threshold and tick != reported_tick:
+                reported_tick = tick
+                self._report(stalled)
+
+    def _report(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+        culprit = blocking_function(stack)
+        LOOP_BLOCKED.inc(function=culprit)
+        formatted = "".join(traceback.format_list(stack[-20:]))
+        self._reports.append({
+            "at": datetime.now(timezone.utc).isoformat(),
+            "blocked_ms": round(stalled * 1000, 1),
+            "function": culprit,
+            "stack": formatted,
+        })
+        logger.warning(
+            f"Event loop blocked for {stalled * 1000:.0f}ms+ in {culprit}\n{formatted}"
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "interval_seconds": self.interval,
+            "threshold_seconds": self.threshold,
+            "lag_samples": LOOP_LAG.count(),
+            "max_lag_ms": round(self._max_lag * 1000, 1),
+            "blocked_by_function": {
+                key[0]: int(count) for key, count in LOOP_BLOCKED.snapshot().items()
+            },
+            "recent_blocks": list(self._reports),
+        }
+
+
+loop_monitor = LoopMonitor(
+    settings.LOOP_MONITOR_INTERVAL_SECONDS,
+    settings.LOOP_BLOCK_THRESHOLD_SECONDS,
+)
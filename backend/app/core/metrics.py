@@ -0,0 +1,247 @@
+"""
+파이프라인 단계별 메트릭 (Prometheus 텍스트 노출 형식)
+- 단계별 지연시간 히스토그램 + 처리량 카운터 (scrape, extract, parse, rule_scoring, calibration, salary, actions, db_commit)
+- 진행 중 작업 게이지 (단계 / 브라우저 슬롯 / 큐별 작업)
+- 프로세스 단위 누적 → API 는 /metrics, 워커는 WORKER_METRICS_PORT 로 노출
+- 다른 모듈의 렌더러(DB 풀, LLM 원장)는 collector 로 등록해 함께 노출
+- stage_timer 는 같은 단계의 트레이스 span 도 함께 기록
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tracing import span
+
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+_INF = 'le="+Inf"'
+
+
+def _labels(labelnames: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in zip(labelnames, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        return tuple(str(labels.get(k) or "") for k in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def snapshot(self) -> dict[tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, key)} {value:g}" for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def replace(self, values: dict[tuple[str, ...], float]) -> None:
+        """전체 라벨 조합 값을 한 번에 교체 (주기적으로 다시 집계하는 게이지용)"""
+        with self._lock:
+            self._values = dict(values)
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, key)} {value:g}" for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = STAGE_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = buckets
+        # 라벨 조합 → (버킷별 개수, 합계, 개수)
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, seconds: float, **labels) -> None:
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            if idx < len(self.buckets):
+                series[0][idx] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series[2] if series else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, ([*v[0]], v[1], v[2])) for k, v in self._series.items())
+        lines = self._header()
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                labels = _labels(self.labelnames, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, _INF)} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {total:.6f}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], str]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, render: Callable[[], str]) -> None:
+        """다른 모듈의 Prometheus 텍스트 렌더러를 함께 노출합니다."""
+        self._collectors.append(render)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines += metric.render()
+        text = "\n".join(lines) + "\n"
+        return text + "".join(render() for render in self._collectors)
+
+
+registry = Registry()
+
+STAGE_SECONDS = registry.register(Histogram(
+    "life_pilot_pipeline_stage_seconds",
+    "Pipeline stage wall time",
+    ("stage", "platform", "strategy"),
+))
+STAGE_TOTAL = registry.register(Counter(
+    "life_pilot_pipeline_stage_total",
+    "Pipeline stage executions by outcome",
+    ("stage", "platform", "strategy", "outcome"),
+))
+IN_FLIGHT = registry.register(Gauge(
+    "life_pilot_pipeline_in_flight",
+    "Pipeline stages currently running (browser = Playwright slots in use)",
+    ("stage",),
+))
+JOB_SECONDS = registry.register(Histogram(
+    "life_pilot_job_seconds",
+    "Worker job wall time",
+    ("queue", "kind"),
+))
+JOBS_TOTAL = registry.register(Counter(
+    "life_pilot_jobs_total",
+    "Worker jobs by outcome",
+    ("queue", "kind", "outcome"),
+))
+JOBS_IN_FLIGHT = registry.register(Gauge(
+    "life_pilot_jobs_in_flight",
+    "Worker jobs currently running in this process",
+    ("queue",),
+))
+QUEUE_DEPTH = registry.register(Gauge(
+    "life_pilot_job_queue_depth",
+    "Jobs in the jobs table by queue and status (refreshed by the worker)",
+    ("queue", "status"),
+))
+
+
+@contextmanager
+def stage_timer(stage: str, platform: str | None = None, strategy: str | None = None):
+    """블록의 실행 시간/결과를 단계 메트릭으로 기록하고, 같은 이름의 span 을 남깁니다."""
+    labels = {"stage": stage, "platform": platform, "strategy": strategy}
+    started = time.perf_counter()
+    outcome = "error"
+    IN_FLIGHT.inc(stage=stage)
+    try:
+        with span(stage, platform=platform, strategy=strategy):
+            yield
+        outcome = "ok"
+    finally:
+        IN_FLIGHT.dec(stage=stage)
+        STAGE_SECONDS.observe(time.perf_counter() - started, **labels)
+        STAGE_TOTAL.inc(outcome=outcome, **labels)
+
+
+class TimedAsyncSession(AsyncSession):
+    """커밋 시간을 db_commit 단계로 기록하는 AsyncSession"""
+
+    async def commit(self) -> None:
+        with stage_timer("db_commit"):
+            await super().commit()
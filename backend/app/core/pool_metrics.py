@@ -0,0 +1,125 @@
+"""
+DB 커넥션 풀 계측
+- 체크아웃 대기 시간: 풀이 고갈되어 커넥션을 기다린 시간
+- 보유 시간: 체크아웃 ~ 반납까지 커넥션을 잡고 있던 시간
+- 네트워크 I/O(스크래핑/LLM) 동안 커넥션을 잡고 있지 않은지 확인용
+"""
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import registry
+from app.core.tracing import span
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+@dataclass
+class DurationStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(WAIT_BUCKETS))
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        idx = bisect.bisect_left(WAIT_BUCKETS, seconds)
+        if idx < len(self.buckets):
+            self.buckets[idx] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait = DurationStats()
+        self.hold = DurationStats()
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait.observe(seconds)
+
+    def observe_hold(self, seconds: float) -> None:
+        with self._lock:
+            self.hold.observe(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"checkout_wait": self.wait.as_dict(), "connection_hold": self.hold.as_dict()}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (히스토그램)"""
+        lines = []
+        with self._lock:
+            for name, stats, help_text in (
+                ("life_pilot_db_pool_checkout_wait_seconds", self.wait, "Time spent waiting for a pooled DB connection"),
+                ("life_pilot_db_connection_hold_seconds", self.hold, "Time a DB connection stayed checked out"),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                cumulative = 0
+                for bound, n in zip(WAIT_BUCKETS, stats.buckets):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{le="+Inf"}} {stats.count}')
+                lines.append(f"{name}_sum {stats.total:.6f}")
+                lines.append(f"{name}_count {stats.count}")
+        return "\n".join(lines) + "\n"
+
+
+pool_stats = PoolStats()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            with span("db.pool_checkout"):
+                return super()._do_get()
+        finally:
+            pool_stats.observe_wait(time.perf_counter() - started)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info["checked_out_at"] = time.perf_counter()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    started = connection_record.info.pop("checked_out_at", None)
+    if started is not None:
+        pool_stats.observe_hold(time.perf_counter() - started)
+
+
+def render_pool_gauges(pool) -> str:
+    """풀 크기/체크아웃 수/오버플로 게이지 (Prometheus 텍스트 노출 형식)"""
+    lines = []
+    for name, value, help_text in (
+        ("life_pilot_db_pool_size", pool.size(), "Configured DB pool size"),
+        ("life_pilot_db_pool_checked_out", pool.checkedout(), "DB connections currently checked out"),
+        ("life_pilot_db_pool_overflow", pool.overflow(), "DB connections opened beyond pool size"),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def instrument_pool(engine) -> None:
+    """엔진 풀에 커넥션 보유 시간 계측 리스너를 등록하고 /metrics 에 노출합니다."""
+    event.listen(engine.sync_engine, "checkout", _on_checkout)
+    event.listen(engine.sync_engine, "checkin", _on_checkin)
+    registry.add_collector(pool_stats.render_prometheus)
+    registry.add_collector(lambda: render_pool_gauges(engine.pool))
@@ -1,19 +1,83 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
 
+# rounds 가 바뀌면 기존 해시는 로그인 시 verify_and_update 로 재해시됨
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
 
+class PasswordHasherBusy(Exception):
+    """비밀번호 해시 대기열이 가득 찼을 때 발생 (API 는 503 으로 응답)"""
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+
+class PasswordHasher:
+    """
+    bcrypt 를 이벤트 루프 밖의 전용 스레드 풀에서 실행합니다.
+    bcrypt 는 GIL 을 놓으므로 처리량이 코어 수에 비례하고,
+    실행 중 + 대기 작업이 한도를 넘으면 즉시 거절(backpressure)합니다.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.capacity = workers + queue_limit
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+    def _on_done(self, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        # 워커 스레드에서 호출되므로 감소는 루프 스레드로 넘김
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # 루프가 이미 닫힘 (종료 중)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        # _pending 은 루프 스레드에서만 변경되므로 잠금 불필요
+        if self._pending >= self.capacity:
+            raise PasswordHasherBusy()
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._pending -= 1
+            raise
+        # 호출자가 취소돼도 스레드의 bcrypt 는 계속 돌므로, 작업이 실제로 끝날 때 슬롯 반환
+        future.add_done_callback(partial(self._on_done, loop))
+        return await asyncio.wrap_future(future)
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_LIMIT)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hasher.run(pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    비밀번호를 검증합니다. 해시 설정(rounds 등)이 바뀌어 재해시가 필요하면
+    새 해시를 함께 반환하므로 호출자가 저장합니다.
+    """
+    return await password_hasher.run(pwd_context.verify_and_update, plain_password, hashed_password)
 
 
 def create_access_token(subject: str) -> str:
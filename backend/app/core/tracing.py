@@ -0,0 +1,206 @@
+"""
+분산 트레이싱 (경량 자체 구현)
+- API 요청 → 작업 큐 → 워커 단계 → LLM/SQL 호출까지 하나의 trace 로 연결
+- 프로세스 간 전파는 W3C traceparent 형식 (HTTP 헤더 / 작업 payload)
+- span 은 contextvar 로 부모-자식 관계를 이어가므로 asyncio 태스크에도 전파
+- exporter 교체 가능 (console: 로그, file: JSON Lines), 미설정 시 span 을 만들지 않음
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import NamedTuple, Protocol
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SpanContext(NamedTuple):
+    trace_id: str
+    span_id: str
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    attributes: dict = field(default_factory=dict)
+    duration_ms: float = 0.0
+    status: str = "ok"
+    error: str | None = None
+    _started: float = field(default=0.0, repr=False)
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("_started")
+        return data
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class ConsoleExporter:
+    """span 을 로그 한 줄(JSON)로 출력"""
+
+    def export(self, span: Span) -> None:
+        logger.info(f"span {json.dumps(span.to_dict(), default=str, ensure_ascii=False)}")
+
+
+class FileExporter:
+    """span 을 JSON Lines 파일에 추가 (오프라인 분석용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+
+def _exporter_from_settings() -> SpanExporter | None:
+    kind = settings.TRACING_EXPORTER.lower()
+    if kind == "console":
+        return ConsoleExporter()
+    if kind == "file":
+        return FileExporter(settings.TRACING_FILE_PATH)
+    return None
+
+
+_exporter: SpanExporter | None = _exporter_from_settings()
+_context: ContextVar[SpanContext | None] = ContextVar("trace_context", default=None)
+
+
+def set_exporter(exporter: SpanExporter | None) -> None:
+    """exporter 를 교체합니다. None 이면 트레이싱 비활성화."""
+    global _exporter
+    _exporter = exporter
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+def start_span(name: str, **attributes) -> Span | None:
+    """현재 컨텍스트의 자식 span 을 시작합니다 (컨텍스트는 바꾸지 않음)."""
+    if _exporter is None:
+        return None
+    parent = _context.get()
+    return Span(
+        name=name,
+        trace_id=parent.trace_id if parent else _new_id(16),
+        span_id=_new_id(8),
+        parent_id=parent.span_id if parent else None,
+        start_time=time.time(),
+        attributes=attributes,
+        _started=time.perf_counter(),
+    )
+
+
+def end_span(span: Span | None, error: BaseException | None = None) -> None:
+    if span is None:
+        return
+    span.duration_ms = round((time.perf_counter() - span._started) * 1000, 3)
+    if error is not None:
+        span.status = "error"
+        span.error = f"{type(error).__name__}: {error}"[:500]
+    exporter = _exporter
+    if exporter is None:
+        return
+    try:
+        exporter.export(span)
+    except Exception as e:
+        logger.warning(f"Span export failed: {e}")
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """블록을 현재 span 의 자식 span 으로 기록합니다. 비활성화 시 None 을 돌려줍니다."""
+    current = start_span(name, **attributes)
+    if current is None:
+        yield None
+        return
+    token = _context.set(SpanContext(current.trace_id, current.span_id))
+    error: BaseException | None = None
+    try:
+        yield current
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _context.reset(token)
+        end_span(current, error)
+
+
+def current_traceparent() -> str | None:
+    ctx = _context.get()
+    if ctx is None:
+        return None
+    return f"00-{ctx.trace_id}-{ctx.span_id}-01"
+
+
+def parse_traceparent(value: str | None) -> SpanContext | None:
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return SpanContext(parts[1], parts[2])
+
+
+@contextmanager
+def continue_trace(traceparent: str | None, name: str, **attributes):
+    """다른 프로세스에서 시작된 trace 를 이어 root span 을 엽니다."""
+    remote = parse_traceparent(traceparent)
+    token = _context.set(remote) if remote else None
+    try:
+        with span(name, **attributes) as current:
+            yield current
+    finally:
+        if token is not None:
+            _context.reset(token)
+
+
+# SQL 문 단위 span
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    sql_span = start_span("db.query", statement=statement[:300])
+    conn.info.setdefault("trace_spans", []).append(sql_span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get("trace_spans")
+    if spans:
+        end_span(spans.pop())
+
+
+def _on_error(exception_context):
+    conn = exception_context.connection
+    spans = conn.info.get("trace_spans") if conn is not None else None
+    if spans:
+        end_span(spans.pop(), exception_context.original_exception)
+
+
+def trace_sql(engine) -> None:
+    """엔진의 SQL 실행마다 span 을 기록하는 리스너를 등록합니다."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _on_error)
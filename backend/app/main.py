@@ -1,20 +1,32 @@
+import asyncio
+import hmac
 import logging
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.cache import close_redis, listen_for_invalidations
 from app.core.config import settings
 from app.core.database import async_session
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import registry
+from app.core.security import PasswordHasherBusy
+from app.core.tracing import continue_trace
 from app.api.v1.router import api_router
 from app.services.market_seed import seed_market_data
+from app.services.progress import progress_broker
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+
     # Startup: seed market data
     try:
         async with async_session() as db:
@@ -23,7 +35,19 @@ async def lifespan(app: FastAPI):
                 logger.info(f"Seeded {count} market data entries")
     except Exception as e:
         logger.warning(f"Market data seed skipped: {e}")
+
+    # 다른 프로세스의 캐시 무효화를 L1 에 반영
+    invalidations = asyncio.create_task(listen_for_invalidations())
     yield
+    # Shutdown: close the progress LISTEN connection and the cache subscription
+    await progress_broker.close()
+    invalidations.cancel()
+    try:
+        await invalidations
+    except asyncio.CancelledError:
+        pass
+    await close_redis()
+    await loop_monitor.stop()
 
 
 app = FastAPI(
@@ -44,6 +68,40 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many authentication requests, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """요청마다 root span 을 열어 핸들러가 등록한 작업까지 같은 trace 로 잇습니다."""
+    with continue_trace(
+        request.headers.get("traceparent"),
+        f"{request.method} {request.url.path}",
+    ) as current:
+        response = await call_next(request)
+        if current is not None:
+            current.set(status_code=response.status_code)
+        return response
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "service": settings.APP_NAME}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: str | None = Header(None)):
+    """이 프로세스의 단계/풀/LLM 메트릭 (Prometheus 텍스트 형식, METRICS_TOKEN 설정 시에만 노출)"""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # 바이트로 비교 (str 비교는 ASCII 가 아닌 헤더에서 TypeError)
+    expected = f"Bearer {settings.METRICS_TOKEN}".encode()
+    if not hmac.compare_digest((authorization or "").encode(), expected):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -4,6 +4,10 @@ from app.models.career_score import CareerScore
 from app.models.action_recommendation import ActionRecommendation
 from app.models.score_history import ScoreHistory
 from app.models.market_data import MarketData
+from app.models.llm_usage import LLMUsage
+from app.models.job import Job
+from app.models.pipeline_checkpoint import PipelineCheckpoint
+from app.models.score_distribution import ScoreDistributionBucket, ScoreDistributionMember
 
 __all__ = [
     "User",
@@ -12,4 +16,9 @@ __all__ = [
     "ActionRecommendation",
     "ScoreHistory",
     "MarketData",
+    "LLMUsage",
+    "Job",
+    "PipelineCheckpoint",
+    "ScoreDistributionBucket",
+    "ScoreDistributionMember",
 ]
@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Boolean, Text, Numeric, DateTime, ForeignKey, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Boolean, Text, Numeric, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -40,3 +40,17 @@ class ActionRecommendation(Base):
 
     user = relationship("User", back_populates="action_recommendations")
     career_score = relationship("CareerScore", back_populates="action_recommendations")
+
+    __table_args__ = (
+        # 목록 키셋 페이지네이션: 최신순 / 효과순 정렬 키 (app.services.action_list 와 같은 식)
+        Index("ix_action_recommendations_user_id_created_at", "user_id", "created_at", "id"),
+        Index(
+            "ix_action_recommendations_user_id_impact",
+            "user_id",
+            text("coalesce(impact_percent, -1)"),
+            "created_at",
+            "id",
+        ),
+        # 태그 포함 검색 (tags @> ARRAY[...])
+        Index("ix_action_recommendations_tags", "tags", postgresql_using="gin"),
+    )
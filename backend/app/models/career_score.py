@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Numeric, BigInteger, DateTime, ForeignKey
+from sqlalchemy import String, Numeric, BigInteger, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,6 +27,8 @@ class CareerScore(Base):
     estimated_salary_max: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     analysis_accuracy: Mapped[float | None] = mapped_column(Numeric(5, 2), nullable=True)
     ai_insights: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    phase: Mapped[str] = mapped_column(String(20), default="final")  # provisional, final, fallback
     scored_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -34,6 +36,10 @@ class CareerScore(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
-    user = relationship("User", back_populates="career_scores")
+    user = relationship("User", back_populates="career_scores", foreign_keys=[user_id])
     action_recommendations = relationship("ActionRecommendation", back_populates="career_score")
     score_histories = relationship("ScoreHistory", back_populates="career_score")
+
+    __table_args__ = (
+        Index("ix_career_scores_user_id_scored_at", "user_id", "scored_at"),
+    )
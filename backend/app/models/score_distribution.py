@@ -0,0 +1,36 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import String, Integer, SmallInteger, Numeric, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+# 직군 × 연차 구간 × 영역별 1점 단위 히스토그램 (유저당 최신 스코어 1건만 반영)
+class ScoreDistributionBucket(Base):
+    __tablename__ = "score_distribution_buckets"
+
+    job_category: Mapped[str] = mapped_column(String(50), primary_key=True)
+    years_band: Mapped[str] = mapped_column(String(10), primary_key=True)  # 0-2, ..., 15+, all
+    area: Mapped[str] = mapped_column(String(20), primary_key=True)  # total, expertise, ...
+    bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True)  # 0 ~ 100
+    count: Mapped[int] = mapped_column(Integer, default=0)
+    score_sum: Mapped[float] = mapped_column(Numeric(14, 2), default=0)
+
+
+# 각 유저가 현재 분포에 기여 중인 값 (최신 스코어가 바뀌면 이전 기여분을 빼기 위함)
+class ScoreDistributionMember(Base):
+    __tablename__ = "score_distribution_members"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    score_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    job_category: Mapped[str] = mapped_column(String(50), nullable=False)
+    years_band: Mapped[str] = mapped_column(String(10), nullable=False)
+    scores: Mapped[dict] = mapped_column(JSONB, nullable=False)  # area → 점수
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,3 +27,7 @@ class ScoreHistory(Base):
 
     user = relationship("User", back_populates="score_histories")
     career_score = relationship("CareerScore", back_populates="score_histories")
+
+    __table_args__ = (
+        Index("ix_score_history_user_id_created_at", "user_id", "created_at"),
+    )
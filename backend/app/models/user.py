@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Integer, DateTime
+from sqlalchemy import String, Integer, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,6 +21,18 @@ class User(Base):
     job_category: Mapped[str | None] = mapped_column(String(50), nullable=True)
     years_of_experience: Mapped[int | None] = mapped_column(Integer, nullable=True)
     auth_provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    # 액션 목록이 바뀔 때마다 증가 (조회 응답 ETag 용)
+    actions_version: Mapped[int] = mapped_column(Integer, default=0)
+    # 최신 스코어 포인터 (최신 스코어 조회를 PK 조회로), run_scoring 이 갱신
+    latest_score_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("career_scores.id", ondelete="SET NULL", use_alter=True),
+        nullable=True,
+    )
+    # 스코어링 single-flight 점유 만료 시각 (None 이면 실행 중인 스코어링 없음)
+    scoring_lease_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -31,6 +43,11 @@ class User(Base):
     )
 
     data_sources = relationship("DataSource", back_populates="user", cascade="all, delete-orphan")
-    career_scores = relationship("CareerScore", back_populates="user", cascade="all, delete-orphan")
+    career_scores = relationship(
+        "CareerScore",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        foreign_keys="CareerScore.user_id",
+    )
     action_recommendations = relationship("ActionRecommendation", back_populates="user", cascade="all, delete-orphan")
     score_histories = relationship("ScoreHistory", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,104 @@
+"""
+AI 보정 / 액션 추천 구조화 출력 모델
+- 범위 클램핑과 허용값 보정을 검증 단계에서 한 번에 처리
+"""
+
+from typing import Annotated, Any, ClassVar, Literal
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+from app.schemas.structured import StrList, StructuredOutput, lenient_list
+
+AREAS = ("expertise", "influence", "consistency", "marketability", "potential")
+
+
+def _clamped(low: int, high: int, default: int):
+    def coerce(val: Any) -> int:
+        try:
+            return max(low, min(high, int(val)))
+        except (TypeError, ValueError):
+            return default
+    return BeforeValidator(coerce)
+
+
+def _one_of(allowed: tuple[str, ...], default: str):
+    return BeforeValidator(lambda v: v if v in allowed else default)
+
+
+def _text(val: Any) -> str:
+    return val if isinstance(val, str) else ""
+
+
+Adjustment = Annotated[int, _clamped(-10, 10, 0)]
+Text = Annotated[str, BeforeValidator(_text)]
+
+
+class ScoreAdjustments(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    expertise: Adjustment = 0
+    influence: Adjustment = 0
+    consistency: Adjustment = 0
+    marketability: Adjustment = 0
+    potential: Adjustment = 0
+
+
+class CalibrationInsights(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    overall_summary: Text = Field("", description="2-3문장 종합 분석")
+    strengths: StrList = Field([], description="강점 3개")
+    weaknesses: StrList = Field([], description="약점 2개")
+    expertise_detail: Text = Field("", description="전문성 영역 상세 분석 (2문장)")
+    influence_detail: Text = Field("", description="영향력 영역 상세 분석 (2문장)")
+    consistency_detail: Text = Field("", description="지속성 영역 상세 분석 (2문장)")
+    marketability_detail: Text = Field("", description="시장성 영역 상세 분석 (2문장)")
+    potential_detail: Text = Field("", description="성장성 영역 상세 분석 (2문장)")
+
+
+class CalibrationResult(StructuredOutput):
+    tool_description: ClassVar[str] = "Record score adjustments and insights."
+
+    adjustments: ScoreAdjustments = Field(
+        description="Calibration for each rule-based score, -10 to 10"
+    )
+    insights: CalibrationInsights
+    salary_adjustment_percent: Annotated[int, _clamped(-15, 15, 0)] = Field(
+        0, description="Salary range adjustment, -15 to 15"
+    )
+    market_position_percentile: Annotated[int, _clamped(1, 99, 50)] = Field(
+        50, description="Estimated percentile within the job category, 1 to 99"
+    )
+
+
+class ActionSuggestion(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    title: Annotated[
+        str, BeforeValidator(lambda v: v if isinstance(v, str) and v else "추천 액션")
+    ] = Field("추천 액션", description="구체적인 액션 제목 (20자 이내)")
+    description: str | None = Field(None, description="액션의 상세 설명과 이유 (2-3문장)")
+    impact_percent: Annotated[int, _clamped(1, 15, 5)] = Field(
+        5, description="예상 가치 상승 효과, 1-15"
+    )
+    target_area: Annotated[
+        Literal["expertise", "influence", "consistency", "marketability", "potential"],
+        _one_of(AREAS, "expertise"),
+    ] = "expertise"
+    difficulty: Annotated[
+        Literal["easy", "medium", "hard"],
+        _one_of(("easy", "medium", "hard"), "medium"),
+    ] = "medium"
+    estimated_duration: str | None = Field(None, description="예상 소요 기간 (예: 2주, 1개월)")
+    tags: StrList = []
+    cta_label: str | None = Field(None, description="CTA 버튼 텍스트 (예: 학습 시작하기)")
+    cta_url: str | None = None
+    strategy: Annotated[
+        Literal["weakness", "strength"], _one_of(("weakness", "strength"), "strength")
+    ] = "strength"
+
+
+class ActionPlan(StructuredOutput):
+    tool_description: ClassVar[str] = "Record the recommended growth actions."
+
+    actions: Annotated[list[ActionSuggestion], BeforeValidator(lenient_list)]
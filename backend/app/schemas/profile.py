@@ -0,0 +1,219 @@
+"""
+플랫폼별 파싱 결과 (parsed_data) 타입 모델
+- 수집 시점에 한 번 검증/정규화하여 JSONB 에 저장
+- 스코어링/보정/액션 생성은 타입이 보장된 필드를 그대로 사용
+"""
+
+from typing import Annotated, Any, ClassVar
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+from app.schemas.structured import (
+    Count,
+    DataQuality,
+    StrList,
+    StructuredOutput,
+    lenient_list,
+)
+
+
+def _education_list(val: Any) -> list:
+    if not isinstance(val, list):
+        return []
+    items = []
+    for v in val:
+        if isinstance(v, str) and v.strip():
+            items.append({"school": v.strip()})
+        elif isinstance(v, dict):
+            items.append(v)
+    return items
+
+
+def _certification_list(val: Any) -> list:
+    if not isinstance(val, list):
+        return []
+    items = []
+    for v in val:
+        if isinstance(v, dict):
+            v = v.get("name") or v.get("title")
+        if isinstance(v, str) and v.strip():
+            items.append(v.strip())
+    return items
+
+
+def _metrics(val: Any) -> dict:
+    return val if isinstance(val, dict) else {}
+
+
+class _Item(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+
+class Experience(_Item):
+    title: str | None = None
+    company: str | None = None
+    duration: str | None = None
+    description: str | None = None
+
+
+class Education(_Item):
+    school: str | None = None
+    degree: str | None = None
+    field: str | None = None
+    years: str | None = None
+
+
+class Repo(_Item):
+    name: str | None = None
+    description: str | None = None
+    language: str | None = None
+    stars: Count = 0
+
+
+class Post(_Item):
+    title: str | None = None
+    date: str | None = None
+    tags: StrList = []
+    brief: str | None = None
+    category: str | None = None
+
+
+class Project(_Item):
+    name: str | None = None
+    description: str | None = None
+    technologies: StrList = []
+
+
+class QuantitativeMetrics(_Item):
+    followers: Count = 0
+    post_count: Count = 0
+    project_count: Count = 0
+
+
+class ParsedProfile(StructuredOutput):
+    """
+    모든 플랫폼 공통 필드 + 스코어링에 쓰이는 필드.
+    플랫폼에 해당하지 않는 필드는 기본값(빈 리스트/0)으로 채워집니다.
+    """
+
+    tool_description: ClassVar[str] = "Record the career data extracted from the page."
+
+    platform: str = "other"
+    profile_url: str | None = None
+    name: str | None = None
+    data_quality: DataQuality = Field(
+        "low", description="How much career information the page exposed"
+    )
+
+    skills: StrList = []
+    top_languages: StrList = []
+    experience: Annotated[list[Experience], BeforeValidator(lenient_list)] = []
+    education: Annotated[list[Education], BeforeValidator(_education_list)] = []
+    certifications: Annotated[list[str], BeforeValidator(_certification_list)] = []
+    projects: Annotated[list[Project], BeforeValidator(lenient_list)] = []
+    pinned_repos: Annotated[list[Repo], BeforeValidator(lenient_list)] = []
+    recent_posts: Annotated[list[Post], BeforeValidator(lenient_list)] = []
+    series: StrList = []
+
+    followers: Count = 0
+    public_repos: Count = 0
+    recommendation_count: Count = 0
+    total_posts: Count = 0
+    quantitative_metrics: Annotated[
+        QuantitativeMetrics, BeforeValidator(_metrics)
+    ] = QuantitativeMetrics()
+
+    contribution_summary: str | None = None
+    posting_frequency: str | None = None
+
+    # 파싱 실패 / 목 데이터 표시
+    parse_error: str | None = None
+    is_mock: bool = False
+
+
+class LinkedInProfile(ParsedProfile):
+    tool_fields: ClassVar[tuple[str, ...]] = (
+        "name", "current_title", "company", "location", "headline", "skills",
+        "experience", "education", "certifications", "recommendation_count",
+        "activity_summary", "data_quality",
+    )
+
+    platform: str = "linkedin"
+    current_title: str | None = None
+    company: str | None = None
+    location: str | None = None
+    headline: str | None = None
+    activity_summary: str | None = None
+
+
+class GitHubProfile(ParsedProfile):
+    tool_fields: ClassVar[tuple[str, ...]] = (
+        "name", "username", "bio", "location", "company", "followers",
+        "following", "public_repos", "pinned_repos", "top_languages",
+        "contribution_summary", "notable_projects", "data_quality",
+    )
+
+    platform: str = "github"
+    username: str | None = None
+    bio: str | None = None
+    location: str | None = None
+    company: str | None = None
+    following: Count = 0
+    notable_projects: StrList = []
+
+
+class VelogProfile(ParsedProfile):
+    tool_fields: ClassVar[tuple[str, ...]] = (
+        "name", "username", "bio", "total_posts", "recent_posts",
+        "main_topics", "posting_frequency", "series", "data_quality",
+    )
+
+    platform: str = "velog"
+    username: str | None = None
+    bio: str | None = None
+    main_topics: StrList = []
+
+
+class TistoryProfile(ParsedProfile):
+    tool_fields: ClassVar[tuple[str, ...]] = (
+        "blog_name", "author", "total_posts", "categories", "recent_posts",
+        "main_topics", "posting_frequency", "data_quality",
+    )
+
+    platform: str = "tistory"
+    blog_name: str | None = None
+    author: str | None = None
+    categories: StrList = []
+    main_topics: StrList = []
+
+
+class GenericProfile(ParsedProfile):
+    tool_fields: ClassVar[tuple[str, ...]] = (
+        "page_type", "name", "role_or_title", "skills", "projects",
+        "experience_summary", "education", "activity_summary",
+        "quantitative_metrics", "data_quality",
+    )
+
+    page_type: str | None = None
+    role_or_title: str | None = None
+    experience_summary: str | None = None
+    activity_summary: str | None = None
+
+
+PROFILE_MODELS: dict[str, type[ParsedProfile]] = {
+    "linkedin": LinkedInProfile,
+    "github": GitHubProfile,
+    "velog": VelogProfile,
+    "tistory": TistoryProfile,
+}
+
+
+def profile_model_for(platform: str | None) -> type[ParsedProfile]:
+    return PROFILE_MODELS.get(platform or "other", GenericProfile)
+
+
+def load_profile(data: "dict | ParsedProfile") -> ParsedProfile:
+    """저장된 parsed_data(dict) 또는 모델을 플랫폼별 ParsedProfile 로 변환"""
+    if isinstance(data, ParsedProfile):
+        return data
+    return profile_model_for(data.get("platform")).model_validate(data)
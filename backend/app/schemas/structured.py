@@ -0,0 +1,116 @@
+"""
+LLM 구조화 출력 공통 베이스
+- Pydantic 모델 → Claude tool input_schema 변환
+- 스트리밍 파서용 최상위 필드 타입 추출
+- 느슨한 입력을 한 번에 정규화하는 공통 타입
+"""
+
+from typing import Annotated, Any, ClassVar, Literal
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+
+
+def _coerce_int(val: Any) -> int:
+    """'1,234', '1.2k', 12.0, None 등 LLM 이 흔히 내놓는 숫자 표현을 정수로"""
+    if val is None or isinstance(val, bool):
+        return 0
+    if isinstance(val, (int, float)):
+        return int(val)
+    if isinstance(val, str):
+        text = val.strip().lower().replace(",", "").replace("+", "")
+        multiplier = 1
+        if text.endswith("k"):
+            multiplier, text = 1000, text[:-1]
+        elif text.endswith("m"):
+            multiplier, text = 1_000_000, text[:-1]
+        try:
+            return int(float(text) * multiplier)
+        except ValueError:
+            return 0
+    return 0
+
+
+def _coerce_str_list(val: Any) -> list[str]:
+    if not isinstance(val, list):
+        return []
+    return [v.strip() for v in val if isinstance(v, str) and v.strip()]
+
+
+def _coerce_quality(val: Any) -> str:
+    if isinstance(val, str) and val.lower() in ("high", "medium", "low"):
+        return val.lower()
+    return "low"
+
+
+def lenient_list(val: Any) -> list:
+    """리스트가 아니면 빈 리스트, 객체가 아닌 항목은 제거"""
+    if not isinstance(val, list):
+        return []
+    return [v for v in val if isinstance(v, dict)]
+
+
+Count = Annotated[int, BeforeValidator(_coerce_int)]
+StrList = Annotated[list[str], BeforeValidator(_coerce_str_list)]
+DataQuality = Annotated[
+    Literal["high", "medium", "low"], BeforeValidator(_coerce_quality)
+]
+
+
+class StructuredOutput(BaseModel):
+    """tool_use 로 받는 LLM 출력 모델의 베이스"""
+
+    model_config = ConfigDict(extra="ignore")
+
+    # tool 스키마에 노출할 필드 (None 이면 전체)
+    tool_fields: ClassVar[tuple[str, ...] | None] = None
+    tool_description: ClassVar[str] = "Return the structured result."
+
+    @classmethod
+    def tool_schema(cls) -> dict:
+        """Claude tool input_schema 로 쓸 JSON Schema"""
+        schema = cls.model_json_schema()
+        props = schema.get("properties", {})
+        if cls.tool_fields is not None:
+            props = {k: v for k, v in props.items() if k in cls.tool_fields}
+
+        result: dict[str, Any] = {"type": "object", "properties": props}
+        required = [k for k in schema.get("required", []) if k in props]
+        if required:
+            result["required"] = required
+
+        defs = schema.get("$defs", {})
+        used = _referenced_defs(props, defs)
+        if used:
+            result["$defs"] = {k: defs[k] for k in sorted(used)}
+        return result
+
+    @classmethod
+    def field_types(cls) -> dict[str, type]:
+        """스트리밍 검증용 최상위 컨테이너 타입 (list/dict)"""
+        types: dict[str, type] = {}
+        for name, prop in cls.tool_schema()["properties"].items():
+            options = prop.get("anyOf", [prop])
+            kinds = {o["type"] for o in options if "type" in o} - {"null"}
+            is_ref = any("$ref" in o or "allOf" in o for o in options)
+            if kinds == {"array"}:
+                types[name] = list
+            elif kinds == {"object"} or (not kinds and is_ref):
+                types[name] = dict
+        return types
+
+
+def _referenced_defs(node: Any, defs: dict, found: set | None = None) -> set:
+    found = set() if found is None else found
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            name = ref.rsplit("/", 1)[-1]
+            if name not in found and name in defs:
+                found.add(name)
+                _referenced_defs(defs[name], defs, found)
+        for value in node.values():
+            _referenced_defs(value, defs, found)
+    elif isinstance(node, list):
+        for value in node:
+            _referenced_defs(value, defs, found)
+    return found
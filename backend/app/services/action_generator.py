@@ -5,30 +5,26 @@ Claude API 기반 개인화 액션 추천 엔진
 - 각 액션: 제목, 설명, 효과%, 대상 영역, 난이도, 기간, 태그, CTA
 """
 
-import json
 import uuid
 import logging
 from datetime import datetime, timezone
 from uuid import UUID
 
-from anthropic import AsyncAnthropic
-from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import async_session
-from app.models.user import User
-from app.models.data_source import DataSource
-from app.models.career_score import CareerScore
+from app.core.metrics import stage_timer
 from app.models.action_recommendation import ActionRecommendation
+from app.schemas.analysis import ActionPlan
+from app.services.llm_client import stream_model
+from app.services.profile_snapshot import ProfileSnapshot
 
 logger = logging.getLogger(__name__)
 
-client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-
 ACTION_SYSTEM_PROMPT = """You are a career growth strategist.
 Based on career analysis data, generate actionable growth recommendations.
 Each action should be specific, measurable, and achievable.
-Always respond in valid JSON. Write all content in Korean (한국어)."""
+Write all content in Korean (한국어)."""
 
 ACTION_USER_PROMPT = """Based on the following career analysis, generate personalized growth actions.
 
@@ -58,111 +54,69 @@ Generate 5-8 specific action recommendations following BOTH strategies:
 1. 약점 보완 (2-3 actions): Focus on weakest areas
 2. 강점 극대화 (3-5 actions): Leverage strongest areas for maximum impact
 
-Return JSON array:
-{{
-  "actions": [
-    {{
-      "title": "구체적인 액션 제목 (20자 이내)",
-      "description": "액션의 상세 설명과 이유 (2-3문장)",
-      "impact_percent": <1-15 사이 정수, 예상 가치 상승 효과>,
-      "target_area": "<expertise|influence|consistency|marketability|potential>",
-      "difficulty": "<easy|medium|hard>",
-      "estimated_duration": "예상 소요 기간 (예: 2주, 1개월, 3개월)",
-      "tags": ["태그1", "태그2"],
-      "cta_label": "CTA 버튼 텍스트 (예: 학습 시작하기)",
-      "cta_url": null,
-      "strategy": "<weakness|strength>"
-    }}
-  ]
-}}"""
+Record the actions with the provided tool."""
 
 
-async def generate_actions(user_id: UUID, score_id: UUID) -> list[dict]:
+async def plan_actions(snapshot: ProfileSnapshot, result: dict) -> list[dict]:
     """
-    최신 스코어와 프로필 데이터를 기반으로 액션 추천을 생성합니다.
+    스코어링 결과와 프로필 스냅샷으로 액션 추천을 생성합니다 (DB 접근 없음).
+    스코어 저장과 동시에 실행할 수 있습니다.
     """
-    async with async_session() as db:
-        # 유저 + 스코어 + 소스 조회
-        user_result = await db.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one_or_none()
-        if not user:
-            return []
-
-        score_result = await db.execute(
-            select(CareerScore).where(CareerScore.id == score_id)
+    scores = result["scores"]
+    insights = result.get("insights") or {}
+
+    prompt = ACTION_USER_PROMPT.format(
+        job_category=snapshot.job_category,
+        years=snapshot.years,
+        expertise=scores["expertise"],
+        influence=scores["influence"],
+        consistency=scores["consistency"],
+        marketability=scores["marketability"],
+        potential=scores["potential"],
+        total=scores["total"],
+        strengths=", ".join(insights.get("strengths", [])) or "정보 없음",
+        weaknesses=", ".join(insights.get("weaknesses", [])) or "정보 없음",
+        skills=", ".join(snapshot.top_skills()) or "정보 없음",
+        insights_summary=insights.get("overall_summary", ""),
+    )
+
+    # Claude API 호출
+    with stage_timer("actions"):
+        return await _call_claude_for_actions(prompt)
+
+
+def save_actions(
+    db: AsyncSession,
+    user_id: UUID,
+    score_id: UUID,
+    actions_data: list[dict],
+) -> list[ActionRecommendation]:
+    """생성된 액션을 세션에 추가합니다. 커밋은 호출자가 합니다."""
+    now = datetime.now(timezone.utc)
+    saved_actions = []
+
+    for action in actions_data:
+        rec = ActionRecommendation(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            score_id=score_id,
+            title=action.get("title", "추천 액션"),
+            description=action.get("description"),
+            impact_percent=action.get("impact_percent"),
+            target_area=action.get("target_area"),
+            difficulty=action.get("difficulty"),
+            estimated_duration=action.get("estimated_duration"),
+            tags=action.get("tags", []),
+            cta_label=action.get("cta_label"),
+            cta_url=action.get("cta_url"),
+            is_completed=False,
+            is_bookmarked=False,
+            created_at=now,
         )
-        score = score_result.scalar_one_or_none()
-        if not score:
-            return []
-
-        sources_result = await db.execute(
-            select(DataSource).where(
-                DataSource.user_id == user_id,
-                DataSource.status == "completed",
-                DataSource.parsed_data.isnot(None),
-            )
-        )
-        sources = sources_result.scalars().all()
-
-        # 스킬 수집
-        all_skills = set()
-        for src in sources:
-            if src.parsed_data:
-                for s in (src.parsed_data.get("skills") or []):
-                    if isinstance(s, str):
-                        all_skills.add(s)
-                for lang in (src.parsed_data.get("top_languages") or []):
-                    if isinstance(lang, str):
-                        all_skills.add(lang)
-
-        insights = score.ai_insights or {}
-
-        prompt = ACTION_USER_PROMPT.format(
-            job_category=user.job_category or "other",
-            years=user.years_of_experience or 0,
-            expertise=float(score.expertise_score or 0),
-            influence=float(score.influence_score or 0),
-            consistency=float(score.consistency_score or 0),
-            marketability=float(score.marketability_score or 0),
-            potential=float(score.potential_score or 0),
-            total=float(score.total_score or 0),
-            strengths=", ".join(insights.get("strengths", [])) or "정보 없음",
-            weaknesses=", ".join(insights.get("weaknesses", [])) or "정보 없음",
-            skills=", ".join(sorted(all_skills)[:30]) or "정보 없음",
-            insights_summary=insights.get("overall_summary", ""),
-        )
-
-        # Claude API 호출
-        actions_data = await _call_claude_for_actions(prompt)
+        db.add(rec)
+        saved_actions.append(rec)
 
-        # DB에 저장
-        now = datetime.now(timezone.utc)
-        saved_actions = []
-
-        for action in actions_data:
-            rec = ActionRecommendation(
-                id=uuid.uuid4(),
-                user_id=user_id,
-                score_id=score_id,
-                title=action.get("title", "추천 액션"),
-                description=action.get("description"),
-                impact_percent=action.get("impact_percent"),
-                target_area=action.get("target_area"),
-                difficulty=action.get("difficulty"),
-                estimated_duration=action.get("estimated_duration"),
-                tags=action.get("tags", []),
-                cta_label=action.get("cta_label"),
-                cta_url=action.get("cta_url"),
-                is_completed=False,
-                is_bookmarked=False,
-                created_at=now,
-            )
-            db.add(rec)
-            saved_actions.append(rec)
-
-        await db.commit()
-        logger.info(f"Generated {len(saved_actions)} actions for user {user_id}")
-        return actions_data
+    return saved_actions
 
 
 async def _call_claude_for_actions(prompt: str) -> list[dict]:
@@ -172,37 +126,14 @@ async def _call_claude_for_actions(prompt: str) -> list[dict]:
         return _generate_default_actions()
 
     try:
-        response = await client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=3000,
+        plan = await stream_model(
             system=ACTION_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            prompt=prompt,
+            max_tokens=3000,
+            model=ActionPlan,
+            label="actions",
         )
-
-        response_text = response.content[0].text
-
-        json_str = response_text
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0]
-        elif "```" in json_str:
-            json_str = json_str.split("```")[1].split("```")[0]
-
-        result = json.loads(json_str.strip())
-        actions = result.get("actions", [])
-
-        # Validate
-        valid_areas = {"expertise", "influence", "consistency", "marketability", "potential"}
-        valid_difficulties = {"easy", "medium", "hard"}
-        validated = []
-        for a in actions:
-            if a.get("target_area") not in valid_areas:
-                a["target_area"] = "expertise"
-            if a.get("difficulty") not in valid_difficulties:
-                a["difficulty"] = "medium"
-            a["impact_percent"] = max(1, min(15, int(a.get("impact_percent", 5))))
-            validated.append(a)
-
-        return validated
+        return [a.model_dump() for a in plan.actions]
 
     except Exception as e:
         logger.error(f"Action generation failed: {e}")
@@ -0,0 +1,174 @@
+"""
+액션 목록 조회 (필터 / 정렬 / 키셋 페이지네이션)
+- 태그는 tags @> ARRAY[tag] 로 DB 에서 필터 (GIN 인덱스)
+- 난이도는 easy < medium < hard 서열로 정렬 (알 수 없는 값은 마지막)
+- 정렬 키를 모두 내림차순 튜플로 맞춰 (키...) < (커서 값...) 행 비교 한 번으로 다음 페이지 조회
+- 커서는 마지막 행의 정렬 키를 담은 불투명 문자열 (정렬이 다르면 거부)
+- 진행 중 / 완료 개수는 같은 태그 / 영역 필터로 DB 에서 집계 (불러온 페이지와 무관)
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import Select, case, func, literal_column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.action_recommendation import ActionRecommendation
+
+DIFFICULTY_RANK = {"easy": 1, "medium": 2, "hard": 3}
+UNKNOWN_DIFFICULTY_RANK = len(DIFFICULTY_RANK) + 1
+# 효과 미정 액션은 효과순 마지막 (인덱스 식과 같은 리터럴이어야 함)
+NO_IMPACT = -1
+
+impact_key = func.coalesce(ActionRecommendation.impact_percent, literal_column(str(NO_IMPACT)))
+difficulty_rank = case(
+    *[(ActionRecommendation.difficulty == name, rank) for name, rank in DIFFICULTY_RANK.items()],
+    else_=UNKNOWN_DIFFICULTY_RANK,
+)
+
+
+@dataclass(frozen=True)
+class SortKey:
+    expr: Any
+    value: Callable[[ActionRecommendation], Any]
+    parse: Callable[[Any], Any]
+
+
+def _impact(action: ActionRecommendation) -> Decimal:
+    return Decimal(NO_IMPACT) if action.impact_percent is None else Decimal(action.impact_percent)
+
+
+def _rank(action: ActionRecommendation) -> int:
+    return DIFFICULTY_RANK.get(action.difficulty, UNKNOWN_DIFFICULTY_RANK)
+
+
+_CREATED = SortKey(ActionRecommendation.created_at, lambda a: a.created_at, datetime.fromisoformat)
+_ID = SortKey(ActionRecommendation.id, lambda a: a.id, UUID)
+_IMPACT = SortKey(impact_key, _impact, Decimal)
+
+# 정렬별 키 (모두 내림차순, 마지막은 유일성을 위한 id)
+SORTS: dict[str, tuple[SortKey, ...]] = {
+    "impact": (_IMPACT, _CREATED, _ID),
+    # 난이도 오름차순 = 음수 서열 내림차순
+    "difficulty": (SortKey(-difficulty_rank, lambda a: -_rank(a), int), _IMPACT, _ID),
+    "recent": (_CREATED, _ID),
+}
+DEFAULT_SORT = "impact"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+def encode_cursor(sort: str, action: ActionRecommendation) -> str:
+    values = [_encode_value(key.value(action)) for key in SORTS[sort]]
+    raw = json.dumps([sort, *values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(sort: str, cursor: str) -> tuple:
+    """커서를 정렬 키 값 튜플로 되돌립니다. 형식이 틀리거나 정렬이 다르면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, *values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Malformed cursor") from e
+    keys = SORTS[sort]
+    if cursor_sort != sort or len(values) != len(keys):
+        raise ValueError("Cursor does not match sort")
+    try:
+        return tuple(key.parse(value) for key, value in zip(keys, values))
+    except (TypeError, ValueError, ArithmeticError) as e:
+        raise ValueError("Malformed cursor") from e
+
+
+def build_query(
+    user_id: UUID,
+    *,
+    sort: str = DEFAULT_SORT,
+    tag: str | None = None,
+    area: str | None = None,
+    completed: bool | None = None,
+    bookmarked: bool | None = None,
+    after: tuple | None = None,
+    limit: int,
+) -> Select:
+    keys = SORTS.get(sort, SORTS[DEFAULT_SORT])
+    query = _filtered(
+        select(ActionRecommendation).where(ActionRecommendation.user_id == user_id), tag, area
+    )
+
+    # 상태 필터
+    if completed is not None:
+        query = query.where(ActionRecommendation.is_completed == completed)
+    if bookmarked is not None:
+        query = query.where(ActionRecommendation.is_bookmarked == bookmarked)
+
+    # 키셋: 이전 페이지 마지막 행 다음부터
+    if after is not None:
+        query = query.where(tuple_(*[key.expr for key in keys]) < after)
+
+    return query.order_by(*[key.expr.desc() for key in keys]).limit(limit)
+
+
+def _filtered(query: Select, tag: str | None, area: str | None) -> Select:
+    if tag:
+        query = query.where(ActionRecommendation.tags.contains([tag]))
+    if area:
+        query = query.where(ActionRecommendation.target_area == area)
+    return query
+
+
+def build_status_counts_query(
+    user_id: UUID, *, tag: str | None = None, area: str | None = None
+) -> Select:
+    return _filtered(
+        select(ActionRecommendation.is_completed, func.count())
+        .where(ActionRecommendation.user_id == user_id)
+        .group_by(ActionRecommendation.is_completed),
+        tag,
+        area,
+    )
+
+
+async def count_by_status(
+    db: AsyncSession, user_id: UUID, *, tag: str | None = None, area: str | None = None
+) -> dict[str, int]:
+    """태그 / 영역 필터 안의 진행 중 / 완료 액션 수"""
+    result = await db.execute(build_status_counts_query(user_id, tag=tag, area=area))
+    counts = {bool(done): count for done, count in result.all()}
+    return {"pending": counts.get(False, 0), "completed": counts.get(True, 0)}
+
+
+async def list_actions(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
+    limit: int,
+    **filters,
+) -> tuple[list[ActionRecommendation], str | None]:
+    """한 페이지의 액션과 다음 페이지 커서(없으면 None)를 반환합니다."""
+    if sort not in SORTS:
+        sort = DEFAULT_SORT
+    after = decode_cursor(sort, cursor) if cursor else None
+    # 한 건 더 읽어 다음 페이지 존재 여부 확인
+    result = await db.execute(
+        build_query(user_id, sort=sort, after=after, limit=limit + 1, **filters)
+    )
+    actions = list(result.scalars().all())
+    if len(actions) <= limit:
+        return actions, None
+    actions = actions[:limit]
+    return actions, encode_cursor(sort, actions[-1])
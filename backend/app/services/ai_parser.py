@@ -1,165 +1,40 @@
 """
 Claude API를 활용한 스크래핑 데이터 구조화 서비스
-- 스크래핑된 비정형 텍스트 → 구조화된 JSON
-- 플랫폼별 최적화된 프롬프트
+- 스크래핑된 비정형 텍스트 → 플랫폼별 ParsedProfile
+- tool_use JSON Schema 로 출력 구조 강제
 """
 
-import json
 import logging
 
-from anthropic import AsyncAnthropic
-
 from app.core.config import settings
+from app.schemas.profile import ParsedProfile, profile_model_for
+from app.services.llm_client import LLMOutputError, stream_model
 
 logger = logging.getLogger(__name__)
 
-client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-
 SYSTEM_PROMPT = """You are a career data extraction specialist.
 You analyze scraped web page content and extract structured career-related information.
-Always respond in valid JSON format. Be thorough but only include information that is actually present in the data.
+Record the result with the provided tool. Be thorough but only include information that is actually present in the data.
 If certain fields cannot be determined, use null instead of guessing."""
 
 PLATFORM_PROMPTS = {
-    "linkedin": """Analyze this LinkedIn profile page content and extract structured data.
-
-Return JSON with this exact structure:
-{
-  "platform": "linkedin",
-  "name": "string or null",
-  "current_title": "string or null",
-  "company": "string or null",
-  "location": "string or null",
-  "headline": "string or null",
-  "skills": ["list of skills found"],
-  "experience": [
-    {
-      "title": "string",
-      "company": "string",
-      "duration": "string or null",
-      "description": "string or null"
-    }
-  ],
-  "education": [
-    {
-      "school": "string",
-      "degree": "string or null",
-      "field": "string or null",
-      "years": "string or null"
-    }
-  ],
-  "certifications": ["list of certifications"],
-  "recommendation_count": "number or null",
-  "activity_summary": "brief summary of recent activity",
-  "data_quality": "high/medium/low"
-}""",
-
-    "github": """Analyze this GitHub profile page content and extract structured data.
-
-Return JSON with this exact structure:
-{
-  "platform": "github",
-  "name": "string or null",
-  "username": "string or null",
-  "bio": "string or null",
-  "location": "string or null",
-  "company": "string or null",
-  "followers": "number or null",
-  "following": "number or null",
-  "public_repos": "number or null",
-  "pinned_repos": [
-    {
-      "name": "string",
-      "description": "string or null",
-      "language": "string or null",
-      "stars": "number or null"
-    }
-  ],
-  "top_languages": ["list of programming languages"],
-  "contribution_summary": "string describing contribution activity",
-  "notable_projects": ["list of notable project names"],
-  "data_quality": "high/medium/low"
-}""",
-
-    "velog": """Analyze this Velog blog profile page content and extract structured data.
-
-Return JSON with this exact structure:
-{
-  "platform": "velog",
-  "name": "string or null",
-  "username": "string or null",
-  "bio": "string or null",
-  "total_posts": "number or null",
-  "recent_posts": [
-    {
-      "title": "string",
-      "date": "string or null",
-      "tags": ["list of tags"],
-      "brief": "string or null"
-    }
-  ],
-  "main_topics": ["list of main writing topics"],
-  "posting_frequency": "string describing how often they post",
-  "series": ["list of series names"],
-  "data_quality": "high/medium/low"
-}""",
-
-    "tistory": """Analyze this Tistory blog page content and extract structured data.
-
-Return JSON with this exact structure:
-{
-  "platform": "tistory",
-  "blog_name": "string or null",
-  "author": "string or null",
-  "total_posts": "number or null",
-  "categories": ["list of categories"],
-  "recent_posts": [
-    {
-      "title": "string",
-      "date": "string or null",
-      "category": "string or null"
-    }
-  ],
-  "main_topics": ["list of main writing topics"],
-  "posting_frequency": "string describing how often they post",
-  "data_quality": "high/medium/low"
-}""",
+    "linkedin": "Analyze this LinkedIn profile page content and extract structured data.",
+    "github": "Analyze this GitHub profile page content and extract structured data.",
+    "velog": "Analyze this Velog blog profile page content and extract structured data.",
+    "tistory": "Analyze this Tistory blog page content and extract structured data.",
 }
 
 GENERIC_PROMPT = """Analyze this web page content and extract any career-related structured data.
-This page could be a portfolio, personal blog, resume page, or any professional profile.
-
-Return JSON with this exact structure:
-{
-  "platform": "other",
-  "page_type": "portfolio/blog/resume/profile/other",
-  "name": "string or null",
-  "role_or_title": "string or null",
-  "skills": ["list of skills found"],
-  "projects": [
-    {
-      "name": "string",
-      "description": "string or null",
-      "technologies": ["list of tech used"]
-    }
-  ],
-  "experience_summary": "string or null",
-  "education": ["list of education items"],
-  "activity_summary": "brief summary of what this page shows",
-  "quantitative_metrics": {
-    "followers": "number or null",
-    "post_count": "number or null",
-    "project_count": "number or null"
-  },
-  "data_quality": "high/medium/low"
-}"""
+This page could be a portfolio, personal blog, resume page, or any professional profile."""
 
 
 async def parse_with_ai(
     scraped_text: str, platform: str, url: str
-) -> dict:
+) -> ParsedProfile:
     """
-    Claude API를 사용하여 스크래핑된 텍스트를 구조화된 JSON으로 변환
+    Claude API를 사용하여 스크래핑된 텍스트를 플랫폼별 ParsedProfile 로 변환
+
+    플랫폼 모델의 JSON Schema 를 tool 로 강제하고, 수집 시점에 한 번 검증합니다.
 
     Args:
         scraped_text: 스크래핑 후 정제된 텍스트
@@ -167,13 +42,14 @@ async def parse_with_ai(
         url: 원본 URL
 
     Returns:
-        구조화된 딕셔너리 (parsed_data)
+        검증된 ParsedProfile (parsed_data 로 저장)
     """
     if not settings.ANTHROPIC_API_KEY:
         logger.warning("ANTHROPIC_API_KEY not set, returning mock data")
         return _generate_mock_data(platform, url)
 
     prompt = PLATFORM_PROMPTS.get(platform, GENERIC_PROMPT)
+    model = profile_model_for(platform)
 
     user_message = f"""URL: {url}
 Platform: {platform}
@@ -185,47 +61,27 @@ Platform: {platform}
 {prompt}"""
 
     try:
-        response = await client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=2000,
+        parsed = await stream_model(
             system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
+            prompt=user_message,
+            max_tokens=2000,
+            model=model,
+            label="parse",
         )
+        return parsed.model_copy(update={"platform": platform, "profile_url": url})
 
-        response_text = response.content[0].text
-
-        # Extract JSON from response (handle markdown code blocks)
-        json_str = response_text
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0]
-        elif "```" in json_str:
-            json_str = json_str.split("```")[1].split("```")[0]
-
-        parsed = json.loads(json_str.strip())
-        parsed["profile_url"] = url
-        return parsed
-
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse AI response as JSON: {e}")
-        return {
-            "platform": platform,
-            "profile_url": url,
-            "raw_response": response_text if "response_text" in dir() else "",
-            "parse_error": str(e),
-            "data_quality": "low",
-        }
+    except LLMOutputError as e:
+        logger.error(f"Failed to parse AI response: {e}")
+        return model(platform=platform, profile_url=url, parse_error=str(e))
     except Exception as e:
         logger.error(f"Claude API call failed: {e}")
         return _generate_mock_data(platform, url)
 
 
-def _generate_mock_data(platform: str, url: str) -> dict:
+def _generate_mock_data(platform: str, url: str) -> ParsedProfile:
     """API 키가 없을 때 테스트용 목 데이터 생성"""
-    return {
-        "platform": platform,
-        "profile_url": url,
-        "name": None,
-        "data_quality": "low",
-        "_mock": True,
-        "_message": "ANTHROPIC_API_KEY not configured. Set it in .env for real analysis.",
-    }
+    return profile_model_for(platform)(
+        platform=platform,
+        profile_url=url,
+        is_mock=True,
+    )
@@ -5,21 +5,20 @@ Claude API 기반 정성 분석 보정 + 인사이트 생성
 - 예상 연봉 범위 보정
 """
 
-import json
 import logging
 
-from anthropic import AsyncAnthropic
-
 from app.core.config import settings
+from app.schemas.analysis import CalibrationResult
+from app.services.llm_client import FieldCallback, stream_model
+from app.services.prompt_encoder import encode_sources, estimate_tokens
 from app.services.market_seed import get_salary_range
+from app.services.profile_snapshot import ProfileSnapshot
 
 logger = logging.getLogger(__name__)
 
-client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-
 SCORING_SYSTEM_PROMPT = """You are a career analysis expert who evaluates professionals across 5 key areas.
 You provide calibration adjustments to rule-based scores and generate actionable insights.
-Always respond in valid JSON format. Write insights in Korean (한국어)."""
+Write insights in Korean (한국어)."""
 
 SCORING_USER_PROMPT = """Based on the following career data, provide score adjustments and insights.
 
@@ -48,39 +47,21 @@ SCORING_USER_PROMPT = """Based on the following career data, provide score adjus
 == Detailed Source Data ==
 {source_details}
 
-Return JSON with this exact structure:
-{{
-  "adjustments": {{
-    "expertise": <int between -10 and 10>,
-    "influence": <int between -10 and 10>,
-    "consistency": <int between -10 and 10>,
-    "marketability": <int between -10 and 10>,
-    "potential": <int between -10 and 10>
-  }},
-  "insights": {{
-    "overall_summary": "2-3문장 종합 분석",
-    "strengths": ["강점 1", "강점 2", "강점 3"],
-    "weaknesses": ["약점 1", "약점 2"],
-    "expertise_detail": "전문성 영역 상세 분석 (2문장)",
-    "influence_detail": "영향력 영역 상세 분석 (2문장)",
-    "consistency_detail": "지속성 영역 상세 분석 (2문장)",
-    "marketability_detail": "시장성 영역 상세 분석 (2문장)",
-    "potential_detail": "성장성 영역 상세 분석 (2문장)"
-  }},
-  "salary_adjustment_percent": <int between -15 and 15>,
-  "market_position_percentile": <int between 1 and 99>
-}}"""
+Record the adjustments and insights with the provided tool."""
 
 
 async def get_ai_calibration(
-    sources_data: list[dict],
+    snapshot: ProfileSnapshot,
     scores: dict,
-    job_category: str,
-    years: int,
-) -> dict:
+    on_field: FieldCallback | None = None,
+) -> dict | None:
     """
     Claude API를 사용하여 정성 분석 보정 및 인사이트 생성
 
+    집계값은 스코어링과 같은 ProfileSnapshot 에서 읽습니다.
+    on_field 를 넘기면 adjustments 등 최상위 필드가 스트리밍 중
+    완성되는 즉시 전달됩니다.
+
     Returns:
         {
             "adjustments": { area: int },
@@ -88,100 +69,61 @@ async def get_ai_calibration(
             "salary_adjustment_percent": int,
             "market_position_percentile": int,
         }
+        API 키가 없거나 호출이 실패하면 None (호출자가 기본 보정으로 fallback 처리,
+        기본값을 보정 결과로 저장하지 않도록)
     """
-    # 통합 데이터 집계
-    all_skills = set()
-    exp_count = 0
-    proj_count = 0
-    post_count = 0
-    followers = 0
-    rec_count = 0
-    cert_count = 0
-    platforms = set()
-    source_details_parts = []
-
-    for src in sources_data:
-        if not src:
-            continue
-        platform = src.get("platform", "other")
-        platforms.add(platform)
-
-        for s in (src.get("skills") or []):
-            if isinstance(s, str):
-                all_skills.add(s)
-        for lang in (src.get("top_languages") or []):
-            if isinstance(lang, str):
-                all_skills.add(lang)
-
-        exp_count += len(src.get("experience") or [])
-        proj_count += len(src.get("projects") or []) + len(src.get("pinned_repos") or [])
-        post_count += int(src.get("total_posts") or 0)
-        followers += int(src.get("followers") or 0)
-        rec_count += int(src.get("recommendation_count") or 0)
-        cert_count += len(src.get("certifications") or [])
-
-        # Summarize each source (truncated)
-        summary = json.dumps(src, ensure_ascii=False, default=str)[:1500]
-        source_details_parts.append(f"[{platform}] {summary}")
-
-    source_details = "\n\n".join(source_details_parts)[:8000]
+    job_category = snapshot.job_category
+    years = snapshot.years
+
+    # 소스별 상세 사실을 토큰 예산 안에서 압축 인코딩
+    encoded = encode_sources(list(snapshot.profiles), settings.CALIBRATION_SOURCE_TOKEN_BUDGET)
 
     prompt = SCORING_USER_PROMPT.format(
         job_category=job_category,
         years=years,
-        skills=", ".join(sorted(all_skills)[:30]) or "정보 없음",
-        exp_count=exp_count,
-        proj_count=proj_count,
-        post_count=post_count,
-        followers=followers,
-        rec_count=rec_count,
-        cert_count=cert_count,
-        platforms=", ".join(sorted(platforms)) or "없음",
+        skills=", ".join(snapshot.top_skills()) or "정보 없음",
+        exp_count=len(snapshot.experience_items),
+        proj_count=len(snapshot.projects),
+        post_count=snapshot.post_count,
+        followers=snapshot.followers,
+        rec_count=snapshot.recommendation_count,
+        cert_count=len(snapshot.certifications),
+        platforms=", ".join(sorted(snapshot.platforms_used)) or "없음",
         expertise=scores.get("expertise", 0),
         influence=scores.get("influence", 0),
         consistency=scores.get("consistency", 0),
         marketability=scores.get("marketability", 0),
         potential=scores.get("potential", 0),
         total=scores.get("total", 0),
-        source_details=source_details,
+        source_details=encoded.text or "없음",
+    )
+    logger.info(
+        f"Calibration prompt: ~{estimate_tokens(prompt)} tokens "
+        f"(sources ~{encoded.tokens}/{settings.CALIBRATION_SOURCE_TOKEN_BUDGET}, "
+        f"{encoded.included_facts}/{encoded.total_facts} facts)"
     )
 
     if not settings.ANTHROPIC_API_KEY:
-        logger.warning("ANTHROPIC_API_KEY not set, returning default calibration")
-        return _generate_default_calibration(scores, job_category, years)
+        logger.warning("ANTHROPIC_API_KEY not set, skipping calibration")
+        return None
 
     try:
-        response = await client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=2000,
+        result = await stream_model(
             system=SCORING_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            prompt=prompt,
+            max_tokens=2000,
+            model=CalibrationResult,
+            on_field=on_field,
+            label="calibration",
         )
-
-        response_text = response.content[0].text
-
-        # Extract JSON
-        json_str = response_text
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0]
-        elif "```" in json_str:
-            json_str = json_str.split("```")[1].split("```")[0]
-
-        result = json.loads(json_str.strip())
-
-        # Validate adjustments range
-        for area in ["expertise", "influence", "consistency", "marketability", "potential"]:
-            adj = result.get("adjustments", {}).get(area, 0)
-            result["adjustments"][area] = max(-10, min(10, int(adj)))
-
-        return result
+        return result.model_dump()
 
     except Exception as e:
         logger.error(f"AI calibration failed: {e}")
-        return _generate_default_calibration(scores, job_category, years)
+        return None
 
 
-def _generate_default_calibration(scores: dict, job_category: str, years: int) -> dict:
+def generate_default_calibration(scores: dict, job_category: str, years: int) -> dict:
     """AI 호출 실패 시 기본 보정값"""
     total = scores.get("total", 50)
 
@@ -3,106 +3,488 @@
 URL 등록 → 스크래핑 → AI 파싱 → 스코어링 → DB 저장
 """
 
+import asyncio
+import os
+import socket
 import uuid
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, case, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.concurrency import KeyedLimiter
+from app.core.config import settings
 from app.core.database import async_session
+from app.core.metrics import stage_timer
+from app.core.tracing import span
 from app.models.data_source import DataSource
 from app.models.user import User
 from app.models.career_score import CareerScore
 from app.models.score_history import ScoreHistory
 from app.services.scraper import scrape_url
 from app.services.ai_parser import parse_with_ai
-from app.services.scoring import CareerScorer
-from app.services.ai_scorer import get_ai_calibration, calculate_salary
-from app.services.action_generator import generate_actions
+from app.services.scoring import CareerScorer, scoring_fingerprint
+from app.services.profile_snapshot import ProfileSnapshot
+from app.services.ai_scorer import (
+    calculate_salary,
+    generate_default_calibration,
+    get_ai_calibration,
+)
+from app.services.action_generator import plan_actions, save_actions
+from app.services.llm_ledger import llm_context
+from app.services.job_queue import JobDeferred, enqueue_scoring, renew_with_heartbeat
+from app.services.progress import publish_progress
+from app.services.score_cache import invalidate_scores
+from app.services.score_distribution import area_scores, update_member
+from app.services.versions import bump_actions_version
+from app.services.checkpoints import (
+    STAGE_PARSE,
+    STAGE_SCRAPE,
+    clear_checkpoints,
+    load_checkpoints,
+    save_checkpoint,
+)
 
 logger = logging.getLogger(__name__)
 
+# 소스 처리 동시 실행 한도 (프로세스 전체 / 유저별)
+_global_source_slots = asyncio.Semaphore(settings.PIPELINE_MAX_CONCURRENT_SOURCES)
+_user_source_slots = KeyedLimiter(settings.PIPELINE_MAX_SOURCES_PER_USER)
+_scrape_slots = asyncio.Semaphore(settings.WORKER_SCRAPE_CONCURRENCY)
 
-async def process_source(source_id: UUID) -> None:
+
+async def process_source(
+    source_id: UUID,
+    run_id: UUID | None = None,
+    wait: bool = False,
+) -> None:
     """
     단일 데이터 소스를 스크래핑 + AI 파싱합니다.
-    백그라운드 태스크로 실행됩니다.
+    워커 작업으로 실행됩니다.
+
+    - run_id: 처리할 실행. 소스의 현재 run_id 와 다르면(재스캔으로 대체됨) 중단
+    - 실행을 점유(lease)한 워커만 진행하며, wait=True 면 다른 워커가 같은 실행을
+      처리 중일 때 끝날 때까지 기다립니다. wait=False 면 JobDeferred 로 작업을
+      그 점유가 만료될 때까지 미룹니다 (죽은 워커의 점유면 만료 후 이어서 처리).
+    - 점유는 단계 전이와 작업 하트비트마다 연장됩니다.
+    - 단계 산출물을 체크포인트로 남겨, 재시작 시 완료된 단계는 건너뜁니다.
+
+    스크래핑/LLM 호출 동안에는 DB 커넥션을 잡지 않도록 단계마다 짧은
+    트랜잭션으로 나누고, 상태 전이는 조건부 UPDATE(낙관적 갱신)로 처리합니다.
     """
+    owner = f"{_WORKER_ID}:{uuid.uuid4().hex[:8]}"
+
+    # Step 0: 실행 점유
+    while True:
+        async with async_session() as db:
+            result = await db.execute(
+                select(
+                    DataSource.user_id,
+                    DataSource.platform,
+                    DataSource.source_url,
+                    DataSource.status,
+                    DataSource.run_id,
+                    DataSource.lease_until,
+                ).where(DataSource.id == source_id)
+            )
+            source = result.first()
+            if not source:
+                logger.error(f"Source {source_id} not found")
+                return
+            run_id = run_id or source.run_id
+            if source.run_id != run_id:
+                logger.info(f"Source {source_id} run {run_id} superseded; skipping")
+                return
+            if source.status not in _ACTIVE_SOURCE_STATUSES:
+                logger.info(f"Source {source_id} is {source.status}; skipping")
+                return
+
+            if await _claim_source_run(db, source.user_id, source_id, run_id, owner):
+                checkpoints = await load_checkpoints(db, source_id, run_id)
+                break
+
+        if not wait:
+            # 점유가 끝날 무렵 다시 시도 (완료됐으면 건너뛰고, 죽은 워커였으면 이어서 처리)
+            retry_at = datetime.now(timezone.utc) + timedelta(
+                seconds=settings.PIPELINE_WAIT_POLL_SECONDS
+            )
+            if source.lease_until and source.lease_until > retry_at:
+                retry_at = source.lease_until
+            raise JobDeferred(
+                retry_at, f"Source {source_id} run {run_id} is being processed elsewhere"
+            )
+        await asyncio.sleep(settings.PIPELINE_WAIT_POLL_SECONDS)
+
+    run = _SourceRun(source.user_id, source_id, run_id, owner)
+    with renew_with_heartbeat(run.renew):
+        await _process_claimed_run(run, source, checkpoints)
+
+
+async def _process_claimed_run(run: "_SourceRun", source, checkpoints: dict) -> None:
+    """점유한 실행의 스크래핑 → 파싱 → 저장 (체크포인트가 있는 단계는 건너뜀)"""
+    source_id, run_id = run.source_id, run.run_id
+
+    # Step 1: Scraping (커넥션 없음, 체크포인트가 있으면 재사용)
+    scraped = checkpoints.get(STAGE_SCRAPE)
+    if scraped is None:
+        async with _scrape_slots:
+            # 슬롯 대기 중 재스캔으로 대체되었으면 스크래핑하지 않음
+            async with async_session() as db:
+                if not await run.advance(db):
+                    logger.info(f"Source {source_id} run {run_id} superseded before scraping")
+                    return
+            logger.info(f"Scraping {source.source_url} ({source.platform})")
+            scrape_result = await scrape_url(source.source_url, source.platform)
+
+        async with async_session() as db:
+            if not scrape_result["success"]:
+                await run.finish(
+                    db,
+                    status="failed",
+                    error_message=scrape_result.get("error", "Scraping failed"),
+                )
+                return
+
+            scraped = {
+                "cleaned_text": scrape_result["cleaned_text"],
+                "title": scrape_result.get("title", ""),
+            }
+            # 대체된 실행은 체크포인트를 남기지 않음 (전이가 성공한 뒤에만 기록)
+            if not await run.advance(db, scraped_html=scrape_result["raw_html"]):
+                logger.info(f"Source {source_id} run {run_id} superseded during scraping")
+                return
+            await save_checkpoint(db, source_id, run_id, STAGE_SCRAPE, scraped)
+            await db.commit()
+    else:
+        logger.info(f"Source {source_id} resuming run {run_id} after scrape checkpoint")
+
+    # Step 2: AI Parsing (커넥션 없음, 체크포인트가 있으면 재사용)
+    parsed = checkpoints.get(STAGE_PARSE)
+    if parsed is None:
+        # 유료 LLM 호출 직전에 실행이 아직 유효한지 확인
+        async with async_session() as db:
+            if not await run.advance(db, status="parsing"):
+                logger.info(f"Source {source_id} run {run_id} superseded before parsing")
+                return
+        logger.info(f"Parsing {source.source_url} with Claude API")
+        with llm_context(
+            user_id=source.user_id,
+            source_id=source_id,
+            stage="parse",
+            platform=source.platform,
+        ):
+            with stage_timer("parse", platform=source.platform):
+                profile = await parse_with_ai(
+                    scraped["cleaned_text"],
+                    source.platform,
+                    source.source_url,
+                )
+        parsed = profile.model_dump(mode="json")
+
+        async with async_session() as db:
+            if not await run.advance(db):
+                logger.info(f"Source {source_id} run {run_id} superseded during parsing")
+                return
+            await save_checkpoint(db, source_id, run_id, STAGE_PARSE, parsed)
+            await db.commit()
+    else:
+        logger.info(f"Source {source_id} resuming run {run_id} after parse checkpoint")
+
+    # Step 3: Save results
     async with async_session() as db:
-        result = await db.execute(
-            select(DataSource).where(DataSource.id == source_id)
+        saved = await run.finish(
+            db,
+            status="completed",
+            parsed_data=parsed,
+            last_scraped_at=datetime.now(timezone.utc),
+            error_message=None,
         )
-        source = result.scalar_one_or_none()
-        if not source:
-            logger.error(f"Source {source_id} not found")
-            return
 
-        # Step 1: Scraping
-        source.status = "scraping"
-        await db.commit()
+    if saved:
+        logger.info(f"Source {source_id} processing completed")
+    else:
+        logger.info(f"Source {source_id} run {run_id} superseded during parsing; discarding result")
 
-        logger.info(f"Scraping {source.source_url} ({source.platform})")
-        scrape_result = await scrape_url(source.source_url, source.platform)
 
-        if not scrape_result["success"]:
-            source.status = "failed"
-            source.error_message = scrape_result.get("error", "Scraping failed")
-            await db.commit()
-            return
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
 
-        source.scraped_html = scrape_result["raw_html"]
+# 처리 중이거나 처리할 상태 (재시작 시 중간 상태에서 재개)
+_ACTIVE_SOURCE_STATUSES = ("pending", "scraping", "parsing")
 
-        # Step 2: AI Parsing
-        source.status = "parsing"
-        await db.commit()
 
-        logger.info(f"Parsing {source.source_url} with Claude API")
-        parsed_data = await parse_with_ai(
-            scrape_result["cleaned_text"],
-            source.platform,
-            source.source_url,
+async def _claim_source_run(
+    db: AsyncSession, user_id: UUID, source_id: UUID, run_id: UUID, owner: str
+) -> bool:
+    """점유가 없거나 만료된 경우에만 이 실행을 점유하고 scraping 으로 표시합니다."""
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(DataSource)
+        .where(
+            DataSource.id == source_id,
+            DataSource.run_id == run_id,
+            DataSource.status.in_(_ACTIVE_SOURCE_STATUSES),
+            or_(DataSource.lease_until.is_(None), DataSource.lease_until < now),
+        )
+        .values(
+            lease_owner=owner,
+            lease_until=now + timedelta(seconds=settings.PIPELINE_SOURCE_LEASE_SECONDS),
+            status=case(
+                (DataSource.status == "pending", "scraping"),
+                else_=DataSource.status,
+            ),
+        )
+        .returning(DataSource.status)
+    )
+    status = result.scalar_one_or_none()
+    if status is not None:
+        await publish_progress(db, user_id, type="source", source_id=source_id, status=status)
+    await db.commit()
+    return status is not None
+
+
+class _SourceRun:
+    """점유한 실행에 대한 조건부 상태 전이 (실행이 대체되었거나 점유를 잃으면 False)"""
+
+    def __init__(self, user_id: UUID, source_id: UUID, run_id: UUID, owner: str):
+        self.user_id = user_id
+        self.source_id = source_id
+        self.run_id = run_id
+        self.owner = owner
+
+    def _where(self):
+        return (
+            DataSource.id == self.source_id,
+            DataSource.run_id == self.run_id,
+            DataSource.lease_owner == self.owner,
         )
 
-        # Step 3: Save results
-        source.parsed_data = parsed_data
-        source.status = "completed"
-        source.last_scraped_at = datetime.now(timezone.utc)
-        source.error_message = None
+    async def advance(self, db: AsyncSession, **values) -> bool:
+        """상태를 갱신하고 점유를 연장합니다."""
+        lease_until = datetime.now(timezone.utc) + timedelta(
+            seconds=settings.PIPELINE_SOURCE_LEASE_SECONDS
+        )
+        result = await db.execute(
+            update(DataSource).where(*self._where()).values(lease_until=lease_until, **values)
+        )
+        if result.rowcount > 0:
+            await self._publish(db, values)
         await db.commit()
+        return result.rowcount > 0
+
+    async def renew(self) -> None:
+        """상태는 그대로 두고 점유만 연장합니다 (작업 하트비트에서 호출)."""
+        async with async_session() as db:
+            await db.execute(
+                update(DataSource)
+                .where(*self._where())
+                .values(
+                    lease_until=datetime.now(timezone.utc)
+                    + timedelta(seconds=settings.PIPELINE_SOURCE_LEASE_SECONDS)
+                )
+            )
+            await db.commit()
 
-        logger.info(f"Source {source_id} processing completed")
+    async def finish(self, db: AsyncSession, **values) -> bool:
+        """최종 상태를 기록하고 점유와 체크포인트를 정리합니다."""
+        result = await db.execute(
+            update(DataSource)
+            .where(*self._where())
+            .values(lease_owner=None, lease_until=None, **values)
+        )
+        if result.rowcount > 0:
+            await clear_checkpoints(db, self.source_id)
+            await self._publish(db, values)
+        await db.commit()
+        return result.rowcount > 0
+
+    async def _publish(self, db: AsyncSession, values: dict) -> None:
+        if "status" in values:
+            await publish_progress(
+                db,
+                self.user_id,
+                type="source",
+                source_id=self.source_id,
+                status=values["status"],
+                error_message=values.get("error_message"),
+            )
 
 
 async def process_all_sources(user_id: UUID) -> None:
-    """유저의 모든 pending 소스를 처리한 뒤, 스코어링을 실행합니다."""
+    """
+    유저의 처리 대기/중단된 소스를 병렬로 처리한 뒤, 스코어링을 한 번 예약합니다.
+
+    소스별 처리는 TaskGroup 안에서 유저별/전체 동시 실행 한도 내로 병렬 실행되고,
+    한 소스의 실패는 해당 소스만 failed 로 남깁니다. 다른 워커가 처리 중인 소스는
+    끝날 때까지 기다린 뒤 스코어링합니다.
+    """
     async with async_session() as db:
         result = await db.execute(
-            select(DataSource).where(
+            select(DataSource.id, DataSource.run_id).where(
                 DataSource.user_id == user_id,
-                DataSource.status.in_(["pending"]),
+                DataSource.status.in_(_ACTIVE_SOURCE_STATUSES),
             )
         )
-        sources = result.scalars().all()
+        runs = result.all()
+
+    # 스크래핑 + 파싱 (병렬)
+    async with asyncio.TaskGroup() as tg:
+        for source_id, run_id in runs:
+            tg.create_task(_process_source_isolated(user_id, source_id, run_id))
+
+    # 모든 소스가 끝난 뒤 스코어링 예약 (이미 대기 중인 스코어링이 있으면 합쳐짐)
+    async with async_session() as db:
+        await enqueue_scoring(db, user_id, debounce=False)
+        await db.commit()
+
 
-    # 스크래핑 + 파싱
-    for source in sources:
-        await process_source(source.id)
+async def _process_source_isolated(user_id: UUID, source_id: UUID, run_id: UUID) -> None:
+    """동시 실행 한도 안에서 소스를 처리하고, 예외는 해당 소스에만 기록합니다."""
+    async with _user_source_slots.slot(user_id), _global_source_slots:
+        try:
+            with span("process_source", source_id=str(source_id), run_id=str(run_id)):
+                await process_source(source_id, run_id, wait=True)
+        except Exception as e:
+            logger.exception(f"Source {source_id} processing failed")
+            await _mark_source_failed(user_id, source_id, run_id, str(e))
 
-    # 스코어링 실행
-    await run_scoring(user_id)
+
+async def _mark_source_failed(
+    user_id: UUID, source_id: UUID, run_id: UUID, message: str
+) -> None:
+    try:
+        async with async_session() as db:
+            result = await db.execute(
+                update(DataSource)
+                .where(
+                    DataSource.id == source_id,
+                    DataSource.run_id == run_id,
+                    DataSource.status.in_(_ACTIVE_SOURCE_STATUSES),
+                )
+                .values(
+                    status="failed",
+                    error_message=message[:1000],
+                    lease_owner=None,
+                    lease_until=None,
+                )
+            )
+            if result.rowcount > 0:
+                await clear_checkpoints(db, source_id)
+                await publish_progress(
+                    db,
+                    user_id,
+                    type="source",
+                    source_id=source_id,
+                    status="failed",
+                    error_message=message[:1000],
+                )
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Could not mark source {source_id} as failed: {e}")
+
+
+async def _acquire_scoring_lease(user_id: UUID) -> datetime | None:
+    """점유가 없거나 만료된 경우에만 스코어링 점유를 잡고 만료 시각을 반환합니다 (즉시 커밋)."""
+    async with async_session() as db:
+        result = await db.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                or_(User.scoring_lease_until.is_(None), User.scoring_lease_until < func.now()),
+            )
+            .values(
+                scoring_lease_until=func.now() + timedelta(seconds=settings.SCORING_LEASE_SECONDS),
+                updated_at=User.updated_at,
+            )
+            .returning(User.scoring_lease_until)
+        )
+        lease_until = result.scalar_one_or_none()
+        await db.commit()
+    return lease_until
+
+
+class _ScoringLease:
+    """잡은 스코어링 점유 (작업 하트비트마다 연장, 연장된 만료 시각을 추적)"""
+
+    def __init__(self, user_id: UUID, until: datetime):
+        self.user_id = user_id
+        self.until = until
+
+    async def renew(self) -> None:
+        async with async_session() as db:
+            result = await db.execute(
+                update(User)
+                .where(User.id == self.user_id, User.scoring_lease_until == self.until)
+                .values(
+                    scoring_lease_until=func.now()
+                    + timedelta(seconds=settings.SCORING_LEASE_SECONDS),
+                    updated_at=User.updated_at,
+                )
+                .returning(User.scoring_lease_until)
+            )
+            until = result.scalar_one_or_none()
+            await db.commit()
+        if until is None:
+            logger.warning(f"Scoring lease for user {self.user_id} lost")
+        else:
+            self.until = until
+
+
+async def _release_scoring_lease(user_id: UUID, lease_until: datetime) -> None:
+    """내가 잡은 점유일 때만 해제합니다 (만료 후 다른 실행이 다시 잡았으면 그대로 둠)."""
+    try:
+        async with async_session() as db:
+            await db.execute(
+                update(User)
+                .where(User.id == user_id, User.scoring_lease_until == lease_until)
+                .values(scoring_lease_until=None, updated_at=User.updated_at)
+            )
+            await db.commit()
+    except Exception as e:
+        logger.warning(f"Could not release scoring lease for user {user_id}: {e}")
+
+
+async def run_scoring_single_flight(user_id: UUID) -> dict | None:
+    """
+    유저별로 한 번에 하나의 스코어링만 실행합니다 (워커/호스트 전체 기준).
+    다른 실행이 진행 중이면 후속 실행 하나만 예약하고 바로 반환합니다.
+
+    점유는 users.scoring_lease_until 에 짧은 트랜잭션으로 기록하므로
+    스코어링(LLM 호출) 동안 풀 연결을 잡고 있지 않습니다. 작업 하트비트마다
+    연장되고, LLM 단계는 모두 제한 시간이 있어 실행이 점유보다 길어지지 않습니다.
+    """
+    lease_until = await _acquire_scoring_lease(user_id)
+    if lease_until is not None:
+        lease = _ScoringLease(user_id, lease_until)
+        try:
+            with renew_with_heartbeat(lease.renew):
+                return await run_scoring(user_id)
+        finally:
+            await _release_scoring_lease(user_id, lease.until)
+
+    async with async_session() as db:
+        queued = await enqueue_scoring(db, user_id)
+        await db.commit()
+    logger.info(
+        f"Scoring for user {user_id} already running; "
+        f"{'scheduled follow-up' if queued else 'follow-up already queued'}"
+    )
+    return None
 
 
 async def run_scoring(user_id: UUID) -> dict | None:
     """
     유저의 모든 completed 소스 데이터를 기반으로 5대 영역 스코어링을 실행합니다.
+    입력 지문이 최신 스코어와 같으면 LLM 호출/DB 쓰기 없이 건너뜁니다.
 
-    1. parsed_data 수집
-    2. 규칙 기반 정량 스코어 산출
-    3. Claude API 정성 분석 보정
-    4. 연봉 범위 산출
-    5. CareerScore + ScoreHistory 저장
+    Phase 1 (provisional): 규칙 기반 점수 + 기본 연봉을 즉시 저장
+    Phase 2 (final): Claude 보정을 제한 시간 안에 적용해 같은 스코어를 갱신
+                     (시간 초과/실패 시 provisional 점수를 유지하고 fallback 으로 확정)
+    이후 액션 추천 생성 (최종 스코어 저장과 병렬, 제한 시간 초과 시 건너뜀)
+
+    소스 데이터는 ProfileSnapshot 으로 한 번만 집계해 모든 단계가 공유합니다.
+    LLM 호출 동안에는 DB 세션을 닫아 커넥션을 반납합니다.
     """
     async with async_session() as db:
         # 유저 정보 조회
@@ -129,115 +511,232 @@ async def run_scoring(user_id: UUID) -> dict | None:
             return None
 
         sources_data = [s.parsed_data for s in sources if s.parsed_data]
+        job_category = user.job_category or "other"
+        years = user.years_of_experience or 0
+        snapshot = ProfileSnapshot.build(sources_data, job_category, years, user_id=user_id)
+
+        # 입력이 그대로면 최신 스코어 재사용 (보정까지 끝난 final 만, fallback 은 다시 보정)
+        fingerprint = scoring_fingerprint(sources_data, job_category, years)
+        latest_result = await db.execute(
+            select(CareerScore.id, CareerScore.input_fingerprint, CareerScore.phase)
+            .where(CareerScore.id == user.latest_score_id)
+        )
+        latest = latest_result.first()
+        if (
+            latest
+            and latest.input_fingerprint == fingerprint
+            and latest.phase == "final"
+        ):
+            logger.info(
+                f"Scoring skipped for user {user_id}: inputs unchanged "
+                f"(score {latest.id})"
+            )
+            await publish_progress(
+                db, user_id, type="scoring", phase="skipped", score_id=latest.id
+            )
+            await db.commit()
+            return {"skipped": True, "score_id": str(latest.id)}
 
         # Step 1: 규칙 기반 정량 스코어
-        scorer = CareerScorer(
-            sources_data=sources_data,
-            job_category=user.job_category or "other",
-            years_of_experience=user.years_of_experience or 0,
-        )
-        base_scores = scorer.calculate_all()
+        scorer = CareerScorer.from_snapshot(snapshot)
+        with stage_timer("rule_scoring"):
+            base_scores = scorer.calculate_all()
         logger.info(f"Base scores for user {user_id}: {base_scores}")
 
-        # Step 2: Claude API 정성 분석 보정
-        calibration = await get_ai_calibration(
-            sources_data=sources_data,
-            scores=base_scores,
-            job_category=user.job_category or "other",
-            years=user.years_of_experience or 0,
-        )
-
-        # Step 3: 보정 적용
-        adjustments = calibration.get("adjustments", {})
-        final_scores = {}
-        for area in ["expertise", "influence", "consistency", "marketability", "potential"]:
-            adj = adjustments.get(area, 0)
-            final_scores[area] = round(
-                max(0, min(100, base_scores[area] + adj)), 1
-            )
-
-        # 종합 점수 재계산
-        weights = {
-            "expertise": 0.25,
-            "influence": 0.20,
-            "consistency": 0.20,
-            "marketability": 0.20,
-            "potential": 0.15,
-        }
-        final_scores["total"] = round(
-            sum(final_scores[k] * weights[k] for k in weights), 1
-        )
-        final_scores["analysis_accuracy"] = base_scores.get("analysis_accuracy", 30)
-
-        # Step 4: 연봉 산출
-        salary_adj = calibration.get("salary_adjustment_percent", 0)
-        salary_min, salary_max = calculate_salary(
-            base_scores=final_scores,
-            job_category=user.job_category or "other",
-            years=user.years_of_experience or 0,
-            salary_adjustment_percent=salary_adj,
-        )
-
-        # Step 5: AI 인사이트 통합
-        insights = calibration.get("insights", {})
-        insights["base_scores"] = base_scores
-        insights["adjustments"] = adjustments
-        insights["market_position_percentile"] = calibration.get(
-            "market_position_percentile", 50
+        # Phase 1: 보정 없이 즉시 저장 (provisional)
+        provisional = _apply_calibration(
+            base_scores,
+            generate_default_calibration(base_scores, job_category, years),
+            job_category,
+            years,
         )
-
-        # Step 6: CareerScore 저장
         now = datetime.now(timezone.utc)
         career_score = CareerScore(
             id=uuid.uuid4(),
             user_id=user_id,
-            expertise_score=final_scores["expertise"],
-            influence_score=final_scores["influence"],
-            consistency_score=final_scores["consistency"],
-            marketability_score=final_scores["marketability"],
-            potential_score=final_scores["potential"],
-            total_score=final_scores["total"],
-            estimated_salary_min=salary_min,
-            estimated_salary_max=salary_max,
-            analysis_accuracy=final_scores["analysis_accuracy"],
-            ai_insights=insights,
+            phase="provisional",
+            input_fingerprint=fingerprint,
             scored_at=now,
             created_at=now,
         )
+        _fill_score(career_score, provisional)
         db.add(career_score)
+        # 포인터의 FK 대상이 먼저 있어야 하므로 스코어 행을 먼저 기록
+        await db.flush()
+        await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(latest_score_id=career_score.id, updated_at=User.updated_at)
+        )
 
-        # Step 7: ScoreHistory 저장
-        snapshot = {
-            **final_scores,
-            "salary_min": salary_min,
-            "salary_max": salary_max,
-        }
         score_history = ScoreHistory(
             id=uuid.uuid4(),
             user_id=user_id,
             score_id=career_score.id,
-            snapshot=snapshot,
+            snapshot=_history_snapshot(provisional),
             created_at=now,
         )
         db.add(score_history)
-
+        await update_member(
+            db, user_id, user.job_category, user.years_of_experience,
+            career_score.id, area_scores(career_score),
+        )
+        await publish_progress(
+            db, user_id, type="scoring", phase="provisional", score_id=career_score.id
+        )
         await db.commit()
-
+        await invalidate_scores(user_id, user.job_category)
         logger.info(
-            f"Scoring completed for user {user_id}: "
-            f"total={final_scores['total']}, "
-            f"salary={salary_min}~{salary_max}만원"
+            f"Provisional score for user {user_id}: total={provisional['scores']['total']}"
         )
 
-    # Step 8: 액션 추천 생성 (별도 세션)
+    # Phase 2: Claude API 정성 분석 보정 (제한 시간, 커넥션 없음)
     try:
-        await generate_actions(user_id, career_score.id)
+        with llm_context(user_id=user_id, stage="calibration"), stage_timer("calibration"):
+            calibration = await asyncio.wait_for(
+                get_ai_calibration(snapshot=snapshot, scores=base_scores),
+                timeout=settings.SCORING_CALIBRATION_TIMEOUT_SECONDS,
+            )
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Calibration for user {user_id} exceeded "
+            f"{settings.SCORING_CALIBRATION_TIMEOUT_SECONDS}s; keeping provisional scores"
+        )
+        calibration = None
+    if calibration is None:
+        # 시간 초과 / API 실패 / 키 없음: 기본 보정을 final 로 저장하지 않음 (다음 실행에서 재보정)
+        result = provisional
+        phase = "fallback"
+    else:
+        result = _apply_calibration(base_scores, calibration, job_category, years)
+        phase = "final"
+
+    # 액션 추천은 최종 점수/인사이트만 있으면 되므로 저장과 병렬로 시작
+    with llm_context(user_id=user_id, stage="actions"):
+        actions_task = asyncio.create_task(plan_actions(snapshot, result))
+
+    try:
+        async with async_session() as db:
+            db.add(career_score)
+            db.add(score_history)
+            _fill_score(career_score, result)
+            career_score.phase = phase
+            score_history.snapshot = _history_snapshot(result)
+            await update_member(
+                db, user_id, user.job_category, user.years_of_experience,
+                career_score.id, area_scores(career_score),
+            )
+            await publish_progress(
+                db, user_id, type="scoring", phase=phase, score_id=career_score.id
+            )
+            await db.commit()
+    except BaseException:
+        # 저장되지 않은 스코어의 액션 생성(LLM 호출)은 중단
+        actions_task.cancel()
+        raise
+    await invalidate_scores(user_id, user.job_category)
+
+    logger.info(
+        f"Scoring completed for user {user_id} ({phase}): "
+        f"total={result['scores']['total']}, "
+        f"salary={result['salary_min']}~{result['salary_max']}만원"
+    )
+
+    # 액션 추천 저장 (스코어 id 재사용, 제한 시간 초과 시 생성 취소)
+    try:
+        actions = await asyncio.wait_for(
+            actions_task, timeout=settings.SCORING_ACTIONS_TIMEOUT_SECONDS
+        )
+        async with async_session() as db:
+            save_actions(db, user_id, career_score.id, actions)
+            await bump_actions_version(db, user_id)
+            await publish_progress(
+                db, user_id, type="actions", score_id=career_score.id, count=len(actions)
+            )
+            await db.commit()
+        logger.info(f"Generated {len(actions)} actions for user {user_id}")
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Action generation for user {user_id} exceeded "
+            f"{settings.SCORING_ACTIONS_TIMEOUT_SECONDS}s; skipping actions"
+        )
     except Exception as e:
         logger.error(f"Action generation failed for user {user_id}: {e}")
 
+    return {**result, "phase": phase}
+
+
+def _apply_calibration(
+    base_scores: dict,
+    calibration: dict,
+    job_category: str,
+    years: int,
+) -> dict:
+    """규칙 기반 점수에 보정값을 적용하고 연봉/인사이트를 산출합니다."""
+    # 보정 적용
+    adjustments = calibration.get("adjustments", {})
+    final_scores = {}
+    for area in ["expertise", "influence", "consistency", "marketability", "potential"]:
+        adj = adjustments.get(area, 0)
+        final_scores[area] = round(
+            max(0, min(100, base_scores[area] + adj)), 1
+        )
+
+    # 종합 점수 재계산
+    weights = {
+        "expertise": 0.25,
+        "influence": 0.20,
+        "consistency": 0.20,
+        "marketability": 0.20,
+        "potential": 0.15,
+    }
+    final_scores["total"] = round(
+        sum(final_scores[k] * weights[k] for k in weights), 1
+    )
+    final_scores["analysis_accuracy"] = base_scores.get("analysis_accuracy", 30)
+
+    # 연봉 산출
+    with stage_timer("salary"):
+        salary_min, salary_max = calculate_salary(
+            base_scores=final_scores,
+            job_category=job_category,
+            years=years,
+            salary_adjustment_percent=calibration.get("salary_adjustment_percent", 0),
+        )
+
+    # AI 인사이트 통합
+    insights = dict(calibration.get("insights", {}))
+    insights["base_scores"] = base_scores
+    insights["adjustments"] = adjustments
+    insights["market_position_percentile"] = calibration.get(
+        "market_position_percentile", 50
+    )
+
     return {
         "scores": final_scores,
         "salary_min": salary_min,
         "salary_max": salary_max,
         "insights": insights,
     }
+
+
+def _fill_score(career_score: CareerScore, result: dict) -> None:
+    scores = result["scores"]
+    career_score.expertise_score = scores["expertise"]
+    career_score.influence_score = scores["influence"]
+    career_score.consistency_score = scores["consistency"]
+    career_score.marketability_score = scores["marketability"]
+    career_score.potential_score = scores["potential"]
+    career_score.total_score = scores["total"]
+    career_score.analysis_accuracy = scores["analysis_accuracy"]
+    career_score.estimated_salary_min = result["salary_min"]
+    career_score.estimated_salary_max = result["salary_max"]
+    career_score.ai_insights = result["insights"]
+
+
+def _history_snapshot(result: dict) -> dict:
+    return {
+        **result["scores"],
+        "salary_min": result["salary_min"],
+        "salary_max": result["salary_max"],
+    }
@@ -0,0 +1,59 @@
+"""
+파이프라인 단계별 체크포인트
+- 소스 + 실행(run_id) + 단계 단위 멱등 키로 산출물 저장 (scrape, parse)
+- 재시작된 파이프라인은 마지막으로 완료된 단계 다음부터 재개 (유료 LLM 호출 재실행 없음)
+- 소스 처리가 끝나면 해당 소스의 체크포인트를 정리
+"""
+
+from uuid import UUID
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.pipeline_checkpoint import PipelineCheckpoint
+
+STAGE_SCRAPE = "scrape"
+STAGE_PARSE = "parse"
+
+
+def idempotency_key(source_id: UUID, run_id: UUID, stage: str) -> str:
+    return f"{source_id}:{run_id}:{stage}"
+
+
+async def load_checkpoints(db: AsyncSession, source_id: UUID, run_id: UUID) -> dict[str, dict]:
+    """이 실행에서 완료된 단계 → 산출물"""
+    result = await db.execute(
+        select(PipelineCheckpoint.stage, PipelineCheckpoint.artifact).where(
+            PipelineCheckpoint.source_id == source_id,
+            PipelineCheckpoint.run_id == run_id,
+        )
+    )
+    return {row.stage: row.artifact for row in result.all()}
+
+
+async def save_checkpoint(
+    db: AsyncSession,
+    source_id: UUID,
+    run_id: UUID,
+    stage: str,
+    artifact: dict,
+) -> None:
+    """같은 멱등 키가 이미 있으면 무시합니다. 커밋은 호출자가 합니다."""
+    await db.execute(
+        insert(PipelineCheckpoint)
+        .values(
+            source_id=source_id,
+            run_id=run_id,
+            stage=stage,
+            idempotency_key=idempotency_key(source_id, run_id, stage),
+            artifact=artifact,
+        )
+        .on_conflict_do_nothing(index_elements=["idempotency_key"])
+    )
+
+
+async def clear_checkpoints(db: AsyncSession, source_id: UUID) -> None:
+    await db.execute(
+        delete(PipelineCheckpoint).where(PipelineCheckpoint.source_id == source_id)
+    )
@@ -0,0 +1,87 @@
+"""
+대시보드 집계
+- 소스 / 최신 스코어 + 직군 통계 / 히스토리 / 미완료 액션을 한 번에 조회
+- 최신 스코어와 직군 분포는 공유 캐시(score_cache)에서 동시에 읽음 (대부분 연결 불필요)
+- 소스 / 히스토리 / 액션은 인덱스 조회라 세션 하나에서 차례로 실행 (요청당 풀 연결 1개)
+- 응답 본문 해시로 ETag 생성 (변경 없으면 304)
+"""
+
+import asyncio
+import hashlib
+import json
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session
+from app.models.data_source import DataSource
+from app.models.score_history import ScoreHistory
+from app.models.user import User
+from app.services import action_list, score_cache, score_distribution
+from app.services.serializers import (
+    serialize_action,
+    serialize_history,
+    serialize_market_position,
+    serialize_source,
+)
+
+HISTORY_LIMIT = 20
+
+
+async def _sources(db: AsyncSession, user: User) -> list[dict]:
+    result = await db.execute(
+        select(DataSource)
+        .where(DataSource.user_id == user.id)
+        .order_by(DataSource.created_at.desc())
+    )
+    return [serialize_source(s) for s in result.scalars().all()]
+
+
+async def _score_and_position(user: User) -> tuple[dict, dict | None]:
+    score, distribution = await asyncio.gather(
+        score_cache.get_latest_score(user.id),
+        score_cache.get_distribution(user.job_category),
+    )
+    if not score["has_score"]:
+        return score, None
+    position = score_distribution.position(
+        distribution, user.years_of_experience, score["scores"]
+    )
+    return score, serialize_market_position(user, score, position)
+
+
+async def _history(db: AsyncSession, user: User) -> list[dict]:
+    result = await db.execute(
+        select(ScoreHistory)
+        .where(ScoreHistory.user_id == user.id)
+        .order_by(desc(ScoreHistory.created_at))
+        .limit(HISTORY_LIMIT)
+    )
+    return [serialize_history(h) for h in result.scalars().all()]
+
+
+async def _open_actions(db: AsyncSession, user: User, limit: int) -> list[dict]:
+    actions, _ = await action_list.list_actions(
+        db, user.id, sort="impact", completed=False, limit=limit
+    )
+    return [serialize_action(a) for a in actions]
+
+
+async def load_dashboard(user: User, actions_limit: int) -> dict:
+    score, position = await _score_and_position(user)
+    async with async_session() as db:
+        sources = await _sources(db, user)
+        history = await _history(db, user)
+        actions = await _open_actions(db, user, actions_limit)
+    return {
+        "sources": sources,
+        "score": score,
+        "market_position": position,
+        "history": history,
+        "actions": actions,
+    }
+
+
+def etag_for(payload: dict) -> str:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
@@ -0,0 +1,298 @@
+"""
+Postgres 기반 작업 큐
+- API 는 jobs 테이블에 작업을 넣기만 하고, 실행은 별도 워커 프로세스(app.worker)가 담당
+- FOR UPDATE SKIP LOCKED 로 여러 워커/호스트가 같은 작업을 중복 점유하지 않음
+- 점유 시 visibility timeout(locked_until) 설정, 워커가 죽으면 만료 후 다른 워커가 재점유
+- 실패 시 지수 백오프로 재시도, max_attempts 초과 시 failed
+- dedupe_key 로 같은 작업은 대기열에 하나만 유지 (스코어링 single-flight)
+- 작업이 잡은 다른 점유(소스 실행 등)는 하트비트마다 함께 연장 (renew_with_heartbeat)
+- 아직 실행할 수 없는 작업은 JobDeferred 로 시도 횟수를 쓰지 않고 나중으로 미룸
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Iterator
+from uuid import UUID
+
+from sqlalchemy import select, update, or_, and_, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.tracing import current_traceparent
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류 → 큐
+JOB_QUEUES: dict[str, str] = {
+    "process_all_sources": "pipeline",
+    "process_source": "sources",
+    "run_scoring": "scoring",
+}
+
+
+LeaseRenewal = Callable[[], Awaitable[None]]
+
+# 실행 중인 작업의 하트비트가 함께 연장할 점유 (워커가 작업마다 설정)
+heartbeat_renewals: ContextVar[set[LeaseRenewal] | None] = ContextVar(
+    "heartbeat_renewals", default=None
+)
+
+
+class JobDeferred(Exception):
+    """다른 실행이 점유 중이라 지금은 진행할 수 없는 작업 (run_at 에 다시 실행)"""
+
+    def __init__(self, run_at: datetime, reason: str):
+        super().__init__(reason)
+        self.run_at = run_at
+
+
+@contextmanager
+def renew_with_heartbeat(renew: LeaseRenewal) -> Iterator[None]:
+    """
+    블록 동안 renew 를 작업 하트비트에 등록합니다.
+    작업 점유와 같은 주기로 연장되므로 워커가 죽으면 두 점유가 함께 만료됩니다.
+    작업 밖(직접 호출)에서는 아무것도 하지 않습니다.
+    """
+    renewals = heartbeat_renewals.get()
+    if renewals is None:
+        yield
+        return
+    renewals.add(renew)
+    try:
+        yield
+    finally:
+        renewals.discard(renew)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """attempts 번째 실패 후 다음 실행까지의 지연 (지수 백오프, 상한 있음)"""
+    seconds = settings.JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_MAX_SECONDS))
+
+
+async def enqueue(
+    db: AsyncSession,
+    kind: str,
+    payload: dict,
+    run_at: datetime | None = None,
+    max_attempts: int | None = None,
+) -> Job:
+    """
+    작업을 세션에 추가합니다. 커밋은 호출자가 하므로
+    API 의 상태 변경과 작업 등록이 같은 트랜잭션으로 묶입니다.
+    """
+    job = Job(
+        queue=JOB_QUEUES[kind],
+        kind=kind,
+        payload=_with_trace(payload),
+        status="queued",
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=run_at or datetime.now(timezone.utc),
+    )
+    db.add(job)
+    return job
+
+
+async def enqueue_once(
+    db: AsyncSession,
+    kind: str,
+    payload: dict,
+    dedupe_key: str,
+    run_at: datetime | None = None,
+) -> bool:
+    """
+    같은 dedupe_key 로 대기 중인 작업이 없을 때만 등록합니다.
+    이미 있으면 그 작업에 합쳐지며 False 를 반환합니다. 커밋은 호출자가 합니다.
+    """
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        insert(Job)
+        .values(
+            queue=JOB_QUEUES[kind],
+            kind=kind,
+            payload=_with_trace(payload),
+            status="queued",
+            attempts=0,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+            run_at=run_at or now,
+            dedupe_key=dedupe_key,
+            created_at=now,
+            updated_at=now,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["dedupe_key"],
+            index_where=Job.status == "queued",
+        )
+        .returning(Job.id)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+def _with_trace(payload: dict) -> dict:
+    """현재 trace 를 작업 payload 에 실어 워커에서 이어지게 합니다."""
+    traceparent = current_traceparent()
+    return {**payload, "traceparent": traceparent} if traceparent else payload
+
+
+def scoring_key(user_id: UUID) -> str:
+    return f"run_scoring:{user_id}"
+
+
+async def enqueue_scoring(db: AsyncSession, user_id: UUID, debounce: bool = True) -> bool:
+    """
+    유저 스코어링을 예약합니다. debounce 시 잠시 뒤에 실행해
+    그 사이 들어오는 트리거(연속 클릭 등)를 한 번의 실행으로 합칩니다.
+    """
+    delay = settings.SCORING_DEBOUNCE_SECONDS if debounce else 0
+    return await enqueue_once(
+        db,
+        "run_scoring",
+        {"user_id": str(user_id)},
+        dedupe_key=scoring_key(user_id),
+        run_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
+    )
+
+
+def claim_statement(queue: str, worker_id: str, limit: int, now: datetime):
+    """실행 가능한(대기 중이거나 점유가 만료된) 작업을 limit 개까지 점유하는 UPDATE 문"""
+    claimable = (
+        select(Job.id)
+        .where(
+            Job.queue == queue,
+            or_(
+                and_(Job.status == "queued", Job.run_at <= now),
+                and_(Job.status == "running", Job.locked_until < now),
+            ),
+        )
+        .order_by(Job.run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(Job)
+        .where(Job.id.in_(claimable.scalar_subquery()))
+        .values(
+            status="running",
+            attempts=Job.attempts + 1,
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT_SECONDS),
+            updated_at=now,
+        )
+        .returning(Job)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def claim(queue: str, worker_id: str, limit: int) -> list[Job]:
+    async with async_session() as db:
+        result = await db.execute(
+            claim_statement(queue, worker_id, limit, datetime.now(timezone.utc))
+        )
+        jobs = list(result.scalars().all())
+        await db.commit()
+        return jobs
+
+
+async def queue_depths() -> dict[tuple[str, str], int]:
+    """(queue, status) → 작업 수 (done 제외)"""
+    async with async_session() as db:
+        result = await db.execute(
+            select(Job.queue, Job.status, func.count())
+            .where(Job.status != "done")
+            .group_by(Job.queue, Job.status)
+        )
+        return {(queue, status): count for queue, status, count in result.all()}
+
+
+async def extend_lease(job_id: UUID, worker_id: str) -> bool:
+    """실행 중인 작업의 점유 시간을 연장합니다. 점유를 잃었으면 False."""
+    now = datetime.now(timezone.utc)
+    async with async_session() as db:
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == "running")
+            .values(
+                locked_until=now + timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT_SECONDS),
+                updated_at=now,
+            )
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+
+async def complete(job_id: UUID, worker_id: str) -> None:
+    async with async_session() as db:
+        await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id)
+            .values(
+                status="done",
+                locked_until=None,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+
+
+async def defer(job: Job, worker_id: str, run_at: datetime, reason: str) -> None:
+    """작업을 run_at 까지 미룹니다. 이번 점유는 시도 횟수에 넣지 않습니다."""
+    async with async_session() as db:
+        await db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.locked_by == worker_id)
+            .values(
+                status="queued",
+                attempts=Job.attempts - 1,
+                run_at=run_at,
+                last_error=reason[:2000],
+                locked_until=None,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+    logger.info(f"Job {job.kind} {job.id} deferred until {run_at.isoformat()}: {reason}")
+
+
+async def fail(job: Job, worker_id: str, error: str) -> None:
+    """재시도 가능하면 백오프 후 다시 queued, 아니면 failed 로 기록합니다."""
+    now = datetime.now(timezone.utc)
+    exhausted = job.attempts >= job.max_attempts
+    values = {
+        "status": "failed" if exhausted else "queued",
+        "last_error": error[:2000],
+        "locked_until": None,
+        "updated_at": now,
+    }
+    if not exhausted:
+        values["run_at"] = now + retry_delay(job.attempts)
+
+    async with async_session() as db:
+        try:
+            await db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.locked_by == worker_id)
+                .values(**values)
+            )
+            await db.commit()
+        except IntegrityError:
+            # 같은 dedupe_key 의 작업이 이미 대기 중이면 재시도는 그 작업에 맡김
+            await db.rollback()
+            await db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.locked_by == worker_id)
+                .values(status="done", last_error=error[:2000], locked_until=None, updated_at=now)
+            )
+            await db.commit()
+            logger.info(f"Job {job.kind} {job.id} retry coalesced into queued duplicate")
+            return
+
+    if exhausted:
+        logger.error(f"Job {job.kind} {job.id} failed after {job.attempts} attempts: {error}")
+    else:
+        logger.warning(f"Job {job.kind} {job.id} attempt {job.attempts} failed, retrying: {error}")
@@ -0,0 +1,223 @@
+"""
+스트리밍 LLM 응답용 점진적 JSON 파서
+- 토큰이 도착하는 대로 최상위 객체 구조를 검증
+- 스키마를 벗어나면 즉시 SchemaViolation 발생 (조기 중단)
+- 최상위 필드가 닫히는 즉시 (key, value) 를 반환
+"""
+
+import json
+from typing import Any
+
+_VALUE_STARTS = set('{["-0123456789tfn')
+_CLOSERS = {"}": "{", "]": "["}
+
+# 파서 상태
+_PRE = "pre"
+_FENCE = "fence"
+_KEY = "key"
+_KEY_STR = "key_str"
+_COLON = "colon"
+_VALUE = "value"
+_DONE = "done"
+
+
+class SchemaViolation(ValueError):
+    """스트리밍 중인 출력이 기대한 JSON 구조를 벗어났을 때 발생"""
+
+
+class IncrementalJSONParser:
+    """
+    최상위 JSON 객체를 청크 단위로 받아 점진적으로 검증합니다.
+
+    Args:
+        field_types: 필드별 허용 타입 (None 은 항상 허용)
+        required: 반드시 존재해야 하는 최상위 필드
+        allow_extra: field_types 에 없는 필드 허용 여부
+    """
+
+    def __init__(
+        self,
+        field_types: dict[str, type | tuple[type, ...]] | None = None,
+        required: set[str] | None = None,
+        allow_extra: bool = True,
+    ):
+        self.field_types = field_types or {}
+        self.required = required or set()
+        self.allow_extra = allow_extra
+        self.fields: dict[str, Any] = {}
+
+        self._state = _PRE
+        self._fence = ""
+        self._key_buf: list[str] = []
+        self._key: str | None = None
+        self._value_buf: list[str] = []
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._seen_fields = 0
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """청크를 소비하고 이번 청크에서 완성된 최상위 필드를 반환합니다."""
+        completed: list[tuple[str, Any]] = []
+        for ch in chunk:
+            if self._state == _DONE:
+                break
+            field = self._step(ch)
+            if field is not None:
+                completed.append(field)
+        return completed
+
+    def result(self) -> dict:
+        """파싱이 끝난 전체 객체를 반환합니다. 미완성이면 SchemaViolation."""
+        if self._state != _DONE:
+            raise SchemaViolation("Output ended before the JSON object was closed")
+        missing = self.required - self.fields.keys()
+        if missing:
+            raise SchemaViolation(f"Missing required fields: {sorted(missing)}")
+        return dict(self.fields)
+
+    # ── 내부 상태 머신 ──
+
+    def _step(self, ch: str) -> tuple[str, Any] | None:
+        state = self._state
+
+        if state == _PRE:
+            if ch.isspace():
+                return None
+            if ch == "`":
+                self._state = _FENCE
+                self._fence = ch
+                return None
+            if ch == "{":
+                self._state = _KEY
+                return None
+            raise SchemaViolation(f"Expected '{{' at start of output, got {ch!r}")
+
+        if state == _FENCE:
+            # ```json 또는 ``` 코드 펜스 헤더만 허용
+            if ch == "\n":
+                if self._fence.strip() not in ("```", "```json"):
+                    raise SchemaViolation(f"Unexpected preamble {self._fence!r}")
+                self._state = _PRE
+                return None
+            self._fence += ch
+            if len(self._fence) > 16:
+                raise SchemaViolation("Code fence header too long")
+            return None
+
+        if state == _KEY:
+            if ch.isspace():
+                return None
+            if ch == '"':
+                self._state = _KEY_STR
+                self._key_buf = []
+                return None
+            if ch == "}" and self._seen_fields == 0:
+                self._state = _DONE
+                return None
+            raise SchemaViolation(f"Expected field name, got {ch!r}")
+
+        if state == _KEY_STR:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._key = json.loads('"' + "".join(self._key_buf) + '"')
+                self._check_key(self._key)
+                self._state = _COLON
+                return None
+            self._key_buf.append(ch)
+            return None
+
+        if state == _COLON:
+            if ch.isspace():
+                return None
+            if ch == ":":
+                self._state = _VALUE
+                self._value_buf = []
+                self._stack = []
+                return None
+            raise SchemaViolation(f"Expected ':' after {self._key!r}, got {ch!r}")
+
+        # _VALUE
+        return self._step_value(ch)
+
+    def _step_value(self, ch: str) -> tuple[str, Any] | None:
+        if self._in_string:
+            self._value_buf.append(ch)
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+            return None
+
+        if not self._value_buf and ch.isspace():
+            return None
+
+        if not self._value_buf:
+            self._check_value_start(ch)
+
+        if not self._stack and ch in ",}":
+            field = self._finish_value()
+            self._state = _DONE if ch == "}" else _KEY
+            return field
+
+        if ch == '"':
+            self._in_string = True
+        elif ch in "{[":
+            self._stack.append(ch)
+        elif ch in _CLOSERS:
+            if not self._stack or self._stack.pop() != _CLOSERS[ch]:
+                raise SchemaViolation(f"Mismatched {ch!r} in field {self._key!r}")
+
+        self._value_buf.append(ch)
+        return None
+
+    def _check_key(self, key: str) -> None:
+        if key in self.fields:
+            raise SchemaViolation(f"Duplicate field {key!r}")
+        if not self.allow_extra and key not in self.field_types:
+            raise SchemaViolation(f"Unexpected field {key!r}")
+
+    def _check_value_start(self, ch: str) -> None:
+        if ch not in _VALUE_STARTS and ch != '"':
+            raise SchemaViolation(f"Invalid value start {ch!r} for {self._key!r}")
+        expected = self.field_types.get(self._key)
+        if expected is None or ch == "n":
+            return
+        # 첫 글자만으로 컨테이너 타입 불일치를 조기에 감지
+        types = expected if isinstance(expected, tuple) else (expected,)
+        if ch == "[" and list not in types:
+            raise SchemaViolation(f"Field {self._key!r} must not be an array")
+        if ch == "{" and dict not in types:
+            raise SchemaViolation(f"Field {self._key!r} must not be an object")
+        if ch not in "[{" and types in ((list,), (dict,)):
+            raise SchemaViolation(f"Field {self._key!r} must be {types[0].__name__}")
+
+    def _finish_value(self) -> tuple[str, Any]:
+        raw = "".join(self._value_buf).strip()
+        if not raw:
+            raise SchemaViolation(f"Empty value for {self._key!r}")
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise SchemaViolation(f"Invalid JSON in field {self._key!r}: {e}") from e
+
+        expected = self.field_types.get(self._key)
+        if expected is not None and value is not None and not isinstance(value, expected):
+            raise SchemaViolation(
+                f"Field {self._key!r} has type {type(value).__name__}"
+            )
+
+        key = self._key
+        self.fields[key] = value
+        self._seen_fields += 1
+        self._key = None
+        return key, value
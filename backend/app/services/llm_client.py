@@ -0,0 +1,170 @@
+"""
+Claude API 스트리밍 호출 공통 모듈
+- tool_use 로 JSON Schema 가 강제된 구조화 출력 요청
+- 응답을 스트리밍으로 받아 점진적으로 JSON 검증
+- 스키마 이탈 시 생성 중단 후 재시도
+- 완성된 최상위 필드를 콜백으로 즉시 전달
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+from anthropic import AsyncAnthropic
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.tracing import end_span, start_span
+from app.schemas.structured import StructuredOutput
+from app.services.json_stream import IncrementalJSONParser, SchemaViolation
+from app.services.llm_ledger import record_llm_call
+
+logger = logging.getLogger(__name__)
+
+client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+
+# 워커 프로세스 내 동시 LLM 호출 수 제한 (parse / calibration / actions 공통)
+_llm_slots = asyncio.Semaphore(settings.WORKER_LLM_CONCURRENCY)
+
+MODEL = "claude-sonnet-4-5-20250929"
+TOOL_NAME = "record_result"
+
+FieldCallback = Callable[[str, Any], Awaitable[None] | None]
+M = TypeVar("M", bound=StructuredOutput)
+
+
+class LLMOutputError(Exception):
+    """재시도 후에도 유효한 JSON 응답을 받지 못했을 때 발생"""
+
+
+async def stream_json(
+    system: str,
+    prompt: str,
+    max_tokens: int,
+    field_types: dict[str, type | tuple[type, ...]] | None = None,
+    required: set[str] | None = None,
+    allow_extra: bool = True,
+    on_field: FieldCallback | None = None,
+    max_attempts: int = 2,
+    tool: dict | None = None,
+    validate: Callable[[dict], Any] | None = None,
+    label: str = "llm",
+) -> Any:
+    """
+    Claude 응답을 스트리밍하며 JSON 객체를 점진적으로 파싱합니다.
+
+    스키마를 벗어나는 순간 스트림을 끊고 재시도하므로, 잘못된 응답이
+    max_tokens 까지 생성되기를 기다리지 않습니다. on_field 는 최상위 필드가
+    닫힐 때마다 호출되며, 재시도 시 같은 필드가 다시 전달될 수 있습니다.
+
+    tool 을 넘기면 해당 tool 호출을 강제하고 tool 입력 JSON 을 스트리밍합니다.
+    validate 는 완성된 객체를 받아 최종 결과를 반환하며, 예외 시 재시도합니다.
+    시도마다 토큰/지연시간/결과를 LLM 원장에 기록합니다.
+    """
+    request: dict[str, Any] = {
+        "model": MODEL,
+        "max_tokens": max_tokens,
+        "system": system,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    if tool is not None:
+        request["tools"] = [tool]
+        request["tool_choice"] = {"type": "tool", "name": tool["name"]}
+
+    last_error: Exception | None = None
+
+    for attempt in range(1, max_attempts + 1):
+        parser = IncrementalJSONParser(field_types, required, allow_extra)
+        usage = {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        async with _llm_slots:
+            llm_span = start_span("llm.stream", label=label, attempt=attempt)
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                async with client.messages.stream(**request) as stream:
+                    async for event in stream:
+                        if event.type == "message_start":
+                            msg_usage = event.message.usage
+                            usage["input_tokens"] = msg_usage.input_tokens
+                            usage["cached_tokens"] = msg_usage.cache_read_input_tokens or 0
+                            continue
+                        if event.type == "message_delta":
+                            usage["output_tokens"] = event.usage.output_tokens
+                            continue
+                        if tool is not None:
+                            if event.type != "input_json":
+                                continue
+                            chunk = event.partial_json
+                        else:
+                            if event.type != "text":
+                                continue
+                            chunk = event.text
+
+                        for key, value in parser.feed(chunk):
+                            if on_field is not None:
+                                maybe = on_field(key, value)
+                                if maybe is not None:
+                                    await maybe
+                        if parser.done and tool is None:
+                            # 객체가 닫히면 남은 텍스트 토큰은 받지 않음
+                            # (tool 모드는 곧바로 종료되므로 usage 이벤트까지 소비)
+                            break
+                result = validate(parser.result()) if validate is not None else parser.result()
+                outcome = "ok"
+                return result
+            except (SchemaViolation, ValidationError) as e:
+                outcome = "rejected"
+                last_error = e
+                logger.warning(
+                    f"LLM {label} output rejected (attempt {attempt}/{max_attempts}): {e}"
+                )
+            finally:
+                latency = time.perf_counter() - started
+                if llm_span is not None:
+                    llm_span.set(outcome=outcome, model=MODEL, **usage)
+                    end_span(llm_span)
+                logger.info(
+                    f"LLM {label}: {outcome} in {latency:.2f}s, "
+                    f"input_tokens={usage['input_tokens']}, "
+                    f"output_tokens={usage['output_tokens']}"
+                )
+                # 저장은 백그라운드로 넘기므로 슬롯을 잡은 채 DB 를 기다리지 않음
+                record_llm_call(
+                    model=MODEL,
+                    latency=latency,
+                    outcome=outcome,
+                    **usage,
+                )
+
+    raise LLMOutputError(str(last_error))
+
+
+async def stream_model(
+    system: str,
+    prompt: str,
+    max_tokens: int,
+    model: type[M],
+    on_field: FieldCallback | None = None,
+    max_attempts: int = 2,
+    label: str = "llm",
+) -> M:
+    """model 의 JSON Schema 를 tool 로 강제하고, 결과를 model 로 검증합니다."""
+    schema = model.tool_schema()
+    return await stream_json(
+        system=system,
+        prompt=prompt,
+        max_tokens=max_tokens,
+        field_types=model.field_types(),
+        required=set(schema.get("required", [])),
+        allow_extra=False,
+        on_field=on_field,
+        max_attempts=max_attempts,
+        tool={
+            "name": TOOL_NAME,
+            "description": model.tool_description,
+            "input_schema": schema,
+        },
+        validate=model.model_validate,
+        label=label,
+    )
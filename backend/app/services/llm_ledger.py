@@ -0,0 +1,191 @@
+"""
+LLM 호출 토큰/지연시간 원장
+- 호출마다 입력/출력/캐시 토큰, 모델, 지연시간, 결과를 기록
+- 유저/소스/파이프라인 단계 태그는 contextvar 로 전달
+- DB 원장 (llm_usage) + 프로세스 내 집계 (메트릭 노출용)
+- 원장 저장은 백그라운드 태스크로 처리해 LLM 호출 경로가 DB 를 기다리지 않음
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from app.core.database import async_session
+from app.core.metrics import registry
+from app.models.llm_usage import LLMUsage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LLMCallContext:
+    user_id: UUID | None = None
+    source_id: UUID | None = None
+    stage: str = "unknown"
+    platform: str | None = None
+
+
+_context: ContextVar[LLMCallContext] = ContextVar(
+    "llm_call_context", default=LLMCallContext()
+)
+
+
+@contextmanager
+def llm_context(**tags):
+    """블록 안의 LLM 호출에 user_id / source_id / stage / platform 태그를 붙입니다."""
+    token = _context.set(replace(_context.get(), **tags))
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def current_context() -> LLMCallContext:
+    return _context.get()
+
+
+@dataclass
+class UsageTotals:
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+
+class LedgerAggregator:
+    """(stage, platform, model, outcome) 단위 프로세스 내 누적 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: dict[tuple[str, str, str, str], UsageTotals] = {}
+
+    def add(
+        self,
+        ctx: LLMCallContext,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cached_tokens: int,
+        latency: float,
+        outcome: str,
+    ) -> None:
+        key = (ctx.stage, ctx.platform or "", model, outcome)
+        with self._lock:
+            totals = self._totals.setdefault(key, UsageTotals())
+            totals.calls += 1
+            totals.input_tokens += input_tokens
+            totals.output_tokens += output_tokens
+            totals.cached_tokens += cached_tokens
+            totals.latency_seconds += latency
+            totals.max_latency_seconds = max(totals.max_latency_seconds, latency)
+
+    def snapshot(self) -> dict[tuple[str, str, str, str], UsageTotals]:
+        with self._lock:
+            return {k: replace(v) for k, v in self._totals.items()}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = [
+            "# HELP life_pilot_llm_calls_total LLM calls by stage/platform/model/outcome",
+            "# TYPE life_pilot_llm_calls_total counter",
+        ]
+        snapshot = self.snapshot()
+        for key, t in sorted(snapshot.items()):
+            lines.append(f"life_pilot_llm_calls_total{{{_labels(key)}}} {t.calls}")
+
+        lines += [
+            "# HELP life_pilot_llm_tokens_total LLM tokens by kind",
+            "# TYPE life_pilot_llm_tokens_total counter",
+        ]
+        for key, t in sorted(snapshot.items()):
+            for kind, value in (
+                ("input", t.input_tokens),
+                ("output", t.output_tokens),
+                ("cached", t.cached_tokens),
+            ):
+                lines.append(
+                    f'life_pilot_llm_tokens_total{{{_labels(key)},kind="{kind}"}} {value}'
+                )
+
+        lines += [
+            "# HELP life_pilot_llm_latency_seconds LLM call wall time",
+            "# TYPE life_pilot_llm_latency_seconds summary",
+        ]
+        for key, t in sorted(snapshot.items()):
+            labels = _labels(key)
+            lines.append(f"life_pilot_llm_latency_seconds_sum{{{labels}}} {t.latency_seconds:.6f}")
+            lines.append(f"life_pilot_llm_latency_seconds_count{{{labels}}} {t.calls}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: tuple[str, str, str, str]) -> str:
+    stage, platform, model, outcome = key
+    return (
+        f'stage="{stage}",platform="{platform}",'
+        f'model="{model}",outcome="{outcome}"'
+    )
+
+
+aggregator = LedgerAggregator()
+registry.add_collector(aggregator.render_prometheus)
+
+
+# 진행 중인 원장 저장 태스크 (가비지 컬렉션 방지 + 종료 시 대기용)
+_pending_writes: set[asyncio.Task] = set()
+
+
+def record_llm_call(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cached_tokens: int,
+    latency: float,
+    outcome: str,
+) -> None:
+    """
+    LLM 호출 1건을 집계하고 원장 테이블 저장을 백그라운드 태스크로 넘깁니다.
+    호출자는 DB 를 기다리지 않으므로 LLM 슬롯을 잡은 채 막히거나 취소가 늦어지지 않습니다.
+    저장이 실패해도 호출자에 영향 없음.
+    """
+    ctx = _context.get()
+    aggregator.add(ctx, model, input_tokens, output_tokens, cached_tokens, latency, outcome)
+
+    row = LLMUsage(
+        user_id=ctx.user_id,
+        source_id=ctx.source_id,
+        stage=ctx.stage,
+        platform=ctx.platform,
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cached_tokens=cached_tokens,
+        latency_ms=int(latency * 1000),
+        outcome=outcome,
+    )
+    task = asyncio.get_running_loop().create_task(_persist(row))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+
+async def _persist(row: LLMUsage) -> None:
+    try:
+        async with async_session() as db:
+            db.add(row)
+            await db.commit()
+    except asyncio.CancelledError:
+        logger.warning(f"LLM usage write cancelled ({row.stage})")
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to persist LLM usage ({row.stage}): {e}")
+
+
+async def flush_llm_usage(timeout: float = 5.0) -> None:
+    """대기 중인 원장 저장이 끝나길 잠시 기다립니다 (워커 종료 시)."""
+    if _pending_writes:
+        await asyncio.wait(set(_pending_writes), timeout=timeout)
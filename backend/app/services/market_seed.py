@@ -5,6 +5,8 @@
 """
 
 import asyncio
+import hashlib
+import json
 import uuid
 from datetime import datetime, timezone
 
@@ -108,8 +110,18 @@ SKILL_DEMAND = [
 ]
 
 
-def _get_years_range(years: int) -> str:
-    """연차를 연차 구간 문자열로 변환"""
+# 시장 데이터 내용이 바뀌면 자동으로 바뀌는 버전 (스코어링 입력 지문에 포함)
+MARKET_DATA_VERSION = hashlib.sha256(
+    json.dumps([SALARY_DATA, SKILL_DEMAND], sort_keys=True).encode()
+).hexdigest()[:12]
+
+
+def years_band(years: int | None) -> str:
+    """
+    연차를 연차 구간 문자열로 변환 (없으면 0년차).
+    마이그레이션 009 의 years_band CASE 와 같은 경계를 유지해야 함.
+    """
+    years = years or 0
     if years <= 2:
         return "0-2"
     elif years <= 5:
@@ -166,7 +178,7 @@ async def seed_market_data(db: AsyncSession) -> int:
 
 def get_salary_range(job_category: str, years: int) -> tuple[int, int]:
     """직군/연차 기반 기본 연봉 범위 (만원 단위) 반환"""
-    yr = _get_years_range(years)
+    yr = years_band(years)
     for entry in SALARY_DATA:
         if entry["job_category"] == job_category and entry["years_range"] == yr:
             return entry["avg_salary_min"], entry["avg_salary_max"]
@@ -0,0 +1,24 @@
+"""
+URL → 플랫폼 판별
+- API 프로세스에서도 쓰이므로 스크래핑 의존성(httpx/bs4/playwright) 없이 유지
+"""
+
+import re
+
+PLATFORM_PATTERNS = {
+    "linkedin": r"linkedin\.com/in/",
+    "github": r"github\.com/",
+    "velog": r"velog\.io/@",
+    "tistory": r"\.tistory\.com",
+    "dribbble": r"dribbble\.com/",
+    "behance": r"behance\.net/",
+    "notion": r"notion\.so/",
+    "medium": r"medium\.com/@?",
+}
+
+
+def detect_platform(url: str) -> str:
+    for platform, pattern in PLATFORM_PATTERNS.items():
+        if re.search(pattern, url):
+            return platform
+    return "other"
@@ -0,0 +1,99 @@
+"""
+스코어링 1회분 통합 프로필 스냅샷
+- completed 소스의 parsed_data 를 한 번만 로드/집계
+- 규칙 기반 스코어링, Claude 보정, 액션 추천이 같은 스냅샷을 공유 (재조회/재집계 없음)
+- 불변 객체라 단계 간 병렬 실행에도 안전
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.schemas.profile import (
+    Education,
+    Experience,
+    ParsedProfile,
+    Post,
+    Project,
+    Repo,
+    load_profile,
+)
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    user_id: UUID | None
+    job_category: str
+    years: int
+    profiles: tuple[ParsedProfile, ...]
+
+    # 집계
+    skills: frozenset[str]
+    top_languages: frozenset[str]
+    platforms_used: frozenset[str]
+    data_qualities: tuple[str, ...]
+    experience_items: tuple[Experience, ...]
+    education_items: tuple[Education, ...]
+    certifications: tuple[str, ...]
+    projects: tuple[Project | Repo, ...]
+    recent_posts: tuple[Post, ...]
+    post_count: int
+    followers: int
+    public_repos: int
+    stars: int
+    recommendation_count: int
+    series_count: int
+    contribution_summary: str
+    posting_frequency: str
+
+    @classmethod
+    def build(
+        cls,
+        sources_data: list[dict | ParsedProfile],
+        job_category: str | None,
+        years: int | None,
+        user_id: UUID | None = None,
+    ) -> "ProfileSnapshot":
+        """모든 소스 데이터를 하나의 통합 프로필로 합침"""
+        profiles = tuple(load_profile(src) for src in sources_data if src)
+
+        skills: set[str] = set()
+        top_languages: set[str] = set()
+        contribution = ""
+        frequency = ""
+        for src in profiles:
+            skills.update(src.skills)
+            skills.update(src.top_languages)
+            top_languages.update(src.top_languages)
+            if src.contribution_summary:
+                contribution += f" {src.contribution_summary}"
+            if src.posting_frequency:
+                frequency += f" {src.posting_frequency}"
+
+        return cls(
+            user_id=user_id,
+            job_category=job_category or "other",
+            years=years or 0,
+            profiles=profiles,
+            skills=frozenset(skills),
+            top_languages=frozenset(top_languages),
+            platforms_used=frozenset(p.platform for p in profiles),
+            data_qualities=tuple(p.data_quality for p in profiles),
+            experience_items=tuple(e for p in profiles for e in p.experience),
+            education_items=tuple(e for p in profiles for e in p.education),
+            certifications=tuple(c for p in profiles for c in p.certifications),
+            projects=tuple(
+                item for p in profiles for item in (*p.projects, *p.pinned_repos)
+            ),
+            recent_posts=tuple(post for p in profiles for post in p.recent_posts),
+            post_count=sum(p.total_posts + p.quantitative_metrics.post_count for p in profiles),
+            followers=sum(p.followers + p.quantitative_metrics.followers for p in profiles),
+            public_repos=sum(p.public_repos for p in profiles),
+            stars=sum(r.stars for p in profiles for r in p.pinned_repos),
+            recommendation_count=sum(p.recommendation_count for p in profiles),
+            series_count=sum(len(p.series) for p in profiles),
+            contribution_summary=contribution,
+            posting_frequency=frequency,
+        )
+
+    def top_skills(self, limit: int = 30) -> list[str]:
+        return sorted(self.skills)[:limit]
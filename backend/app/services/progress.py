@@ -0,0 +1,128 @@
+"""
+파이프라인 진행 상황 실시간 전달
+- 워커: 소스 단계 전이 / 스코어링 단계를 Postgres NOTIFY 로 발행 (트랜잭션 커밋 시 전달)
+- API: 프로세스당 LISTEN 연결 하나로 받아 유저별 구독 큐(SSE 스트림)에 분배
+- 대기 중인 클라이언트는 DB 조회 없이 이벤트만 기다림 (폴링 비용 없음)
+"""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import asyncpg_connect_args, asyncpg_url
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "pipeline_progress"
+
+
+async def publish_progress(db: AsyncSession, user_id: UUID, **event) -> None:
+    """
+    진행 이벤트를 현재 트랜잭션에 NOTIFY 로 추가합니다.
+    커밋될 때만 전달되므로 롤백된 상태 전이는 알려지지 않습니다.
+    """
+    payload = json.dumps({"user_id": str(user_id), **event}, default=str)
+    await db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _listen_dsn() -> str:
+    # 엔진과 같은 정규화 후 SQLAlchemy URL(postgresql+asyncpg://) → asyncpg DSN
+    url = make_url(asyncpg_url(settings.DATABASE_URL)).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class ProgressBroker:
+    """
+    LISTEN 연결 하나로 받은 알림을 프로세스 내 유저별 구독 큐로 분배합니다.
+
+    구독 큐가 가득 차거나 LISTEN 연결이 끊기면 큐에 None 을 넣어 스트림을 끝내고,
+    클라이언트가 재연결해 새 스냅샷부터 다시 받도록 합니다.
+    """
+
+    def __init__(self, max_queued: int = 100):
+        self.max_queued = max_queued
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._conn: asyncpg.Connection | None = None
+        self._connecting = asyncio.Lock()
+
+    async def _ensure_listening(self) -> None:
+        if self._conn is not None and not self._conn.is_closed():
+            return
+        async with self._connecting:
+            if self._conn is not None and not self._conn.is_closed():
+                return
+            conn = await asyncpg.connect(
+                _listen_dsn(), **asyncpg_connect_args(settings.DATABASE_URL)
+            )
+            conn.add_termination_listener(self._on_terminated)
+            await conn.add_listener(CHANNEL, self._on_notify)
+            self._conn = conn
+            logger.info(f"Listening on {CHANNEL}")
+
+    async def close(self) -> None:
+        if self._conn is not None and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: UUID):
+        await self._ensure_listening()
+        key = str(user_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queued)
+        self._subscribers.setdefault(key, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(key)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[key]
+
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def dispatch(self, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Malformed progress payload: {payload[:200]}")
+            return
+        for queue in self._subscribers.get(event.pop("user_id", None), ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                _close_queue(queue)
+
+    def _on_notify(self, conn, pid, channel, payload) -> None:
+        self.dispatch(payload)
+
+    def _on_terminated(self, conn) -> None:
+        logger.warning(f"{CHANNEL} listener connection lost")
+        self._conn = None
+        for queues in self._subscribers.values():
+            for queue in queues:
+                _close_queue(queue)
+
+
+def _close_queue(queue: asyncio.Queue) -> None:
+    """대기 중인 이벤트를 버리고 종료 표시(None)를 넣습니다."""
+    while not queue.empty():
+        queue.get_nowait()
+    queue.put_nowait(None)
+
+
+progress_broker = ProgressBroker(settings.PROGRESS_MAX_QUEUED_EVENTS)
@@ -0,0 +1,176 @@
+"""
+보정 프롬프트용 컴팩트 프로필 인코더
+- ParsedProfile 을 키=값 / 한 줄 한 사실 형태로 압축
+- 문자 수가 아닌 (추정) 토큰 수로 예산 관리
+- 정보량 높은 사실부터 소스별로 고르게 채워 넣고, 객체 중간에서 자르지 않음
+"""
+
+import math
+from dataclasses import dataclass
+
+from app.schemas.profile import ParsedProfile
+
+# 우선순위 (낮을수록 먼저 포함)
+P_HEADER = 0
+P_COUNTS = 1
+P_SKILLS = 2
+P_EXPERIENCE = 3
+P_WORK = 4
+P_ACTIVITY = 5
+P_DETAIL = 6
+
+MAX_LIST_ITEMS = 15
+MAX_TEXT_CHARS = 80
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Claude 토크나이저 근사치 (보수적으로 높게 추정).
+    ASCII 는 약 4자당 1토큰, 한글 등 비 ASCII 문자는 1자당 1토큰.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+@dataclass(frozen=True)
+class EncodedSources:
+    text: str
+    tokens: int
+    included_facts: int
+    total_facts: int
+
+
+def _clip(text: str | None, limit: int = MAX_TEXT_CHARS) -> str:
+    if not text:
+        return ""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0]
+    return f"{cut}…"
+
+
+def _join(items: list[str], limit: int = MAX_LIST_ITEMS) -> str:
+    shown = [i for i in items[:limit] if i]
+    rest = len(items) - len(shown)
+    return ",".join(shown) + (f" +{rest}" if rest > 0 else "")
+
+
+def _facts(profile: ParsedProfile) -> list[tuple[int, str]]:
+    """한 소스에서 (우선순위, 한 줄 사실) 목록을 원래 순서대로 생성"""
+    facts: list[tuple[int, str]] = []
+    p = profile
+
+    title = (
+        getattr(p, "current_title", None)
+        or getattr(p, "role_or_title", None)
+        or getattr(p, "headline", None)
+    )
+    company = getattr(p, "company", None)
+    header = " | ".join(x for x in (_clip(p.name, 40), _clip(title, 60), _clip(company, 40)) if x)
+    facts.append((P_HEADER, f"[{p.platform}] q={p.data_quality}" + (f" {header}" if header else "")))
+
+    counts = {
+        "followers": p.followers + p.quantitative_metrics.followers,
+        "repos": p.public_repos,
+        "stars": sum(r.stars for r in p.pinned_repos),
+        "posts": p.total_posts + p.quantitative_metrics.post_count,
+        "recs": p.recommendation_count,
+    }
+    counts_line = " ".join(f"{k}={v}" for k, v in counts.items() if v)
+    if counts_line:
+        facts.append((P_COUNTS, counts_line))
+
+    if p.skills:
+        facts.append((P_SKILLS, f"skills: {_join(p.skills)}"))
+    if p.top_languages:
+        facts.append((P_SKILLS, f"langs: {_join(p.top_languages)}"))
+
+    for exp in p.experience:
+        role = "@".join(x for x in (_clip(exp.title, 40), _clip(exp.company, 40)) if x)
+        if role:
+            duration = f" ({_clip(exp.duration, 20)})" if exp.duration else ""
+            facts.append((P_EXPERIENCE, f"exp: {role}{duration}"))
+    for cert in p.certifications[:MAX_LIST_ITEMS]:
+        facts.append((P_EXPERIENCE, f"cert: {_clip(cert, 60)}"))
+    for edu in p.education:
+        parts = [x for x in (_clip(edu.school, 40), _clip(edu.degree, 20), _clip(edu.field, 30)) if x]
+        if parts:
+            facts.append((P_EXPERIENCE, f"edu: {' '.join(parts)}"))
+
+    for repo in sorted(p.pinned_repos, key=lambda r: -r.stars):
+        meta = " ".join(x for x in (repo.language or "", f"★{repo.stars}" if repo.stars else "") if x)
+        desc = f" - {_clip(repo.description, 60)}" if repo.description else ""
+        facts.append((P_WORK, f"repo: {_clip(repo.name, 40)}" + (f" [{meta}]" if meta else "") + desc))
+    for proj in p.projects:
+        tech = f" [{_join(proj.technologies, 5)}]" if proj.technologies else ""
+        desc = f" - {_clip(proj.description, 60)}" if proj.description else ""
+        facts.append((P_WORK, f"project: {_clip(proj.name, 40)}{tech}{desc}"))
+
+    if p.contribution_summary:
+        facts.append((P_ACTIVITY, f"contrib: {_clip(p.contribution_summary)}"))
+    if p.posting_frequency:
+        facts.append((P_ACTIVITY, f"freq: {_clip(p.posting_frequency)}"))
+    if p.series:
+        facts.append((P_ACTIVITY, f"series: {_join(p.series, 8)}"))
+    topics = getattr(p, "main_topics", None)
+    if topics:
+        facts.append((P_ACTIVITY, f"topics: {_join(topics, 8)}"))
+    activity = getattr(p, "activity_summary", None) or getattr(p, "experience_summary", None)
+    if activity:
+        facts.append((P_ACTIVITY, f"summary: {_clip(activity, 120)}"))
+
+    for post in p.recent_posts:
+        tags = f" #{' #'.join(post.tags[:3])}" if post.tags else ""
+        date = f" ({post.date})" if post.date else ""
+        facts.append((P_DETAIL, f"post: {_clip(post.title, 50)}{date}{tags}"))
+    bio = getattr(p, "bio", None)
+    if bio:
+        facts.append((P_DETAIL, f"bio: {_clip(bio)}"))
+
+    return facts
+
+
+def encode_sources(profiles: list[ParsedProfile], budget_tokens: int) -> EncodedSources:
+    """
+    소스별 사실을 토큰 예산 안에서 우선순위 순으로 선택해 렌더링합니다.
+
+    같은 우선순위에서는 소스를 번갈아 채워 한 소스가 예산을 독식하지 않게 하고,
+    출력은 소스별로 원래 순서를 유지하여 입력이 같으면 항상 같은 텍스트가 나옵니다.
+    """
+    ordered = sorted(profiles, key=lambda p: (p.platform, p.profile_url or "", p.name or ""))
+    per_source = [_facts(p) for p in ordered]
+
+    candidates = []
+    for src_idx, facts in enumerate(per_source):
+        rank_in_priority: dict[int, int] = {}
+        for fact_idx, (priority, line) in enumerate(facts):
+            rank = rank_in_priority.get(priority, 0)
+            rank_in_priority[priority] = rank + 1
+            candidates.append((priority, rank, src_idx, fact_idx, line))
+    candidates.sort()
+
+    selected: set[tuple[int, int]] = set()
+    used = 0
+    for priority, _, src_idx, fact_idx, line in candidates:
+        cost = estimate_tokens(line) + 1  # 줄바꿈
+        if used + cost > budget_tokens:
+            if priority == P_HEADER:
+                continue
+            break
+        selected.add((src_idx, fact_idx))
+        used += cost
+
+    lines = [
+        line
+        for src_idx, facts in enumerate(per_source)
+        for fact_idx, (_, line) in enumerate(facts)
+        if (src_idx, fact_idx) in selected
+    ]
+    text = "\n".join(lines)
+    return EncodedSources(
+        text=text,
+        tokens=estimate_tokens(text),
+        included_facts=len(lines),
+        total_facts=len(candidates),
+    )
@@ -0,0 +1,84 @@
+"""
+스코어 공유 캐시
+- 유저별 최신 스코어 응답 (/scores/latest, /scores/market-position, /dashboard 공용)
+- 직군별 스코어 분포 (score_distribution 히스토그램을 누적 개수로 변환한 것)
+- L1 프로세스 내 + L2 Redis, run_scoring 저장 / 프로필 수정 / 계정 삭제 시 이벤트 기반 무효화
+- 최신 스코어는 호출자가 아는 버전(id + phase)과 다르면 미스로 취급 (무효화 지연에도 ETag 와 본문이 어긋나지 않음)
+"""
+
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.cache import SharedCache, TTLCache
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.career_score import CareerScore
+from app.models.user import User
+from app.services.score_distribution import load_distribution
+from app.services.serializers import serialize_score
+
+latest_score_cache: SharedCache[dict] = SharedCache(
+    "latest_score",
+    TTLCache(
+        "latest_score",
+        max_entries=settings.SCORE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.SCORE_CACHE_TTL_SECONDS,
+    ),
+    l2_ttl_seconds=settings.REDIS_CACHE_TTL_SECONDS,
+)
+distribution_cache: SharedCache[dict] = SharedCache(
+    "score_distribution",
+    TTLCache(
+        "score_distribution",
+        max_entries=1000,
+        ttl_seconds=settings.SCORE_DISTRIBUTION_CACHE_TTL_SECONDS,
+    ),
+    l2_ttl_seconds=settings.SCORE_DISTRIBUTION_CACHE_TTL_SECONDS,
+)
+
+
+def score_version(body: dict) -> str:
+    return f"{body['id']}:{body['phase']}" if body.get("has_score") else "none"
+
+
+async def _load_latest_score(user_id: UUID) -> dict:
+    async with async_session() as db:
+        result = await db.execute(
+            select(CareerScore)
+            .join(User, User.latest_score_id == CareerScore.id)
+            .where(User.id == user_id)
+        )
+        score = result.scalar_one_or_none()
+    if score is None:
+        return {"has_score": False}
+    return {"has_score": True, **serialize_score(score)}
+
+
+async def get_latest_score(user_id: UUID, expected_version: str | None = None) -> dict:
+    """최신 스코어 응답 본문 ({"has_score": False} 포함)을 반환합니다."""
+    body = await latest_score_cache.get_or_load(user_id, lambda: _load_latest_score(user_id))
+    if expected_version is not None and score_version(body) != expected_version:
+        await latest_score_cache.invalidate(user_id)
+        body = await latest_score_cache.get_or_load(user_id, lambda: _load_latest_score(user_id))
+    return body
+
+
+async def _load_distribution(job_category: str | None) -> dict:
+    async with async_session() as db:
+        return await load_distribution(db, job_category)
+
+
+async def get_distribution(job_category: str | None) -> dict:
+    """직군별 스코어 분포 (band → area → count / sum / cumulative)"""
+    job_category = job_category or "other"
+    return await distribution_cache.get_or_load(
+        job_category, lambda: _load_distribution(job_category)
+    )
+
+
+async def invalidate_scores(user_id: UUID, *job_categories: str | None) -> None:
+    """유저의 최신 스코어와 해당 직군 분포를 모든 프로세스에서 무효화합니다."""
+    await latest_score_cache.invalidate(user_id)
+    for job_category in {c or "other" for c in job_categories}:
+        await distribution_cache.invalidate(job_category)
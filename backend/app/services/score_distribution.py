@@ -0,0 +1,263 @@
+"""
+직군별 스코어 분포 (실제 백분위 포지셔닝)
+- 직군 × 연차 구간(+ 전체 "all") × 영역(total + 5개 영역)별 1점 단위 히스토그램을 테이블로 유지
+- 유저당 최신 스코어 1건만 반영: 최신 스코어가 바뀌면 이전 기여분을 빼고 새 값을 더함 (증분 갱신)
+- 조회는 직군당 한 번 읽어 누적 개수로 변환 → 백분위 / 평균은 O(1)
+- 연차 구간 표본이 적으면 직군 전체 분포로 대체
+- 전체 재구성: python -m app.services.score_distribution rebuild
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, desc, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.career_score import CareerScore
+from app.models.score_distribution import ScoreDistributionBucket, ScoreDistributionMember
+from app.models.user import User
+from app.services.market_seed import years_band
+
+logger = logging.getLogger(__name__)
+
+AREAS = ("total", "expertise", "influence", "consistency", "marketability", "potential")
+ALL_BANDS = "all"
+MAX_BUCKET = 100
+# 다중 행 INSERT 한 번의 최대 행 수 (asyncpg 바인드 파라미터 한도 이내)
+INSERT_BATCH = 1000
+
+# (직군, 연차 구간, 영역, 버킷) → (개수 변화, 합계 변화)
+Deltas = dict[tuple[str, str, str, int], tuple[int, float]]
+
+
+def bucket_of(value: float) -> int:
+    return min(max(int(value), 0), MAX_BUCKET)
+
+
+def area_scores(score: CareerScore) -> dict[str, float]:
+    values = {
+        "total": score.total_score,
+        "expertise": score.expertise_score,
+        "influence": score.influence_score,
+        "consistency": score.consistency_score,
+        "marketability": score.marketability_score,
+        "potential": score.potential_score,
+    }
+    return {area: float(value) for area, value in values.items() if value is not None}
+
+
+def _add(deltas: Deltas, job_category: str, band: str, scores: dict[str, float], sign: int) -> None:
+    for target_band in (band, ALL_BANDS):
+        for area, value in scores.items():
+            key = (job_category, target_band, area, bucket_of(value))
+            count, total = deltas.get(key, (0, 0.0))
+            deltas[key] = (count + sign, total + sign * value)
+
+
+async def _apply(db: AsyncSession, deltas: Deltas) -> None:
+    # 같은 버킷의 빼기/더하기는 미리 상쇄, 잠금 순서를 고정해 교착 방지
+    rows = [
+        {
+            "job_category": key[0],
+            "years_band": key[1],
+            "area": key[2],
+            "bucket": key[3],
+            "count": count,
+            "score_sum": round(total, 2),
+        }
+        for key, (count, total) in sorted(deltas.items())
+        if count or round(total, 2)
+    ]
+    for start in range(0, len(rows), INSERT_BATCH):
+        stmt = insert(ScoreDistributionBucket).values(rows[start:start + INSERT_BATCH])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["job_category", "years_band", "area", "bucket"],
+                set_={
+                    "count": ScoreDistributionBucket.count + stmt.excluded.count,
+                    "score_sum": ScoreDistributionBucket.score_sum + stmt.excluded.score_sum,
+                },
+            )
+        )
+
+
+async def update_member(
+    db: AsyncSession,
+    user_id: UUID,
+    job_category: str | None,
+    years: int | None,
+    score_id: UUID | None = None,
+    scores: dict[str, float] | None = None,
+) -> None:
+    """유저의 분포 기여분을 새 스코어 / 직군 / 연차로 옮깁니다. 커밋은 호출자가 합니다.
+
+    scores 를 생략하면 기존 기여 점수를 그대로 두고 직군 / 연차만 옮깁니다 (프로필 수정).
+    """
+    result = await db.execute(
+        select(ScoreDistributionMember)
+        .where(ScoreDistributionMember.user_id == user_id)
+        .with_for_update()
+    )
+    member = result.scalar_one_or_none()
+    if scores is None:
+        if member is None:
+            return
+        score_id, scores = member.score_id, member.scores
+
+    job_category = job_category or "other"
+    band = years_band(years)
+    deltas: Deltas = {}
+    if member is not None:
+        _add(deltas, member.job_category, member.years_band, member.scores, -1)
+    _add(deltas, job_category, band, scores, +1)
+    await _apply(db, deltas)
+
+    values = {
+        "score_id": score_id,
+        "job_category": job_category,
+        "years_band": band,
+        "scores": scores,
+        "updated_at": datetime.now(timezone.utc),
+    }
+    if member is None:
+        db.add(ScoreDistributionMember(user_id=user_id, **values))
+    else:
+        for key, value in values.items():
+            setattr(member, key, value)
+
+
+async def remove_member(db: AsyncSession, user_id: UUID) -> None:
+    """유저의 기여분을 분포에서 뺍니다 (계정 삭제 전). 커밋은 호출자가 합니다."""
+    result = await db.execute(
+        select(ScoreDistributionMember)
+        .where(ScoreDistributionMember.user_id == user_id)
+        .with_for_update()
+    )
+    member = result.scalar_one_or_none()
+    if member is None:
+        return
+    deltas: Deltas = {}
+    _add(deltas, member.job_category, member.years_band, member.scores, -1)
+    await _apply(db, deltas)
+    await db.delete(member)
+
+
+async def load_distribution(db: AsyncSession, job_category: str | None) -> dict:
+    """직군의 전체 분포: band → area → {"count", "sum", "cumulative"(버킷별 누적 개수)}"""
+    result = await db.execute(
+        select(
+            ScoreDistributionBucket.years_band,
+            ScoreDistributionBucket.area,
+            ScoreDistributionBucket.bucket,
+            ScoreDistributionBucket.count,
+            ScoreDistributionBucket.score_sum,
+        ).where(ScoreDistributionBucket.job_category == (job_category or "other"))
+    )
+    counts: dict[str, dict[str, list[int]]] = {}
+    sums: dict[tuple[str, str], float] = {}
+    for band, area, bucket, count, score_sum in result.all():
+        counts.setdefault(band, {}).setdefault(area, [0] * (MAX_BUCKET + 1))[bucket] = count
+        sums[(band, area)] = sums.get((band, area), 0.0) + float(score_sum)
+
+    distribution: dict[str, dict[str, dict]] = {}
+    for band, areas in counts.items():
+        for area, per_bucket in areas.items():
+            cumulative, running = [], 0
+            for count in per_bucket:
+                running += count
+                cumulative.append(running)
+            distribution.setdefault(band, {})[area] = {
+                "count": running,
+                "sum": round(sums[(band, area)], 2),
+                "cumulative": cumulative,
+            }
+    return distribution
+
+
+def percentile(area_distribution: dict, value: float) -> float | None:
+    """value 보다 낮은 비율 + 같은 버킷의 절반 (중간 순위), 0 ~ 100"""
+    total = area_distribution["count"]
+    if total <= 0:
+        return None
+    cumulative = area_distribution["cumulative"]
+    bucket = bucket_of(value)
+    below = cumulative[bucket - 1] if bucket > 0 else 0
+    within = cumulative[bucket] - below
+    return round((below + within / 2) / total * 100, 1)
+
+
+def position(distribution: dict, years: int | None, scores: dict[str, float]) -> dict:
+    """유저 점수의 직군 내 위치. 연차 구간 표본이 적으면 직군 전체("all") 기준."""
+    band = years_band(years)
+    band_total = distribution.get(band, {}).get("total", {}).get("count", 0)
+    if band_total < settings.SCORE_DISTRIBUTION_MIN_BAND_SAMPLE:
+        band = ALL_BANDS
+    areas = distribution.get(band, {})
+
+    percentiles, averages = {}, {}
+    for area, value in scores.items():
+        area_distribution = areas.get(area)
+        if not area_distribution or not area_distribution["count"]:
+            continue
+        percentiles[area] = percentile(area_distribution, value)
+        averages[area] = round(area_distribution["sum"] / area_distribution["count"], 1)
+    return {
+        "years_band": band,
+        "sample_size": areas.get("total", {}).get("count", 0),
+        "percentiles": percentiles,
+        "averages": averages,
+    }
+
+
+async def rebuild(db: AsyncSession) -> int:
+    """유저별 최신 스코어로 분포 전체를 다시 만듭니다. 재구성한 유저 수를 반환합니다."""
+    result = await db.execute(
+        select(CareerScore, User.job_category, User.years_of_experience)
+        .join(User, User.id == CareerScore.user_id)
+        .distinct(CareerScore.user_id)
+        .order_by(CareerScore.user_id, desc(CareerScore.scored_at))
+    )
+    latest = result.all()
+
+    await db.execute(delete(ScoreDistributionBucket))
+    await db.execute(delete(ScoreDistributionMember))
+
+    deltas: Deltas = {}
+    now = datetime.now(timezone.utc)
+    for score, job_category, years in latest:
+        scores = area_scores(score)
+        job_category = job_category or "other"
+        band = years_band(years)
+        _add(deltas, job_category, band, scores, +1)
+        db.add(ScoreDistributionMember(
+            user_id=score.user_id,
+            score_id=score.id,
+            job_category=job_category,
+            years_band=band,
+            scores=scores,
+            updated_at=now,
+        ))
+    await _apply(db, deltas)
+    return len(latest)
+
+
+async def _main() -> None:
+    async with async_session() as db:
+        users = await rebuild(db)
+        await db.commit()
+    logger.info(f"Rebuilt score distributions from {users} users")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score distribution maintenance")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(_main())
@@ -7,27 +7,46 @@
 - 성장성 (Potential): 최신 기술 비율, 최근 활동 추세, 학습 패턴
 """
 
+import hashlib
+import json
 import logging
-from typing import Any
 
-from app.services.market_seed import get_skill_demand
+from app.schemas.profile import ParsedProfile
+from app.services.market_seed import MARKET_DATA_VERSION, get_skill_demand
+from app.services.profile_snapshot import ProfileSnapshot
 
 logger = logging.getLogger(__name__)
 
+# 스코어링 규칙/보정 프롬프트가 바뀌면 올려서 기존 지문을 무효화
+SCORING_VERSION = "1"
 
-def _safe_int(val: Any, default: int = 0) -> int:
-    if val is None:
-        return default
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return default
 
-
-def _safe_list(val: Any) -> list:
-    if isinstance(val, list):
-        return val
-    return []
+def scoring_fingerprint(
+    sources_data: list[dict],
+    job_category: str,
+    years_of_experience: int,
+) -> str:
+    """
+    스코어링 입력 전체에 대한 지문 (sha256).
+    소스 순서/키 순서와 무관하며, 시장 데이터와 스코어링 버전을 포함합니다.
+    """
+    sources = sorted(
+        json.dumps(src, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        for src in sources_data
+    )
+    canonical = json.dumps(
+        {
+            "sources": sources,
+            "job_category": job_category,
+            "years": years_of_experience,
+            "market": MARKET_DATA_VERSION,
+            "scoring": SCORING_VERSION,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
 
 
 def _clamp(value: float, min_val: float = 0, max_val: float = 100) -> float:
@@ -41,107 +60,25 @@ class CareerScorer:
 
     def __init__(
         self,
-        sources_data: list[dict],
+        sources_data: list[dict | ParsedProfile],
         job_category: str,
         years_of_experience: int,
     ):
-        self.sources = sources_data
-        self.job_category = job_category or "other"
-        self.years = years_of_experience or 0
-        self._aggregate = self._build_aggregate()
-
-    def _build_aggregate(self) -> dict:
-        """모든 소스 데이터를 하나의 통합 프로필로 합침"""
-        agg: dict[str, Any] = {
-            "skills": set(),
-            "experience_items": [],
-            "education_items": [],
-            "certifications": [],
-            "projects": [],
-            "post_count": 0,
-            "followers": 0,
-            "public_repos": 0,
-            "stars": 0,
-            "recommendation_count": 0,
-            "recent_posts": [],
-            "contribution_summary": "",
-            "top_languages": set(),
-            "posting_frequency": "",
-            "series_count": 0,
-            "platforms_used": set(),
-            "data_qualities": [],
-        }
-
-        for src in self.sources:
-            if not src:
-                continue
-
-            platform = src.get("platform", "other")
-            agg["platforms_used"].add(platform)
-            dq = src.get("data_quality", "low")
-            agg["data_qualities"].append(dq)
-
-            # Skills
-            for skill in _safe_list(src.get("skills")):
-                if isinstance(skill, str):
-                    agg["skills"].add(skill)
-            for lang in _safe_list(src.get("top_languages")):
-                if isinstance(lang, str):
-                    agg["skills"].add(lang)
-                    agg["top_languages"].add(lang)
-
-            # Experience
-            for exp in _safe_list(src.get("experience")):
-                agg["experience_items"].append(exp)
-
-            # Education
-            for edu in _safe_list(src.get("education")):
-                agg["education_items"].append(edu)
-
-            # Certifications
-            for cert in _safe_list(src.get("certifications")):
-                agg["certifications"].append(cert)
-
-            # Projects
-            for proj in _safe_list(src.get("projects")):
-                agg["projects"].append(proj)
-            for repo in _safe_list(src.get("pinned_repos")):
-                agg["projects"].append(repo)
-
-            # Quantitative
-            agg["followers"] += _safe_int(src.get("followers"))
-            agg["public_repos"] += _safe_int(src.get("public_repos"))
-            agg["recommendation_count"] += _safe_int(src.get("recommendation_count"))
-            agg["post_count"] += _safe_int(src.get("total_posts"))
-
-            # Stars from pinned repos
-            for repo in _safe_list(src.get("pinned_repos")):
-                agg["stars"] += _safe_int(repo.get("stars") if isinstance(repo, dict) else 0)
-
-            # Posts
-            for post in _safe_list(src.get("recent_posts")):
-                agg["recent_posts"].append(post)
-
-            # Contribution
-            cs = src.get("contribution_summary")
-            if cs:
-                agg["contribution_summary"] += f" {cs}"
-
-            # Posting frequency
-            pf = src.get("posting_frequency")
-            if pf:
-                agg["posting_frequency"] += f" {pf}"
-
-            # Series
-            agg["series_count"] += len(_safe_list(src.get("series")))
-
-            # Generic quantitative_metrics
-            qm = src.get("quantitative_metrics")
-            if isinstance(qm, dict):
-                agg["followers"] += _safe_int(qm.get("followers"))
-                agg["post_count"] += _safe_int(qm.get("post_count"))
-
-        return agg
+        self._init(ProfileSnapshot.build(sources_data, job_category, years_of_experience))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ProfileSnapshot) -> "CareerScorer":
+        """이미 집계된 스냅샷으로 생성 (재집계 없음)"""
+        scorer = cls.__new__(cls)
+        scorer._init(snapshot)
+        return scorer
+
+    def _init(self, snapshot: ProfileSnapshot) -> None:
+        self.snapshot = snapshot
+        self.sources = snapshot.profiles
+        self.job_category = snapshot.job_category
+        self.years = snapshot.years
+        self._aggregate = snapshot
 
     def score_expertise(self) -> float:
         """
@@ -154,7 +91,7 @@ class CareerScorer:
         agg = self._aggregate
 
         # 스킬 점수: 스킬 수 × 평균 수요 레벨
-        skills = list(agg["skills"])
+        skills = list(agg.skills)
         skill_count = len(skills)
         if skill_count > 0:
             avg_demand = sum(
@@ -166,15 +103,15 @@ class CareerScorer:
             skill_score = 0
 
         # 프로젝트/경력 깊이
-        exp_count = len(agg["experience_items"])
-        proj_count = len(agg["projects"])
+        exp_count = len(agg.experience_items)
+        proj_count = len(agg.projects)
         depth_score = min((exp_count * 15 + proj_count * 10), 100)
 
         # 경력 연차 (15년이면 100)
         years_score = min(self.years / 15 * 100, 100)
 
         # 자격증
-        cert_count = len(agg["certifications"])
+        cert_count = len(agg.certifications)
         cert_score = min(cert_count * 25, 100)
 
         total = skill_score * 0.30 + depth_score * 0.30 + years_score * 0.20 + cert_score * 0.20
@@ -191,18 +128,18 @@ class CareerScorer:
         agg = self._aggregate
 
         # 팔로워 (1000명이면 만점)
-        follower_score = min(agg["followers"] / 1000 * 100, 100)
+        follower_score = min(agg.followers / 1000 * 100, 100)
 
         # 블로그 포스팅 (50개 이상이면 만점)
-        post_score = min(agg["post_count"] / 50 * 100, 100)
+        post_score = min(agg.post_count / 50 * 100, 100)
 
         # 오픈소스: repos + stars
-        repo_score = min(agg["public_repos"] / 30 * 50, 50)
-        star_score = min(agg["stars"] / 100 * 50, 50)
+        repo_score = min(agg.public_repos / 30 * 50, 50)
+        star_score = min(agg.stars / 100 * 50, 50)
         oss_score = repo_score + star_score
 
         # 추천서 (5개면 만점)
-        rec_score = min(agg["recommendation_count"] / 5 * 100, 100)
+        rec_score = min(agg.recommendation_count / 5 * 100, 100)
 
         total = follower_score * 0.30 + post_score * 0.25 + oss_score * 0.25 + rec_score * 0.20
         return round(_clamp(total), 1)
@@ -218,7 +155,7 @@ class CareerScorer:
         agg = self._aggregate
 
         # 활동 빈도 (contribution_summary 텍스트 분석)
-        contrib = agg["contribution_summary"].lower()
+        contrib = agg.contribution_summary.lower()
         if any(kw in contrib for kw in ["daily", "매일", "every day", "active"]):
             activity_score = 90
         elif any(kw in contrib for kw in ["weekly", "주간", "regular", "consistent"]):
@@ -228,11 +165,11 @@ class CareerScorer:
         elif contrib.strip():
             activity_score = 40
         else:
-            activity_score = 10 if agg["public_repos"] > 0 else 0
+            activity_score = 10 if agg.public_repos > 0 else 0
 
         # 블로그 포스팅 주기
-        freq = agg["posting_frequency"].lower()
-        recent_count = len(agg["recent_posts"])
+        freq = agg.posting_frequency.lower()
+        recent_count = len(agg.recent_posts)
         if any(kw in freq for kw in ["weekly", "주간", "매주"]):
             posting_score = 85
         elif any(kw in freq for kw in ["bi-weekly", "격주", "2주"]):
@@ -247,7 +184,7 @@ class CareerScorer:
             posting_score = 0
 
         # 근속 연수 (경력 연속성)
-        exp_count = len(agg["experience_items"])
+        exp_count = len(agg.experience_items)
         if self.years >= 5 and exp_count <= 3:
             tenure_score = 80  # 적은 이직 = 높은 근속
         elif self.years >= 3:
@@ -258,7 +195,7 @@ class CareerScorer:
             tenure_score = 20
 
         # 시리즈/연속 학습
-        series_score = min(agg["series_count"] * 20, 100)
+        series_score = min(agg.series_count * 20, 100)
 
         total = (
             activity_score * 0.35
@@ -276,7 +213,7 @@ class CareerScorer:
         - 플랫폼 다양성 (20%)
         """
         agg = self._aggregate
-        skills = list(agg["skills"])
+        skills = list(agg.skills)
 
         if not skills:
             # 스킬 정보 없으면 기본값
@@ -293,7 +230,7 @@ class CareerScorer:
         high_demand_score = high_demand_ratio * 100
 
         # 플랫폼 다양성 (4개 이상이면 만점)
-        platform_count = len(agg["platforms_used"])
+        platform_count = len(agg.platforms_used)
         platform_score = min(platform_count / 4 * 100, 100)
 
         total = demand_score * 0.50 + high_demand_score * 0.30 + platform_score * 0.20
@@ -308,7 +245,7 @@ class CareerScorer:
         - 데이터 품질 (정보 공개 적극성) (15%)
         """
         agg = self._aggregate
-        skills = list(agg["skills"])
+        skills = list(agg.skills)
 
         # 최신 기술 비율
         HIGH_DEMAND_SKILLS = {
@@ -327,7 +264,7 @@ class CareerScorer:
             modern_score = 20
 
         # 최근 활동 추세 (최근 게시글 수)
-        recent_posts = agg["recent_posts"]
+        recent_posts = agg.recent_posts
         if len(recent_posts) >= 10:
             trend_score = 90
         elif len(recent_posts) >= 5:
@@ -340,12 +277,12 @@ class CareerScorer:
             trend_score = 10
 
         # 학습/교육 이력
-        edu_count = len(agg["education_items"])
-        cert_count = len(agg["certifications"])
+        edu_count = len(agg.education_items)
+        cert_count = len(agg.certifications)
         learning_score = min((edu_count * 20 + cert_count * 25), 100)
 
         # 데이터 품질 (정보 공개 적극성)
-        qualities = agg["data_qualities"]
+        qualities = agg.data_qualities
         if qualities:
             quality_map = {"high": 100, "medium": 60, "low": 30}
             avg_quality = sum(quality_map.get(q, 30) for q in qualities) / len(qualities)
@@ -382,7 +319,7 @@ class CareerScorer:
         scores["total"] = round(total, 1)
 
         # 분석 정확도 (데이터 품질 기반)
-        qualities = self._aggregate["data_qualities"]
+        qualities = self._aggregate.data_qualities
         if qualities:
             quality_map = {"high": 90, "medium": 65, "low": 40}
             accuracy = sum(quality_map.get(q, 40) for q in qualities) / len(qualities)
@@ -4,6 +4,7 @@ URL 스크래핑 서비스
 - 기타 URL: 범용 Playwright 스크래핑
 """
 
+import asyncio
 import re
 import logging
 from urllib.parse import urlparse
@@ -11,18 +12,15 @@ from urllib.parse import urlparse
 import httpx
 from bs4 import BeautifulSoup
 
+from app.core.config import settings
+from app.core.metrics import IN_FLIGHT, stage_timer
+from app.core.tracing import span
+from app.services.platforms import detect_platform
+
 logger = logging.getLogger(__name__)
 
-PLATFORM_PATTERNS = {
-    "linkedin": r"linkedin\.com/in/",
-    "github": r"github\.com/",
-    "velog": r"velog\.io/@",
-    "tistory": r"\.tistory\.com",
-    "dribbble": r"dribbble\.com/",
-    "behance": r"behance\.net/",
-    "notion": r"notion\.so/",
-    "medium": r"medium\.com/@?",
-}
+# Chromium 렌더링은 메모리/CPU 를 많이 쓰므로 별도로 제한
+_browser_slots = asyncio.Semaphore(settings.WORKER_BROWSER_CONCURRENCY)
 
 HEADERS = {
     "User-Agent": (
@@ -35,13 +33,6 @@ HEADERS = {
 }
 
 
-def detect_platform(url: str) -> str:
-    for platform, pattern in PLATFORM_PATTERNS.items():
-        if re.search(pattern, url):
-            return platform
-    return "other"
-
-
 async def scrape_url(url: str, platform: str | None = None) -> dict:
     """
     URL을 스크래핑하고 정제된 텍스트를 반환합니다.
@@ -59,6 +50,14 @@ async def scrape_url(url: str, platform: str | None = None) -> dict:
     """
     detected_platform = platform or detect_platform(url)
 
+    with span("scrape_url", url=url, platform=detected_platform) as current:
+        result = await _scrape(url, detected_platform)
+        if current is not None:
+            current.set(success=result["success"], text_length=len(result["cleaned_text"]))
+        return result
+
+
+async def _scrape(url: str, detected_platform: str) -> dict:
     try:
         if detected_platform == "linkedin":
             return await _scrape_with_playwright(url, detected_platform)
@@ -83,14 +82,16 @@ async def scrape_url(url: str, platform: str | None = None) -> dict:
 
 async def _scrape_with_httpx(url: str, platform: str) -> dict:
     """httpx를 사용한 정적 페이지 스크래핑"""
-    async with httpx.AsyncClient(
-        headers=HEADERS, follow_redirects=True, timeout=30.0
-    ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        html = response.text
+    with stage_timer("scrape", platform=platform, strategy="httpx"):
+        async with httpx.AsyncClient(
+            headers=HEADERS, follow_redirects=True, timeout=30.0
+        ) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            html = response.text
 
-    cleaned_text, title = _extract_text(html, platform)
+    with stage_timer("extract", platform=platform):
+        cleaned_text, title = _extract_text(html, platform)
 
     return {
         "platform": platform,
@@ -108,24 +109,27 @@ async def _scrape_with_playwright(url: str, platform: str) -> dict:
     try:
         from playwright.async_api import async_playwright
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=HEADERS["User-Agent"],
-                locale="ko-KR",
-            )
-            page = await context.new_page()
+        with stage_timer("scrape", platform=platform, strategy="playwright"):
+            async with _browser_slots, async_playwright() as p:
+                with IN_FLIGHT.track_inprogress(stage="browser"):
+                    browser = await p.chromium.launch(headless=True)
+                    context = await browser.new_context(
+                        user_agent=HEADERS["User-Agent"],
+                        locale="ko-KR",
+                    )
+                    page = await context.new_page()
 
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            # Extra wait for dynamic content
-            await page.wait_for_timeout(2000)
+                    await page.goto(url, wait_until="networkidle", timeout=30000)
+                    # Extra wait for dynamic content
+                    await page.wait_for_timeout(2000)
 
-            html = await page.content()
-            title = await page.title()
+                    html = await page.content()
+                    title = await page.title()
 
-            await browser.close()
+                    await browser.close()
 
-        cleaned_text, _ = _extract_text(html, platform)
+        with stage_timer("extract", platform=platform):
+            cleaned_text, _ = _extract_text(html, platform)
 
         return {
             "platform": platform,
@@ -0,0 +1,97 @@
+"""
+API 응답 직렬화 공통 함수
+- 개별 엔드포인트(/scores, /actions, /sources)와 /dashboard 가 같은 형태를 반환하도록 공유
+"""
+
+from app.models.action_recommendation import ActionRecommendation
+from app.models.career_score import CareerScore
+from app.models.data_source import DataSource
+from app.models.score_history import ScoreHistory
+from app.models.user import User
+
+
+def serialize_score(score: CareerScore) -> dict:
+    return {
+        "id": str(score.id),
+        "phase": score.phase,
+        "scores": {
+            "expertise": float(score.expertise_score or 0),
+            "influence": float(score.influence_score or 0),
+            "consistency": float(score.consistency_score or 0),
+            "marketability": float(score.marketability_score or 0),
+            "potential": float(score.potential_score or 0),
+            "total": float(score.total_score or 0),
+        },
+        "salary": {
+            "min": score.estimated_salary_min,
+            "max": score.estimated_salary_max,
+        },
+        "analysis_accuracy": float(score.analysis_accuracy or 0),
+        "insights": score.ai_insights or {},
+        "scored_at": score.scored_at.isoformat() if score.scored_at else None,
+    }
+
+
+def serialize_history(history: ScoreHistory) -> dict:
+    return {
+        "id": str(history.id),
+        "snapshot": history.snapshot,
+        "created_at": history.created_at.isoformat() if history.created_at else None,
+    }
+
+
+def serialize_market_position(user: User, score: dict, position: dict) -> dict:
+    """score 는 serialize_score 결과, position 은 score_distribution.position 결과"""
+    insights = score.get("insights") or {}
+    percentiles = position.get("percentiles", {})
+    category_avg = position.get("averages", {}).get("total")
+    return {
+        "my_total_score": score["scores"]["total"],
+        "job_category": user.job_category,
+        "years_of_experience": user.years_of_experience,
+        # 분포가 아직 없으면 AI 인사이트의 추정치 사용
+        "percentile": percentiles.get("total", insights.get("market_position_percentile", 50)),
+        "percentile_source": "distribution" if "total" in percentiles else "estimate",
+        "area_percentiles": percentiles,
+        "years_band": position.get("years_band"),
+        "category_avg_score": round(float(category_avg) if category_avg else 50.0, 1),
+        "category_user_count": position.get("sample_size", 0),
+        "insights": {
+            "strengths": insights.get("strengths", []),
+            "weaknesses": insights.get("weaknesses", []),
+            "overall_summary": insights.get("overall_summary", ""),
+        },
+    }
+
+
+def serialize_action(action: ActionRecommendation) -> dict:
+    return {
+        "id": str(action.id),
+        "title": action.title,
+        "description": action.description,
+        "impact_percent": float(action.impact_percent) if action.impact_percent else None,
+        "target_area": action.target_area,
+        "difficulty": action.difficulty,
+        "estimated_duration": action.estimated_duration,
+        "tags": action.tags or [],
+        "cta_label": action.cta_label,
+        "cta_url": action.cta_url,
+        "is_completed": action.is_completed,
+        "completed_at": action.completed_at.isoformat() if action.completed_at else None,
+        "is_bookmarked": action.is_bookmarked,
+        "created_at": action.created_at.isoformat() if action.created_at else None,
+    }
+
+
+def serialize_source(source: DataSource) -> dict:
+    return {
+        "id": str(source.id),
+        "platform": source.platform,
+        "source_url": source.source_url,
+        "status": source.status,
+        "is_confirmed": source.is_confirmed,
+        "parsed_data": source.parsed_data,
+        "last_scraped_at": source.last_scraped_at.isoformat() if source.last_scraped_at else None,
+        "error_message": source.error_message,
+        "created_at": source.created_at.isoformat() if source.created_at else None,
+    }
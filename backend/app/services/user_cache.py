@@ -0,0 +1,99 @@
+"""
+인증 유저 캐시
+- get_current_user 의 유저 조회를 공유 캐시(L1 프로세스 내 + L2 Redis)로 대체 (요청당 DB 왕복 1회 절감)
+- ORM 객체가 아닌 컬럼 값만 보관하고, 적중 시 요청 세션에 detached 상태로 붙여 그대로 수정/삭제 가능
+- Redis 에는 JSON 으로 저장 (UUID / datetime 은 컬럼 타입에 맞춰 복원)
+- 프로필 수정 / 비밀번호 재해시 / 계정 삭제 시 모든 프로세스에서 무효화
+- 자주 바뀌는 컬럼(액션 버전, 최신 스코어 포인터, 스코어링 점유)은 보관하지 않음:
+  적중 시 미로드 상태로 남아 오래된 값이 보이지 않음 (필요하면 직접 조회, 예: versions.load_versions)
+"""
+
+import json
+import uuid
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import SharedCache, TTLCache
+from app.core.config import settings
+from app.models.user import User
+
+VOLATILE_COLUMNS = frozenset({"actions_version", "latest_score_id", "scoring_lease_until"})
+_COLUMNS = tuple(
+    column.key for column in User.__table__.columns if column.key not in VOLATILE_COLUMNS
+)
+_UUID_COLUMNS = frozenset(
+    c.key for c in User.__table__.columns if c.type.python_type is uuid.UUID
+)
+_DATETIME_COLUMNS = frozenset(
+    c.key for c in User.__table__.columns if c.type.python_type is datetime
+)
+
+
+def _encode(values: dict) -> str:
+    return json.dumps(values, default=str)
+
+
+def _decode(raw: str) -> dict:
+    values = json.loads(raw)
+    for key in _UUID_COLUMNS:
+        if values.get(key) is not None:
+            values[key] = UUID(values[key])
+    for key in _DATETIME_COLUMNS:
+        if values.get(key) is not None:
+            values[key] = datetime.fromisoformat(values[key])
+    return values
+
+
+user_cache: SharedCache[dict] = SharedCache(
+    "user",
+    TTLCache(
+        "user",
+        max_entries=settings.USER_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    ),
+    l2_ttl_seconds=settings.REDIS_CACHE_TTL_SECONDS,
+    encode=_encode,
+    decode=_decode,
+)
+
+
+class _UserNotFound(Exception):
+    pass
+
+
+def _snapshot(user: User) -> dict:
+    return {key: getattr(user, key) for key in _COLUMNS}
+
+
+async def get_user(db: AsyncSession, user_id: UUID) -> User | None:
+    """캐시에 있으면 DB 조회 없이 세션에 붙인 User 를, 없으면 조회 후 캐시합니다."""
+    loaded: list[User] = []
+
+    async def load() -> dict:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise _UserNotFound
+        loaded.append(user)
+        return _snapshot(user)
+
+    try:
+        values = await user_cache.get_or_load(user_id, load)
+    except _UserNotFound:
+        return None
+    if loaded:
+        # 이 요청이 직접 조회했으면 이미 세션에 있는 객체를 그대로 사용
+        return loaded[0]
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
+async def invalidate_user(user_id: UUID) -> None:
+    await user_cache.invalidate(user_id)
@@ -0,0 +1,81 @@
+"""
+조회 응답 버전 / 조건부 요청 (ETag)
+- 스코어 버전: 최신 스코어 id + phase (provisional → final 로 같은 행이 갱신되므로 phase 포함)
+- 액션 버전: users.actions_version (액션 생성/완료/북마크 시 1 증가)
+- 두 버전을 PK 조회 한 번(users + latest_score_id 포인터)으로 읽어 ETag 를 만들고, 일치하면 무거운 조회 없이 304
+- 유저 캐시와 무관하게 항상 DB 에서 읽음 (캐시된 User 의 버전은 오래됐을 수 있음)
+"""
+
+import hashlib
+from typing import NamedTuple
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.career_score import CareerScore
+from app.models.user import User
+
+# 직렬화 형식이 바뀌면 올려서 기존 ETag 를 모두 무효화
+FORMAT_VERSION = "1"
+# 브라우저가 저장은 하되 매번 재검증 (If-None-Match)
+CACHE_CONTROL = "private, no-cache"
+
+
+class ContentVersions(NamedTuple):
+    score_id: UUID | None
+    score_phase: str | None
+    actions_version: int
+
+    @property
+    def score(self) -> str:
+        return f"{self.score_id}:{self.score_phase}" if self.score_id else "none"
+
+
+async def load_versions(db: AsyncSession, user_id: UUID) -> ContentVersions:
+    result = await db.execute(
+        select(User.actions_version, CareerScore.id, CareerScore.phase)
+        .outerjoin(CareerScore, CareerScore.id == User.latest_score_id)
+        .where(User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return ContentVersions(None, None, 0)
+    actions_version, score_id, score_phase = row
+    return ContentVersions(score_id, score_phase, actions_version or 0)
+
+
+async def bump_actions_version(db: AsyncSession, user_id: UUID) -> None:
+    """액션 집합이 바뀔 때 호출합니다. 커밋은 호출자가 합니다."""
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        # 프로필 수정 시각(updated_at)은 건드리지 않음
+        .values(actions_version=User.actions_version + 1, updated_at=User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def make_etag(*parts: object) -> str:
+    raw = ":".join(str(p) for p in (FORMAT_VERSION, *parts))
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더(목록 / 약한 비교 / *)가 etag 와 일치하는지 확인합니다."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
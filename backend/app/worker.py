@@ -0,0 +1,235 @@
+"""
+파이프라인 작업 워커
+- python -m app.worker [--queues pipeline,sources,scoring]
+- 큐별 동시 실행 수만큼 jobs 테이블에서 작업을 점유해 실행
+- 실행 중에는 주기적으로 점유 시간을 연장, SIGTERM 시 새 작업 점유를 멈추고 실행 중인 작업 완료 대기
+- 하트비트 때 핸들러가 등록한 점유(소스 실행)도 함께 연장, JobDeferred 는 시도 횟수 없이 재예약
+- WORKER_METRICS_PORT 로 이 프로세스의 메트릭(Prometheus 텍스트 형식) 노출
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from app.core.cache import close_redis
+from app.core.config import settings
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import JOB_SECONDS, JOBS_IN_FLIGHT, JOBS_TOTAL, QUEUE_DEPTH, registry
+from app.core.pool_metrics import pool_stats
+from app.core.tracing import continue_trace
+from app.models.job import Job
+from app.services import job_queue
+from app.services.llm_ledger import flush_llm_usage
+from app.services.analysis import (
+    process_all_sources,
+    process_source,
+    run_scoring_single_flight,
+)
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+HANDLERS: dict[str, JobHandler] = {
+    "process_all_sources": lambda p: process_all_sources(UUID(p["user_id"])),
+    "process_source": lambda p: process_source(
+        UUID(p["source_id"]),
+        UUID(p["run_id"]) if p.get("run_id") else None,
+    ),
+    "run_scoring": lambda p: run_scoring_single_flight(UUID(p["user_id"])),
+}
+
+
+class Worker:
+    def __init__(self, concurrency: dict[str, int], worker_id: str | None = None):
+        self.concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        logger.info(f"Worker {self.worker_id} stopping")
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info(f"Worker {self.worker_id} started: {self.concurrency}")
+        async with asyncio.TaskGroup() as tg:
+            for queue, limit in self.concurrency.items():
+                tg.create_task(self._poll(queue, limit))
+            tg.create_task(self._report_stats())
+            if settings.WORKER_METRICS_PORT:
+                tg.create_task(self._serve_metrics(settings.WORKER_METRICS_PORT))
+
+    async def _report_stats(self) -> None:
+        """커넥션 풀 대기/보유 시간 로깅 + 큐 적체 게이지 갱신 (주기적)"""
+        while not self._stopping.is_set():
+            try:
+                QUEUE_DEPTH.replace(await job_queue.queue_depths())
+            except Exception as e:
+                logger.warning(f"Queue depth refresh failed: {e}")
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), settings.WORKER_POOL_STATS_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            logger.info(f"DB pool stats: {pool_stats.snapshot()}")
+
+    async def _serve_metrics(self, port: int) -> None:
+        """GET 요청에 메트릭을 응답하는 최소 HTTP 서버 (종료 신호까지 유지)"""
+        server = await asyncio.start_server(_handle_metrics_request, port=port)
+        logger.info(f"Worker metrics on :{port}")
+        async with server:
+            await self._stopping.wait()
+
+    async def _poll(self, queue: str, limit: int) -> None:
+        in_flight: set[asyncio.Task] = set()
+
+        while not self._stopping.is_set():
+            free = limit - len(in_flight)
+            if free <= 0:
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                jobs = await job_queue.claim(queue, self.worker_id, free)
+            except Exception as e:
+                logger.error(f"Claim on queue {queue} failed: {e}")
+                jobs = []
+
+            for job in jobs:
+                task = asyncio.create_task(self._execute(job))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if not jobs:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), settings.JOB_POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        # 실행 중인 작업은 끝까지 완료
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def _execute(self, job: Job) -> None:
+        if job.attempts > job.max_attempts:
+            # 점유 만료로 재점유되면서 시도 횟수를 넘긴 작업
+            await job_queue.fail(job, self.worker_id, job.last_error or "lease expired")
+            return
+
+        handler = HANDLERS.get(job.kind)
+        if handler is None:
+            job.attempts = job.max_attempts
+            await job_queue.fail(job, self.worker_id, f"Unknown job kind: {job.kind}")
+            return
+
+        # 핸들러가 잡은 점유(소스 실행 등)를 하트비트가 함께 연장
+        renewals: set[job_queue.LeaseRenewal] = set()
+        job_queue.heartbeat_renewals.set(renewals)
+        heartbeat = asyncio.create_task(self._heartbeat(job, renewals))
+        started = time.perf_counter()
+        outcome = "failed"
+        try:
+            with (
+                JOBS_IN_FLIGHT.track_inprogress(queue=job.queue),
+                continue_trace(
+                    job.payload.get("traceparent"),
+                    f"job {job.kind}",
+                    job_id=str(job.id),
+                    queue=job.queue,
+                    attempt=job.attempts,
+                    user_id=job.payload.get("user_id"),
+                    source_id=job.payload.get("source_id"),
+                ),
+            ):
+                await handler(job.payload)
+            outcome = "ok"
+        except job_queue.JobDeferred as e:
+            outcome = "deferred"
+            await job_queue.defer(job, self.worker_id, e.run_at, str(e))
+        except Exception as e:
+            logger.exception(f"Job {job.kind} {job.id} raised")
+            await job_queue.fail(job, self.worker_id, f"{type(e).__name__}: {e}")
+        else:
+            await job_queue.complete(job.id, self.worker_id)
+        finally:
+            heartbeat.cancel()
+            JOB_SECONDS.observe(time.perf_counter() - started, queue=job.queue, kind=job.kind)
+            JOBS_TOTAL.inc(queue=job.queue, kind=job.kind, outcome=outcome)
+
+    async def _heartbeat(self, job: Job, renewals: set[job_queue.LeaseRenewal]) -> None:
+        interval = settings.JOB_VISIBILITY_TIMEOUT_SECONDS / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await job_queue.extend_lease(job.id, self.worker_id):
+                    logger.warning(f"Job {job.kind} {job.id} lease lost")
+                    return
+            except Exception as e:
+                logger.warning(f"Lease extension for job {job.id} failed: {e}")
+                continue
+            for renew in list(renewals):
+                try:
+                    await renew()
+                except Exception as e:
+                    logger.warning(f"Lease renewal for job {job.id} failed: {e}")
+
+
+async def _handle_metrics_request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    try:
+        # 요청 헤더는 경로와 무관하게 읽고 버림
+        await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        body = registry.render().encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/plain; version=0.0.4\r\n"
+            + f"Content-Length: {len(body)}\r\n".encode()
+            + b"Connection: close\r\n\r\n"
+            + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _parse_queues(arg: str | None) -> dict[str, int]:
+    if not arg:
+        return dict(settings.WORKER_QUEUE_CONCURRENCY)
+    names = [q.strip() for q in arg.split(",") if q.strip()]
+    return {q: settings.WORKER_QUEUE_CONCURRENCY.get(q, 1) for q in names}
+
+
+async def main(queues: str | None = None) -> None:
+    worker = Worker(_parse_queues(queues))
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    try:
+        await worker.run()
+    finally:
+        await flush_llm_usage()
+        await loop_monitor.stop()
+        await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Life_Pilot pipeline worker")
+    parser.add_argument("--queues", help="comma-separated queue names (default: all)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main(args.queues))
@@ -0,0 +1,137 @@
+"""
+액션 목록 조회 테스트
+- 커서는 정렬 키를 그대로 왕복, 다른 정렬 / 깨진 커서는 ValueError
+- 태그 필터는 SQL (@>), 난이도는 서열 정렬, 키셋은 행 비교
+- 한 건 더 읽었을 때만 next_cursor
+- 진행 중 / 완료 개수는 완료 필터 없이 DB 에서 집계
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.models  # noqa: F401  (관계 대상 모델 등록)
+from app.models.action_recommendation import ActionRecommendation
+from app.services import action_list
+
+USER_ID = uuid.uuid4()
+
+
+def _action(impact=None, difficulty=None, minute=0) -> ActionRecommendation:
+    return ActionRecommendation(
+        id=uuid.uuid4(),
+        user_id=USER_ID,
+        title="Write a post",
+        impact_percent=impact,
+        difficulty=difficulty,
+        created_at=datetime(2024, 1, 1, 0, minute, tzinfo=timezone.utc),
+    )
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class _ListSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        rows = self.rows
+
+        class _Result:
+            def scalars(self):
+                return self
+
+            def all(self):
+                return rows
+
+        return _Result()
+
+
+class TestCursor:
+    def test_round_trip(self):
+        action = _action(impact=Decimal("3.50"), difficulty="hard")
+        for sort, keys in action_list.SORTS.items():
+            cursor = action_list.encode_cursor(sort, action)
+            assert action_list.decode_cursor(sort, cursor) == tuple(key.value(action) for key in keys)
+
+    def test_missing_impact_sorts_last(self):
+        cursor = action_list.encode_cursor("impact", _action(impact=None))
+        assert action_list.decode_cursor("impact", cursor)[0] == Decimal(action_list.NO_IMPACT)
+
+    def test_rejects_other_sort_and_garbage(self):
+        cursor = action_list.encode_cursor("recent", _action())
+        with pytest.raises(ValueError):
+            action_list.decode_cursor("impact", cursor)
+        for garbage in ("not-a-cursor", "e30", "!!!"):
+            with pytest.raises(ValueError):
+                action_list.decode_cursor("recent", garbage)
+
+
+class TestQuery:
+    def test_filters_in_sql(self):
+        sql = _sql(action_list.build_query(USER_ID, tag="python", completed=False, limit=21))
+        assert "action_recommendations.tags @>" in sql
+        assert "is_completed" in sql
+        assert "LIMIT" in sql
+
+    def test_difficulty_uses_rank(self):
+        sql = _sql(action_list.build_query(USER_ID, sort="difficulty", limit=21))
+        assert "ORDER BY -CASE WHEN" in sql
+
+    def test_keyset_row_comparison(self):
+        after = action_list.decode_cursor("recent", action_list.encode_cursor("recent", _action()))
+        sql = _sql(action_list.build_query(USER_ID, sort="recent", after=after, limit=21))
+        assert "(action_recommendations.created_at, action_recommendations.id) <" in sql
+        assert "ORDER BY action_recommendations.created_at DESC, action_recommendations.id DESC" in sql
+
+    def test_impact_key_matches_index_expression(self):
+        sql = _sql(action_list.build_query(USER_ID, limit=21))
+        assert "coalesce(action_recommendations.impact_percent, -1) DESC" in sql
+
+
+class TestListActions:
+    def test_next_cursor_only_when_more_rows(self):
+        rows = [_action(minute=m) for m in (3, 2, 1)]
+        actions, next_cursor = asyncio.run(
+            action_list.list_actions(_ListSession(rows), USER_ID, sort="recent", limit=2)
+        )
+        assert actions == rows[:2]
+        assert action_list.decode_cursor("recent", next_cursor) == (rows[1].created_at, rows[1].id)
+
+        actions, next_cursor = asyncio.run(
+            action_list.list_actions(_ListSession(rows[:2]), USER_ID, sort="recent", limit=2)
+        )
+        assert len(actions) == 2 and next_cursor is None
+
+    def test_unknown_sort_falls_back_to_impact(self):
+        session = _ListSession([])
+        asyncio.run(action_list.list_actions(session, USER_ID, sort="alphabetical", limit=5))
+        assert "coalesce(action_recommendations.impact_percent, -1) DESC" in _sql(session.statements[0])
+
+
+class TestStatusCounts:
+    def test_counts_ignore_completed_filter(self):
+        sql = _sql(action_list.build_status_counts_query(USER_ID, tag="python", area="influence"))
+        assert "GROUP BY action_recommendations.is_completed" in sql
+        assert "action_recommendations.tags @>" in sql and "target_area" in sql
+        assert "is_completed =" not in sql
+
+    def test_missing_status_is_zero(self):
+        class _Session:
+            async def execute(self, stmt):
+                class _Result:
+                    def all(self):
+                        return [(True, 3)]
+
+                return _Result()
+
+        counts = asyncio.run(action_list.count_by_status(_Session(), USER_ID))
+        assert counts == {"pending": 0, "completed": 3}
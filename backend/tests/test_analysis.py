@@ -0,0 +1,347 @@
+"""
+스코어링 파이프라인 테스트
+- 입력 지문이 같아도 final 스코어만 재사용 (fallback 은 다시 보정)
+- 보정 실패(API 오류 / 키 없음)는 시간 초과와 같이 fallback 으로 저장
+- 최종 스코어 저장이 실패하면 병렬로 시작한 액션 생성을 취소
+- 액션 생성이 제한 시간을 넘으면 취소하고 스코어는 그대로 반환 (실행이 점유보다 길어지지 않음)
+- 재스캔으로 대체된 소스 실행은 스크래핑 / 파싱 전에 멈추고 체크포인트를 남기지 않음
+- 다른 워커가 점유한 소스 작업은 점유 만료까지 미루고, 점유는 작업 하트비트로 연장
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.models  # noqa: F401  (관계 대상 모델 등록)
+from app.core.config import settings
+from app.models.data_source import DataSource
+from app.models.user import User
+from app.services import ai_scorer, analysis, job_queue
+from app.services.profile_snapshot import ProfileSnapshot
+
+USER_ID = uuid.uuid4()
+SCORE_ID = uuid.uuid4()
+
+
+class _Rescored(Exception):
+    """지문 검사를 지나 스코어링 단계에 들어섰음을 알리는 표시"""
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+    def first(self):
+        return self.value
+
+
+class _ScoringSession:
+    """유저 → 소스 → 최신 스코어 순서의 조회에 응답"""
+
+    def __init__(self, latest, responses=None):
+        user = User(id=USER_ID, job_category="backend", years_of_experience=3, latest_score_id=SCORE_ID)
+        source = DataSource(user_id=USER_ID, parsed_data={"platform": "github"})
+        self.responses = responses if responses is not None else iter([user, [source], latest])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, stmt):
+        return _Result(next(self.responses, None))
+
+    def add(self, obj):
+        pass
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        pass
+
+
+def _run_scoring(monkeypatch, phase: str):
+    latest = SimpleNamespace(id=SCORE_ID, input_fingerprint="fp", phase=phase)
+
+    class _Scorer:
+        @classmethod
+        def from_snapshot(cls, snapshot):
+            raise _Rescored
+
+    async def no_progress(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(analysis, "async_session", lambda: _ScoringSession(latest))
+    monkeypatch.setattr(analysis, "scoring_fingerprint", lambda *args: "fp")
+    monkeypatch.setattr(analysis.ProfileSnapshot, "build", classmethod(lambda cls, *a, **kw: None))
+    monkeypatch.setattr(analysis, "CareerScorer", _Scorer)
+    monkeypatch.setattr(analysis, "publish_progress", no_progress)
+    return asyncio.run(analysis.run_scoring(USER_ID))
+
+
+class TestFingerprintSkip:
+    def test_final_score_is_reused(self, monkeypatch):
+        assert _run_scoring(monkeypatch, "final") == {"skipped": True, "score_id": str(SCORE_ID)}
+
+    @pytest.mark.parametrize("phase", ["fallback", "provisional"])
+    def test_uncalibrated_score_is_rescored(self, monkeypatch, phase):
+        with pytest.raises(_Rescored):
+            _run_scoring(monkeypatch, phase)
+
+
+BASE_SCORES = {
+    "expertise": 60.0,
+    "influence": 50.0,
+    "consistency": 55.0,
+    "marketability": 65.0,
+    "potential": 70.0,
+    "total": 59.5,
+    "analysis_accuracy": 65,
+}
+
+
+def _patch_full_run(monkeypatch, calibration, update_member=None, plan_actions=None) -> list:
+    """지문이 달라 새로 스코어링하는 실행 전체를 준비합니다. 진행 이벤트의 phase 를 모을 목록을 반환합니다."""
+    user = User(id=USER_ID, job_category="backend", years_of_experience=3, latest_score_id=None)
+    source = DataSource(user_id=USER_ID, parsed_data={"platform": "github"})
+    responses = iter([user, [source], None])
+    phases = []
+
+    class _Scorer:
+        @classmethod
+        def from_snapshot(cls, snapshot):
+            return cls()
+
+        def calculate_all(self):
+            return dict(BASE_SCORES)
+
+    async def record_progress(db, user_id, type, **payload):
+        if type == "scoring":
+            phases.append(payload["phase"])
+
+    async def fake_calibration(snapshot, scores):
+        return calibration
+
+    async def noop(*args, **kwargs):
+        pass
+
+    async def no_actions(snapshot, result):
+        return []
+
+    monkeypatch.setattr(analysis, "async_session", lambda: _ScoringSession(None, responses))
+    monkeypatch.setattr(analysis, "scoring_fingerprint", lambda *args: "fp")
+    monkeypatch.setattr(analysis.ProfileSnapshot, "build", classmethod(lambda cls, *a, **kw: None))
+    monkeypatch.setattr(analysis, "CareerScorer", _Scorer)
+    monkeypatch.setattr(analysis, "publish_progress", record_progress)
+    monkeypatch.setattr(analysis, "get_ai_calibration", fake_calibration)
+    monkeypatch.setattr(analysis, "update_member", update_member or noop)
+    monkeypatch.setattr(analysis, "invalidate_scores", noop)
+    monkeypatch.setattr(analysis, "bump_actions_version", noop)
+    monkeypatch.setattr(analysis, "plan_actions", plan_actions or no_actions)
+    monkeypatch.setattr(analysis, "save_actions", lambda *args: None)
+    return phases
+
+
+class TestCalibrationOutcome:
+    def test_calibrated_score_is_final(self, monkeypatch):
+        phases = _patch_full_run(monkeypatch, {"adjustments": {"expertise": 5}, "insights": {}})
+        result = asyncio.run(analysis.run_scoring(USER_ID))
+        assert result["phase"] == "final"
+        assert phases == ["provisional", "final"]
+
+    def test_unavailable_calibration_is_fallback(self, monkeypatch):
+        phases = _patch_full_run(monkeypatch, None)
+        result = asyncio.run(analysis.run_scoring(USER_ID))
+        assert result["phase"] == "fallback"
+        assert phases == ["provisional", "fallback"]
+
+    def test_api_failure_returns_no_calibration(self, monkeypatch):
+        async def failing_stream(**kwargs):
+            raise ConnectionError("overloaded")
+
+        monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setattr(ai_scorer, "stream_model", failing_stream)
+        snapshot = ProfileSnapshot.build([], "backend", 3)
+        assert asyncio.run(ai_scorer.get_ai_calibration(snapshot, BASE_SCORES)) is None
+
+    def test_missing_api_key_returns_no_calibration(self, monkeypatch):
+        monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "")
+        snapshot = ProfileSnapshot.build([], "backend", 3)
+        assert asyncio.run(ai_scorer.get_ai_calibration(snapshot, BASE_SCORES)) is None
+
+
+class TestActionsTask:
+    def test_cancelled_when_final_persist_fails(self, monkeypatch):
+        calls = []
+
+        async def failing_update_member(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                await asyncio.sleep(0)  # 액션 생성이 시작되도록 한 번 양보
+                raise RuntimeError("db down")
+
+        async def slow_plan_actions(snapshot, result):
+            await asyncio.sleep(3600)
+
+        _patch_full_run(
+            monkeypatch,
+            {"adjustments": {}, "insights": {}},
+            update_member=failing_update_member,
+            plan_actions=slow_plan_actions,
+        )
+
+        async def run() -> list[asyncio.Task]:
+            with pytest.raises(RuntimeError, match="db down"):
+                await analysis.run_scoring(USER_ID)
+            await asyncio.sleep(0)
+            # asyncio.run 의 정리 전에 남아 있는 태스크 확인
+            current = asyncio.current_task()
+            return [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+
+        assert asyncio.run(run()) == []
+
+
+    def test_timed_out_when_generation_is_slow(self, monkeypatch):
+        started = []
+
+        async def slow_plan_actions(snapshot, result):
+            started.append(True)
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(settings, "SCORING_ACTIONS_TIMEOUT_SECONDS", 0.01)
+        _patch_full_run(
+            monkeypatch, {"adjustments": {}, "insights": {}}, plan_actions=slow_plan_actions
+        )
+
+        async def run():
+            result = await analysis.run_scoring(USER_ID)
+            current = asyncio.current_task()
+            return result, [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+
+        result, leftover = asyncio.run(run())
+        assert result["phase"] == "final"
+        assert started and leftover == []
+
+
+RUN_ID = uuid.uuid4()
+SOURCE_ID = uuid.uuid4()
+
+
+def _patch_source_run(monkeypatch, advances: list[bool], claimed=True, lease_until=None) -> dict:
+    """advance 결과를 순서대로 돌려주는 소스 실행 준비. 호출 기록을 반환합니다."""
+    row = SimpleNamespace(
+        user_id=USER_ID, platform="github", source_url="https://github.com/x",
+        status="pending", run_id=RUN_ID, lease_until=lease_until,
+    )
+    calls = {"scrape": 0, "parse": 0, "checkpoints": [], "finish": 0, "renewals": []}
+    results = iter(advances)
+
+    async def claim(*args):
+        return claimed
+
+    async def no_checkpoints(db, source_id, run_id):
+        return {}
+
+    async def advance(self, db, **values):
+        return next(results)
+
+    async def finish(self, db, **values):
+        calls["finish"] += 1
+        return True
+
+    async def scrape(url, platform):
+        calls["scrape"] += 1
+        calls["renewals"].append(set(job_queue.heartbeat_renewals.get() or ()))
+        return {"success": True, "cleaned_text": "text", "raw_html": "<html/>"}
+
+    async def parse(text, platform, url):
+        calls["parse"] += 1
+        return SimpleNamespace(model_dump=lambda mode: {"platform": platform})
+
+    async def record_checkpoint(db, source_id, run_id, stage, data):
+        calls["checkpoints"].append(stage)
+
+    monkeypatch.setattr(analysis, "async_session", lambda: _ScoringSession(None, iter([row])))
+    monkeypatch.setattr(analysis, "_claim_source_run", claim)
+    monkeypatch.setattr(analysis, "load_checkpoints", no_checkpoints)
+    monkeypatch.setattr(analysis._SourceRun, "advance", advance)
+    monkeypatch.setattr(analysis._SourceRun, "finish", finish)
+    monkeypatch.setattr(analysis, "scrape_url", scrape)
+    monkeypatch.setattr(analysis, "parse_with_ai", parse)
+    monkeypatch.setattr(analysis, "save_checkpoint", record_checkpoint)
+    return calls
+
+
+class TestSupersededSourceRun:
+    def test_stops_before_scraping(self, monkeypatch):
+        calls = _patch_source_run(monkeypatch, [False])
+        asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert calls["scrape"] == 0 and calls["checkpoints"] == []
+
+    def test_no_scrape_checkpoint_or_parse_after_superseded_scrape(self, monkeypatch):
+        calls = _patch_source_run(monkeypatch, [True, False])
+        asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert calls["scrape"] == 1
+        assert calls["checkpoints"] == [] and calls["parse"] == 0
+
+    def test_stops_before_parsing(self, monkeypatch):
+        calls = _patch_source_run(monkeypatch, [True, True, False])
+        asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert calls["checkpoints"] == [analysis.STAGE_SCRAPE] and calls["parse"] == 0
+
+    def test_no_parse_checkpoint_after_superseded_parse(self, monkeypatch):
+        calls = _patch_source_run(monkeypatch, [True, True, True, False])
+        asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert calls["parse"] == 1
+        assert calls["checkpoints"] == [analysis.STAGE_SCRAPE] and calls["finish"] == 0
+
+    def test_completes_when_run_is_current(self, monkeypatch):
+        calls = _patch_source_run(monkeypatch, [True, True, True, True])
+        asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert calls["checkpoints"] == [analysis.STAGE_SCRAPE, analysis.STAGE_PARSE]
+        assert calls["finish"] == 1
+
+
+class TestSourceLease:
+    def test_busy_run_defers_job_until_lease_expires(self, monkeypatch):
+        lease_until = datetime.now(timezone.utc) + timedelta(seconds=120)
+        calls = _patch_source_run(monkeypatch, [], claimed=False, lease_until=lease_until)
+        with pytest.raises(job_queue.JobDeferred) as exc:
+            asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert exc.value.run_at == lease_until
+        assert calls["scrape"] == 0
+
+    def test_expired_lease_retries_after_poll_interval(self, monkeypatch):
+        expired = datetime.now(timezone.utc) - timedelta(seconds=5)
+        _patch_source_run(monkeypatch, [], claimed=False, lease_until=expired)
+        with pytest.raises(job_queue.JobDeferred) as exc:
+            asyncio.run(analysis.process_source(SOURCE_ID, RUN_ID))
+        assert exc.value.run_at > datetime.now(timezone.utc)
+
+    def test_claimed_run_is_renewed_by_job_heartbeat(self, monkeypatch):
+        calls = _patch_source_run(monkeypatch, [True, True, True, True])
+
+        async def run_as_job() -> set:
+            renewals = set()
+            job_queue.heartbeat_renewals.set(renewals)
+            await analysis.process_source(SOURCE_ID, RUN_ID)
+            return renewals
+
+        assert asyncio.run(run_as_job()) == set()
+        (during_scrape,) = calls["renewals"]
+        assert len(during_scrape) == 1
+        assert next(iter(during_scrape)).__func__ is analysis._SourceRun.renew
@@ -0,0 +1,310 @@
+"""
+캐시 테스트
+- LRU + TTL 동작과 적중률 집계
+- 공유 캐시: L2(Redis) 적중 / 동시 미스 single-flight / 다른 프로세스 로드 대기 / 무효화 통지
+- 무효화 전에 읽은 원본을 늦게 채우는 로드는 L1 / L2 어디에도 남지 않음 (세대 불일치)
+- Redis 장애 시 L1 + 원본 조회로 동작
+- 인증 유저 캐시: 적중 시 DB 조회 없이 세션에 붙어 수정 가능, 무효화, JSON 왕복 시 타입 복원
+- 자주 바뀌는 컬럼(actions_version 등)은 캐시하지 않아 갱신이 바로 보임
+"""
+
+import asyncio
+import json
+
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401  (관계 대상 모델 등록)
+from app.core import cache as cache_module
+from app.core.cache import INVALIDATION_CHANNEL, SharedCache, TTLCache, handle_invalidation
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services.user_cache import (
+    VOLATILE_COLUMNS,
+    _decode,
+    _encode,
+    get_user,
+    invalidate_user,
+    user_cache,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_hit_miss_and_rate(self):
+        cache = TTLCache("t", max_entries=10, ttl_seconds=5)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_expires(self):
+        clock = _Clock()
+        cache = TTLCache("t", max_entries=10, ttl_seconds=5, clock=clock)
+        cache.set("a", 1)
+        clock.now = 5.0
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache("t", max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class _FakeRedis:
+    """SharedCache 가 쓰는 명령만 흉내 내는 메모리 Redis (TTL 무시)"""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.published: list[tuple[str, str]] = []
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    async def incr(self, key):
+        self._check()
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+    async def pexpire(self, key, ms):
+        self._check()
+
+    async def set(self, key, value, nx=False, px=None):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        self._check()
+        self.data.pop(key, None)
+
+    async def publish(self, channel, message):
+        self._check()
+        self.published.append((channel, message))
+
+
+def _shared(name: str, redis: _FakeRedis | None, **kwargs) -> SharedCache:
+    return SharedCache(
+        name, TTLCache(name, max_entries=10, ttl_seconds=60), l2_ttl_seconds=60,
+        client=lambda: redis, **kwargs,
+    )
+
+
+class _Loader:
+    def __init__(self, value, delay: float = 0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+class TestSharedCache:
+    def test_l2_shared_between_processes(self):
+        redis = _FakeRedis()
+        first, second = _shared("shared", redis), _shared("shared", redis)
+        loader = _Loader({"v": 1})
+
+        assert asyncio.run(first.get_or_load("k", loader)) == {"v": 1}
+        # 다른 프로세스(L1 비어 있음)는 L2 에서 읽고 원본은 다시 조회하지 않음
+        assert asyncio.run(second.get_or_load("k", loader)) == {"v": 1}
+        assert loader.calls == 1
+        assert second.l2_hits == 1
+
+    def test_concurrent_misses_load_once(self):
+        cache = _shared("flight", _FakeRedis())
+        loader = _Loader("value", delay=0.01)
+
+        async def burst():
+            return await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(20)))
+
+        assert asyncio.run(burst()) == ["value"] * 20
+        assert loader.calls == 1
+
+    def test_waits_for_other_process_holding_lock(self):
+        redis = _FakeRedis()
+        cache = _shared("locked", redis, lock_wait_seconds=1.0)
+        redis.data[f"{cache._key('k')}:lock"] = "1"
+        loader = _Loader("mine")
+
+        async def other_process_finishes():
+            await asyncio.sleep(0.1)
+            redis.data[cache._key("k")] = "0:" + json.dumps("theirs")
+
+        async def run():
+            result, _ = await asyncio.gather(cache.get_or_load("k", loader), other_process_finishes())
+            return result
+
+        assert asyncio.run(run()) == "theirs"
+        assert loader.calls == 0
+
+    def test_invalidate_publishes_and_drops_local_copies(self):
+        redis = _FakeRedis()
+        cache = _shared("inv", redis)
+        asyncio.run(cache.get_or_load("k", _Loader(1)))
+
+        asyncio.run(cache.invalidate("k"))
+        assert cache._key("k") not in redis.data
+        channel, message = redis.published[0]
+        assert channel == INVALIDATION_CHANNEL
+
+        # 다른 프로세스의 L1 은 통지 메시지로 삭제
+        cache.l1.set("k", 1)
+        handle_invalidation(message)
+        assert len(cache.l1) == 0
+
+    def test_fill_racing_an_invalidation_is_not_served(self):
+        redis = _FakeRedis()
+        first, second = _shared("race", redis), _shared("race", redis)
+
+        async def stale_loader():
+            # 원본을 읽은 직후 다른 곳에서 갱신 + 무효화 (채우기는 그 뒤에 일어남)
+            await first.invalidate("k")
+            return "old"
+
+        async def run():
+            assert await first.get_or_load("k", stale_loader) == "old"
+            fresh = _Loader("new")
+            # 다른 프로세스도 이 프로세스도 늦게 채운 이전 값을 읽지 않음
+            assert await second.get_or_load("k", fresh) == "new"
+            assert await first.get_or_load("k", fresh) == "new"
+            return fresh.calls
+
+        assert asyncio.run(run()) == 1
+
+    def test_redis_failure_falls_back_to_loader(self):
+        redis = _FakeRedis()
+        redis.fail = True
+        cache = _shared("down", redis)
+        loader = _Loader(5)
+        try:
+            assert asyncio.run(cache.get_or_load("k", loader)) == 5
+            assert asyncio.run(cache.get_or_load("k", loader)) == 5
+        finally:
+            cache_module._redis_down_until = 0.0
+        assert loader.calls == 1
+
+
+class _AsyncSessionAdapter:
+    """동기 Session 을 get_user 가 쓰는 최소 AsyncSession 인터페이스로 감쌈"""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return self.session.execute(stmt)
+
+    def add(self, obj):
+        self.session.add(obj)
+
+
+class TestUserCache:
+    def setup_method(self):
+        self._redis_url = settings.REDIS_URL
+        settings.REDIS_URL = ""
+        user_cache.clear()
+        self.engine = create_engine("sqlite://")
+        User.__table__.create(self.engine)
+        with Session(self.engine) as session:
+            user = User(email="a@example.com", name="before", auth_provider="email")
+            session.add(user)
+            session.commit()
+            self.user_id = user.id
+
+    def teardown_method(self):
+        settings.REDIS_URL = self._redis_url
+
+    def _get(self) -> tuple[User | None, _AsyncSessionAdapter]:
+        db = _AsyncSessionAdapter(Session(self.engine))
+        return asyncio.run(get_user(db, self.user_id)), db
+
+    def test_second_lookup_skips_db(self):
+        _, first = self._get()
+        user, second = self._get()
+
+        assert first.queries == 1
+        assert second.queries == 0
+        assert user.email == "a@example.com"
+
+    def test_cached_user_is_writable_and_invalidated(self):
+        self._get()
+        user, db = self._get()
+
+        user.name = "after"
+        db.session.commit()
+        asyncio.run(invalidate_user(self.user_id))
+
+        fresh, fresh_db = self._get()
+        assert fresh_db.queries == 1
+        assert fresh.name == "after"
+
+    def test_volatile_columns_are_not_cached(self):
+        self._get()
+        cached = user_cache.l1.get(str(self.user_id))
+        assert VOLATILE_COLUMNS.isdisjoint(cached)
+
+    def test_actions_version_bump_is_visible_through_current_user(self):
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=create_access_token(str(self.user_id))
+        )
+
+        def current_user() -> User:
+            db = _AsyncSessionAdapter(Session(self.engine))
+            return asyncio.run(get_current_user(credentials=credentials, db=db))
+
+        assert current_user().actions_version == 0
+        with Session(self.engine) as session:
+            session.execute(
+                update(User)
+                .where(User.id == self.user_id)
+                .values(actions_version=User.actions_version + 1)
+            )
+            session.commit()
+
+        # 캐시 적중(무효화 없음)이어도 새 값
+        assert user_cache.l1.get(str(self.user_id)) is not None
+        assert current_user().actions_version == 1
+
+    def test_json_round_trip_restores_types(self):
+        user, _ = self._get()
+        values = {key: getattr(user, key) for key in User.__table__.columns.keys()}
+
+        assert _decode(_encode(values)) == values
@@ -0,0 +1,86 @@
+"""
+파이프라인 체크포인트 테스트
+- 멱등 키 (소스 + 실행 + 단계)
+- 체크포인트 저장은 같은 키에 대해 한 번만 (ON CONFLICT DO NOTHING)
+- 소스 점유 쿼리 (실행 id + 만료된 점유만)
+"""
+
+import asyncio
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.analysis import _claim_source_run
+from app.services.checkpoints import STAGE_PARSE, STAGE_SCRAPE, idempotency_key, save_checkpoint
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+        class _Result:
+            rowcount = 1
+
+            def scalar_one_or_none(self):
+                return "scraping"
+
+        return _Result()
+
+    async def commit(self):
+        pass
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestIdempotencyKey:
+    def test_distinct_per_run_and_stage(self):
+        source, run_a, run_b = UUID(int=1), UUID(int=2), UUID(int=3)
+
+        assert idempotency_key(source, run_a, STAGE_SCRAPE) == idempotency_key(
+            source, run_a, STAGE_SCRAPE
+        )
+        assert idempotency_key(source, run_a, STAGE_SCRAPE) != idempotency_key(
+            source, run_a, STAGE_PARSE
+        )
+        assert idempotency_key(source, run_a, STAGE_PARSE) != idempotency_key(
+            source, run_b, STAGE_PARSE
+        )
+
+    def test_fits_column(self):
+        key = idempotency_key(UUID(int=1), UUID(int=2), STAGE_PARSE)
+        assert len(key) <= 120
+
+
+class TestSaveCheckpoint:
+    def test_insert_is_idempotent(self):
+        db = _RecordingSession()
+
+        asyncio.run(save_checkpoint(db, UUID(int=1), UUID(int=2), STAGE_PARSE, {"a": 1}))
+
+        stmt = db.statements[0]
+        sql = _sql(stmt)
+        assert "ON CONFLICT (idempotency_key) DO NOTHING" in sql
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["idempotency_key"] == idempotency_key(UUID(int=1), UUID(int=2), STAGE_PARSE)
+
+
+class TestClaimSourceRun:
+    def test_claim_requires_current_run_and_free_lease(self):
+        db = _RecordingSession()
+
+        claimed = asyncio.run(
+            _claim_source_run(db, UUID(int=9), UUID(int=1), UUID(int=2), "w1")
+        )
+
+        assert claimed is True
+        sql = _sql(db.statements[0])
+        assert "data_sources.run_id = " in sql
+        assert "data_sources.lease_until IS NULL OR data_sources.lease_until < " in sql
+        # 점유 성공은 같은 트랜잭션에서 진행 이벤트로 발행
+        assert "pg_notify" in _sql(db.statements[1])
+
@@ -0,0 +1,42 @@
+"""
+KeyedLimiter 동시 실행 한도 테스트
+"""
+
+import asyncio
+
+from app.core.concurrency import KeyedLimiter
+
+
+async def _run(limiter: KeyedLimiter, key: str, running: dict, peak: dict):
+    async with limiter.slot(key):
+        running[key] = running.get(key, 0) + 1
+        peak[key] = max(peak.get(key, 0), running[key])
+        await asyncio.sleep(0.01)
+        running[key] -= 1
+
+
+class TestKeyedLimiter:
+    def test_limit_applies_per_key(self):
+        limiter = KeyedLimiter(2)
+        running: dict = {}
+        peak: dict = {}
+
+        async def main():
+            await asyncio.gather(
+                *[_run(limiter, "a", running, peak) for _ in range(6)],
+                *[_run(limiter, "b", running, peak) for _ in range(6)],
+            )
+
+        asyncio.run(main())
+
+        assert peak == {"a": 2, "b": 2}
+
+    def test_slots_are_released(self):
+        limiter = KeyedLimiter(1)
+
+        async def main():
+            await asyncio.gather(*[_run(limiter, "a", {}, {}) for _ in range(3)])
+
+        asyncio.run(main())
+
+        assert limiter.active_keys() == 0
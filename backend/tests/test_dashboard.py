@@ -0,0 +1,155 @@
+"""
+대시보드 집계 테스트
+- ETag 는 내용이 같으면 동일, 바뀌면 달라짐
+- If-None-Match 일치 시 304 (본문 없음)
+- 포지셔닝은 캐시된 스코어 본문 + 직군 분포 위치로 구성 (분포가 없으면 AI 추정치)
+- DB 조회는 요청당 세션(풀 연결) 하나에서 차례로 실행
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+
+import app.models  # noqa: F401  (관계 대상 모델 등록)
+from app.api.v1 import dashboard as dashboard_api
+from app.models.action_recommendation import ActionRecommendation
+from app.models.user import User
+from app.services import dashboard
+from app.services.dashboard import etag_for
+from app.services.serializers import serialize_action, serialize_market_position
+
+PAYLOAD = {
+    "sources": [{"id": "s1", "status": "completed"}],
+    "score": {"has_score": False},
+    "market_position": None,
+    "history": [],
+    "actions": [],
+}
+
+
+class TestETag:
+    def test_stable_regardless_of_key_order(self):
+        reordered = dict(reversed(list(PAYLOAD.items())))
+        assert etag_for(PAYLOAD) == etag_for(reordered)
+        assert etag_for(PAYLOAD).startswith('"') and etag_for(PAYLOAD).endswith('"')
+
+    def test_changes_with_content(self):
+        changed = {**PAYLOAD, "sources": [{"id": "s1", "status": "failed"}]}
+        assert etag_for(PAYLOAD) != etag_for(changed)
+
+
+class TestEndpoint:
+    def _call(self, monkeypatch, if_none_match):
+        async def fake_load(user, actions_limit):
+            return PAYLOAD
+
+        monkeypatch.setattr(dashboard_api, "load_dashboard", fake_load)
+        return asyncio.run(dashboard_api.get_dashboard(
+            actions_limit=3, if_none_match=if_none_match, user=User(id=uuid.uuid4()),
+        ))
+
+    def test_returns_body_with_etag(self, monkeypatch):
+        response = self._call(monkeypatch, None)
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag_for(PAYLOAD)
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_not_modified(self, monkeypatch):
+        response = self._call(monkeypatch, etag_for(PAYLOAD))
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag_for(PAYLOAD)
+
+
+class TestSerializers:
+    def test_action_shape(self):
+        action = ActionRecommendation(
+            id=uuid.uuid4(),
+            title="Write a post",
+            impact_percent=3.5,
+            tags=None,
+            is_completed=False,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        data = serialize_action(action)
+        assert data["impact_percent"] == 3.5
+        assert data["tags"] == []
+        assert data["completed_at"] is None
+        assert data["created_at"] == "2024-01-01T00:00:00+00:00"
+
+    def test_market_position_from_cached_bodies(self):
+        user = User(id=uuid.uuid4(), job_category="backend", years_of_experience=3)
+        score = {
+            "has_score": True,
+            "scores": {"total": 71.5},
+            "insights": {"market_position_percentile": 80, "strengths": ["sql"]},
+        }
+        position = {
+            "years_band": "3-5",
+            "sample_size": 12,
+            "percentiles": {"total": 64.2, "expertise": 90.0},
+            "averages": {"total": 62.345},
+        }
+        data = serialize_market_position(user, score, position)
+        assert data["my_total_score"] == 71.5
+        assert data["percentile"] == 64.2
+        assert data["percentile_source"] == "distribution"
+        assert data["area_percentiles"]["expertise"] == 90.0
+        assert data["category_avg_score"] == 62.3
+        assert data["category_user_count"] == 12
+        assert data["insights"]["strengths"] == ["sql"]
+
+    def test_market_position_falls_back_to_estimate(self):
+        user = User(id=uuid.uuid4(), job_category="backend")
+        score = {"scores": {"total": 50.0}, "insights": {"market_position_percentile": 80}}
+        data = serialize_market_position(user, score, {"percentiles": {}, "averages": {}})
+        assert data["percentile"] == 80
+        assert data["percentile_source"] == "estimate"
+
+
+class TestLoadDashboard:
+    def test_queries_share_one_session(self, monkeypatch):
+        state = {"sessions": 0, "open": 0, "in_flight": 0, "max_in_flight": 0, "statements": 0}
+
+        class _Session:
+            async def __aenter__(self):
+                state["sessions"] += 1
+                state["open"] += 1
+                return self
+
+            async def __aexit__(self, *exc):
+                state["open"] -= 1
+
+            async def execute(self, stmt):
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                await asyncio.sleep(0)
+                state["in_flight"] -= 1
+                state["statements"] += 1
+
+                class _Result:
+                    def scalars(self):
+                        return self
+
+                    def all(self):
+                        return []
+
+                return _Result()
+
+        async def cached_score(user_id):
+            assert state["open"] == 0
+            return {"has_score": False}
+
+        async def cached_distribution(job_category):
+            return {}
+
+        monkeypatch.setattr(dashboard, "async_session", _Session)
+        monkeypatch.setattr(dashboard.score_cache, "get_latest_score", cached_score)
+        monkeypatch.setattr(dashboard.score_cache, "get_distribution", cached_distribution)
+
+        payload = asyncio.run(dashboard.load_dashboard(User(id=uuid.uuid4()), 3))
+        assert payload["sources"] == [] and payload["actions"] == []
+        assert state["sessions"] == 1
+        assert state["statements"] == 3
+        assert state["max_in_flight"] == 1
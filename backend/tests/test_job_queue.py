@@ -0,0 +1,249 @@
+"""
+작업 큐 테스트
+- 재시도 백오프
+- 점유 쿼리 (SKIP LOCKED, visibility timeout)
+- 작업 종류 ↔ 워커 핸들러 매핑
+- 스코어링 single-flight (dedupe, 짧은 트랜잭션 점유 — 실행 중 연결 미보유, 하트비트로 연장)
+- 워커: JobDeferred 는 실패 대신 재예약, 하트비트가 등록된 점유를 함께 연장
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.services.job_queue import (
+    JOB_QUEUES,
+    claim_statement,
+    enqueue_scoring,
+    retry_delay,
+    scoring_key,
+)
+from app import worker
+from app.services import analysis, job_queue
+from app.worker import HANDLERS, Worker, _parse_queues
+
+
+class TestRetryDelay:
+    def test_exponential(self):
+        base = settings.JOB_RETRY_BASE_SECONDS
+        assert retry_delay(1) == timedelta(seconds=base)
+        assert retry_delay(2) == timedelta(seconds=base * 2)
+        assert retry_delay(3) == timedelta(seconds=base * 4)
+
+    def test_capped(self):
+        assert retry_delay(50) == timedelta(seconds=settings.JOB_RETRY_MAX_SECONDS)
+
+
+class TestClaimStatement:
+    def test_uses_skip_locked_and_returns_jobs(self):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        sql = str(
+            claim_statement("sources", "w1", 5, now).compile(dialect=postgresql.dialect())
+        )
+
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        assert "jobs.locked_until <" in sql
+
+
+class TestRegistry:
+    def test_every_kind_has_a_handler(self):
+        assert set(JOB_QUEUES) == set(HANDLERS)
+
+    def test_every_queue_has_concurrency(self):
+        assert set(JOB_QUEUES.values()) <= set(settings.WORKER_QUEUE_CONCURRENCY)
+
+    def test_parse_queues(self):
+        assert _parse_queues("scoring") == {
+            "scoring": settings.WORKER_QUEUE_CONCURRENCY["scoring"]
+        }
+        assert _parse_queues(None) == settings.WORKER_QUEUE_CONCURRENCY
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+        class _Result:
+            def scalar_one_or_none(self):
+                return None
+
+        return _Result()
+
+
+class TestScoringSingleFlight:
+    def _patch_sessions(self, monkeypatch, lease_until):
+        state = {"open": 0, "statements": []}
+
+        class _Session:
+            async def __aenter__(self):
+                state["open"] += 1
+                return self
+
+            async def __aexit__(self, *exc):
+                state["open"] -= 1
+
+            async def execute(self, stmt):
+                state["statements"].append(stmt)
+
+                class _Result:
+                    def scalar_one_or_none(self):
+                        return lease_until
+
+                return _Result()
+
+            async def commit(self):
+                pass
+
+        monkeypatch.setattr(analysis, "async_session", _Session)
+        return state
+
+    def test_lease_is_not_held_on_a_connection_while_scoring(self, monkeypatch):
+        lease_until = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        state = self._patch_sessions(monkeypatch, lease_until)
+
+        async def fake_run_scoring(user_id):
+            assert state["open"] == 0
+            return {"ok": True}
+
+        monkeypatch.setattr(analysis, "run_scoring", fake_run_scoring)
+        assert asyncio.run(analysis.run_scoring_single_flight(UUID(int=1))) == {"ok": True}
+
+        acquire, release = [
+            str(stmt.compile(dialect=postgresql.dialect())) for stmt in state["statements"]
+        ]
+        assert "users.scoring_lease_until IS NULL OR users.scoring_lease_until < now()" in acquire
+        assert "RETURNING users.scoring_lease_until" in acquire
+        assert "users.scoring_lease_until = " in release
+        assert state["statements"][1].compile().params["scoring_lease_until"] is None
+
+    def test_lease_is_renewed_by_job_heartbeat(self, monkeypatch):
+        lease_until = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        state = self._patch_sessions(monkeypatch, lease_until)
+
+        async def fake_run_scoring(user_id):
+            (renew,) = job_queue.heartbeat_renewals.get()
+            await renew()
+            return {"ok": True}
+
+        async def run_as_job():
+            renewals = set()
+            job_queue.heartbeat_renewals.set(renewals)
+            result = await analysis.run_scoring_single_flight(UUID(int=1))
+            return result, renewals
+
+        monkeypatch.setattr(analysis, "run_scoring", fake_run_scoring)
+        assert asyncio.run(run_as_job()) == ({"ok": True}, set())
+
+        acquire, renew, release = [
+            str(stmt.compile(dialect=postgresql.dialect())) for stmt in state["statements"]
+        ]
+        assert "WHERE users.id = " in renew and "users.scoring_lease_until = " in renew
+        assert "RETURNING users.scoring_lease_until" in renew
+        assert "users.scoring_lease_until = " in release
+
+    def test_busy_lease_schedules_follow_up(self, monkeypatch):
+        self._patch_sessions(monkeypatch, None)
+        queued = []
+
+        async def fake_enqueue(db, user_id):
+            queued.append(user_id)
+            return True
+
+        async def fail_run_scoring(user_id):
+            raise AssertionError("must not score without the lease")
+
+        monkeypatch.setattr(analysis, "enqueue_scoring", fake_enqueue)
+        monkeypatch.setattr(analysis, "run_scoring", fail_run_scoring)
+        assert asyncio.run(analysis.run_scoring_single_flight(UUID(int=1))) is None
+        assert queued == [UUID(int=1)]
+
+    def test_enqueue_scoring_coalesces_on_queued_key(self):
+        db = _RecordingSession()
+        before = datetime.now(timezone.utc)
+
+        inserted = asyncio.run(enqueue_scoring(db, UUID(int=1)))
+
+        assert inserted is False
+        stmt = db.statements[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (dedupe_key) WHERE status = " in sql
+        assert "DO NOTHING" in sql
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["dedupe_key"] == f"run_scoring:{UUID(int=1)}"
+        assert params["run_at"] >= before + timedelta(seconds=settings.SCORING_DEBOUNCE_SECONDS)
+
+
+class TestWorkerLeases:
+    def _job(self):
+        return SimpleNamespace(
+            id=UUID(int=7), kind="process_source", queue="sources", attempts=1,
+            max_attempts=3, payload={}, last_error=None,
+        )
+
+    def test_deferred_job_is_rescheduled_not_failed(self, monkeypatch):
+        run_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        calls = []
+
+        async def deferring_handler(payload):
+            raise job_queue.JobDeferred(run_at, "busy")
+
+        async def defer(job, worker_id, when, reason):
+            calls.append(("defer", when, reason))
+
+        async def fail(job, worker_id, error):
+            calls.append(("fail", error))
+
+        async def complete(job_id, worker_id):
+            calls.append(("complete",))
+
+        monkeypatch.setitem(worker.HANDLERS, "process_source", deferring_handler)
+        monkeypatch.setattr(job_queue, "defer", defer)
+        monkeypatch.setattr(job_queue, "fail", fail)
+        monkeypatch.setattr(job_queue, "complete", complete)
+
+        asyncio.run(Worker({"sources": 1}, worker_id="w1")._execute(self._job()))
+        assert calls == [("defer", run_at, "busy")]
+
+    def test_heartbeat_renews_registered_leases(self, monkeypatch):
+        renewed = []
+
+        async def extend_lease(job_id, worker_id):
+            return True
+
+        async def renew():
+            renewed.append(True)
+
+        monkeypatch.setattr(settings, "JOB_VISIBILITY_TIMEOUT_SECONDS", 0.03)
+        monkeypatch.setattr(job_queue, "extend_lease", extend_lease)
+
+        async def scenario():
+            renewals = set()
+            job_queue.heartbeat_renewals.set(renewals)
+            heartbeat = asyncio.create_task(
+                Worker({}, worker_id="w1")._heartbeat(self._job(), renewals)
+            )
+            with job_queue.renew_with_heartbeat(renew):
+                await asyncio.sleep(0.05)
+            # 블록을 벗어나면 더 이상 연장하지 않음
+            count = len(renewed)
+            await asyncio.sleep(0.05)
+            heartbeat.cancel()
+            return count
+
+        count = asyncio.run(scenario())
+        assert count >= 1 and len(renewed) == count
+
+    def test_renew_outside_a_job_is_noop(self):
+        async def renew():
+            raise AssertionError("not a job")
+
+        with job_queue.renew_with_heartbeat(renew):
+            assert job_queue.heartbeat_renewals.get() is None
@@ -0,0 +1,104 @@
+"""
+점진적 JSON 파서 테스트
+- 청크 단위 입력에서 최상위 필드 조기 전달
+- 스키마 이탈 시 조기 중단
+"""
+
+import pytest
+
+from app.services.json_stream import IncrementalJSONParser, SchemaViolation
+
+
+def feed_in_chunks(parser: IncrementalJSONParser, text: str, size: int = 3) -> list:
+    fields = []
+    for i in range(0, len(text), size):
+        fields.extend(parser.feed(text[i:i + size]))
+    return fields
+
+
+class TestIncrementalJSONParser:
+    def test_parses_complete_object(self):
+        parser = IncrementalJSONParser()
+        text = '{"name": "홍길동", "skills": ["Python", "Go"], "followers": 12}'
+        feed_in_chunks(parser, text)
+
+        assert parser.done
+        assert parser.result() == {
+            "name": "홍길동",
+            "skills": ["Python", "Go"],
+            "followers": 12,
+        }
+
+    def test_fields_emitted_as_they_close(self):
+        parser = IncrementalJSONParser()
+        first = parser.feed('{"adjustments": {"expertise": 3}, "insi')
+
+        assert first == [("adjustments", {"expertise": 3})]
+        assert not parser.done
+
+        rest = parser.feed('ghts": {"strengths": ["a,b}"]}}')
+        assert rest == [("insights", {"strengths": ["a,b}"]})]
+        assert parser.done
+
+    def test_code_fence_is_tolerated(self):
+        parser = IncrementalJSONParser()
+        feed_in_chunks(parser, '```json\n{"a": 1}\n```')
+
+        assert parser.result() == {"a": 1}
+
+    def test_trailing_text_is_ignored_after_close(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": "x"} 추가 설명입니다.')
+
+        assert parser.result() == {"a": "x"}
+
+    def test_prose_preamble_aborts_immediately(self):
+        parser = IncrementalJSONParser()
+        with pytest.raises(SchemaViolation):
+            parser.feed("Sure! Here is")
+
+    def test_wrong_container_type_aborts_at_value_start(self):
+        parser = IncrementalJSONParser(field_types={"skills": list})
+        with pytest.raises(SchemaViolation):
+            parser.feed('{"skills": {')
+
+    def test_null_allowed_for_typed_field(self):
+        parser = IncrementalJSONParser(field_types={"skills": list})
+        parser.feed('{"skills": null}')
+
+        assert parser.result() == {"skills": None}
+
+    def test_scalar_type_checked_on_close(self):
+        parser = IncrementalJSONParser(field_types={"score": int})
+        with pytest.raises(SchemaViolation):
+            parser.feed('{"score": "high", ')
+
+    def test_unexpected_field_rejected_when_strict(self):
+        parser = IncrementalJSONParser(field_types={"a": int}, allow_extra=False)
+        with pytest.raises(SchemaViolation):
+            parser.feed('{"b"')
+
+    def test_mismatched_brackets(self):
+        parser = IncrementalJSONParser()
+        with pytest.raises(SchemaViolation):
+            parser.feed('{"a": [1, 2}')
+
+    def test_escaped_quotes_in_strings(self):
+        parser = IncrementalJSONParser()
+        feed_in_chunks(parser, r'{"q\"k": "say \"hi\", ok"}', size=1)
+
+        assert parser.result() == {'q"k': 'say "hi", ok'}
+
+    def test_truncated_output_fails_result(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": [1, 2')
+
+        with pytest.raises(SchemaViolation):
+            parser.result()
+
+    def test_missing_required_field(self):
+        parser = IncrementalJSONParser(required={"actions"})
+        parser.feed('{"other": 1}')
+
+        with pytest.raises(SchemaViolation):
+            parser.result()
@@ -0,0 +1,89 @@
+"""
+LLM 원장 집계 테스트
+- 원장 저장은 백그라운드 태스크 (호출 경로는 DB 를 기다리지 않음)
+"""
+
+import asyncio
+from uuid import uuid4
+
+from app.services import llm_ledger
+from app.services.llm_ledger import LedgerAggregator, current_context, llm_context
+
+
+class TestLLMContext:
+    def test_nested_tags_merge_and_reset(self):
+        user_id = uuid4()
+        with llm_context(user_id=user_id, stage="parse"):
+            with llm_context(platform="github"):
+                ctx = current_context()
+                assert ctx.user_id == user_id
+                assert ctx.stage == "parse"
+                assert ctx.platform == "github"
+            assert current_context().platform is None
+
+        assert current_context().stage == "unknown"
+
+
+class TestLedgerAggregator:
+    def test_accumulates_per_stage_and_outcome(self):
+        agg = LedgerAggregator()
+        with llm_context(stage="calibration"):
+            ctx = current_context()
+        agg.add(ctx, "m", 100, 20, 10, 1.5, "ok")
+        agg.add(ctx, "m", 200, 30, 0, 0.5, "ok")
+        agg.add(ctx, "m", 50, 5, 0, 0.2, "rejected")
+
+        snapshot = agg.snapshot()
+        ok = snapshot[("calibration", "", "m", "ok")]
+        assert ok.calls == 2
+        assert ok.input_tokens == 300
+        assert ok.output_tokens == 50
+        assert ok.cached_tokens == 10
+        assert ok.max_latency_seconds == 1.5
+        assert snapshot[("calibration", "", "m", "rejected")].calls == 1
+
+    def test_prometheus_rendering(self):
+        agg = LedgerAggregator()
+        with llm_context(stage="parse", platform="github"):
+            agg.add(current_context(), "m", 10, 2, 0, 0.25, "ok")
+
+        text = agg.render_prometheus()
+        labels = 'stage="parse",platform="github",model="m",outcome="ok"'
+        assert f"life_pilot_llm_calls_total{{{labels}}} 1" in text
+        assert f'life_pilot_llm_tokens_total{{{labels},kind="input"}} 10' in text
+        assert f"life_pilot_llm_latency_seconds_count{{{labels}}} 1" in text
+
+
+class TestRecordLLMCall:
+    def test_write_does_not_block_the_caller(self, monkeypatch):
+        state = {"added": [], "committed": 0}
+
+        class _SlowSession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                pass
+
+            def add(self, row):
+                state["added"].append(row)
+
+            async def commit(self):
+                await state["release"].wait()
+                state["committed"] += 1
+
+        monkeypatch.setattr(llm_ledger, "async_session", _SlowSession)
+
+        async def scenario():
+            state["release"] = asyncio.Event()
+            with llm_context(stage="ledger_test"):
+                # DB 쓰기가 끝나지 않아도 바로 반환
+                llm_ledger.record_llm_call("m", 10, 2, 0, 0.1, "ok")
+            await asyncio.sleep(0)
+            assert state["committed"] == 0
+            state["release"].set()
+            await llm_ledger.flush_llm_usage()
+
+        asyncio.run(scenario())
+        assert state["committed"] == 1
+        assert state["added"][0].stage == "ledger_test"
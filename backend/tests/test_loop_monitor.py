@@ -0,0 +1,60 @@
+"""
+이벤트 루프 모니터 테스트
+- 원인 함수 선택 (app 코드 우선)
+- 루프를 막는 동기 호출을 감지해 함수별로 집계
+"""
+
+import asyncio
+import time
+import traceback
+
+from app.core.loop_monitor import APP_DIR, LOOP_BLOCKED, LoopMonitor, blocking_function
+
+
+def _frame(filename: str, name: str) -> traceback.FrameSummary:
+    return traceback.FrameSummary(filename, 1, name, line="")
+
+
+class TestBlockingFunction:
+    def test_prefers_innermost_app_frame(self):
+        stack = traceback.StackSummary.from_list([
+            _frame("/usr/lib/python3.12/asyncio/events.py", "_run"),
+            _frame(str(APP_DIR / "services" / "scraper.py"), "_scrape_with_httpx"),
+            _frame(str(APP_DIR / "services" / "scraper.py"), "_extract_text"),
+            _frame("/site-packages/bs4/__init__.py", "__init__"),
+        ])
+
+        assert blocking_function(stack) == "app/services/scraper.py:_extract_text"
+
+    def test_falls_back_to_innermost(self):
+        stack = traceback.StackSummary.from_list([
+            _frame("/usr/lib/python3.12/asyncio/events.py", "_run"),
+            _frame("/site-packages/bcrypt/__init__.py", "hashpw"),
+        ])
+
+        assert blocking_function(stack) == "__init__.py:hashpw"
+
+
+def _block_the_loop():
+    time.sleep(0.3)
+
+
+class TestLoopMonitor:
+    def test_detects_blocking_call(self):
+        monitor = LoopMonitor(interval=0.02, threshold=0.05)
+
+        async def scenario():
+            monitor.start()
+            await asyncio.sleep(0.05)
+            _block_the_loop()
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        asyncio.run(scenario())
+
+        snapshot = monitor.snapshot()
+        culprit = "test_loop_monitor.py:_block_the_loop"
+        assert any(r["function"] == culprit for r in snapshot["recent_blocks"])
+        assert "_block_the_loop" in snapshot["recent_blocks"][-1]["stack"]
+        assert LOOP_BLOCKED.value(function=culprit) >= 1
+        assert snapshot["max_lag_ms"] >= 200
@@ -2,29 +2,32 @@
 시장 데이터 유틸리티 함수 테스트
 """
 
-from app.services.market_seed import get_salary_range, get_skill_demand, _get_years_range
+from app.services.market_seed import get_salary_range, get_skill_demand, years_band
 
 
-class TestGetYearsRange:
+class TestYearsBand:
     def test_junior(self):
-        assert _get_years_range(0) == "0-2"
-        assert _get_years_range(2) == "0-2"
+        assert years_band(0) == "0-2"
+        assert years_band(2) == "0-2"
 
     def test_mid(self):
-        assert _get_years_range(3) == "3-5"
-        assert _get_years_range(5) == "3-5"
+        assert years_band(3) == "3-5"
+        assert years_band(5) == "3-5"
 
     def test_senior(self):
-        assert _get_years_range(6) == "6-9"
-        assert _get_years_range(9) == "6-9"
+        assert years_band(6) == "6-9"
+        assert years_band(9) == "6-9"
 
     def test_lead(self):
-        assert _get_years_range(10) == "10-14"
-        assert _get_years_range(14) == "10-14"
+        assert years_band(10) == "10-14"
+        assert years_band(14) == "10-14"
 
     def test_veteran(self):
-        assert _get_years_range(15) == "15+"
-        assert _get_years_range(25) == "15+"
+        assert years_band(15) == "15+"
+        assert years_band(25) == "15+"
+
+    def test_missing_is_junior(self):
+        assert years_band(None) == "0-2"
 
 
 class TestGetSalaryRange:
@@ -0,0 +1,118 @@
+"""
+단계 메트릭 테스트
+- 히스토그램 누적 버킷 / 라벨 렌더링
+- stage_timer 의 결과(ok/error) 기록과 진행 중 게이지
+- 레지스트리 collector 합성, 워커 메트릭 HTTP 응답
+- API /metrics 는 토큰이 설정된 경우에만 노출
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.metrics import (
+    IN_FLIGHT,
+    STAGE_SECONDS,
+    STAGE_TOTAL,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    stage_timer,
+)
+from app.main import metrics
+from app.worker import _handle_metrics_request
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        hist = Histogram("h", "help", ("stage",), buckets=(0.1, 1.0))
+        hist.observe(0.05, stage="parse")
+        hist.observe(0.5, stage="parse")
+        hist.observe(5.0, stage="parse")
+
+        lines = hist.render()
+
+        assert 'h_bucket{stage="parse",le="0.1"} 1' in lines
+        assert 'h_bucket{stage="parse",le="1.0"} 2' in lines
+        assert 'h_bucket{stage="parse",le="+Inf"} 3' in lines
+        assert 'h_count{stage="parse"} 3' in lines
+        assert "# TYPE h histogram" in lines
+
+    def test_missing_labels_render_empty(self):
+        counter = Counter("c", "help", ("stage", "platform"))
+        counter.inc(stage="salary")
+
+        assert 'c{stage="salary",platform=""} 1' in counter.render()
+
+
+class TestStageTimer:
+    def test_records_ok(self):
+        before = STAGE_TOTAL.value(stage="t_ok", outcome="ok")
+
+        with stage_timer("t_ok"):
+            assert IN_FLIGHT.value(stage="t_ok") == 1
+
+        assert IN_FLIGHT.value(stage="t_ok") == 0
+        assert STAGE_TOTAL.value(stage="t_ok", outcome="ok") == before + 1
+        assert STAGE_SECONDS.count(stage="t_ok") >= 1
+
+    def test_records_error_and_reraises(self):
+        with pytest.raises(ValueError):
+            with stage_timer("t_err", platform="github"):
+                raise ValueError("boom")
+
+        assert STAGE_TOTAL.value(stage="t_err", platform="github", outcome="error") == 1
+        assert IN_FLIGHT.value(stage="t_err") == 0
+
+
+class TestRegistry:
+    def test_includes_collectors(self):
+        registry = Registry()
+        gauge = registry.register(Gauge("g", "help"))
+        gauge.set(3)
+        registry.add_collector(lambda: "extra_metric 1\n")
+
+        text = registry.render()
+
+        assert "g 3\n" in text
+        assert text.endswith("extra_metric 1\n")
+
+
+class TestWorkerMetricsServer:
+    def test_serves_registry(self):
+        async def scenario():
+            server = await asyncio.start_server(_handle_metrics_request, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+            return response.decode()
+
+        response = asyncio.run(scenario())
+
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert "life_pilot_pipeline_stage_seconds" in response
+
+
+class TestApiMetricsEndpoint:
+    def test_disabled_without_token(self, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(metrics(authorization=None))
+        assert exc.value.status_code == 404
+
+    def test_requires_matching_token(self, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "secret")
+        for authorization in (None, "Bearer wrong", "secret", "Bearer 비밀"):
+            with pytest.raises(HTTPException) as exc:
+                asyncio.run(metrics(authorization=authorization))
+            assert exc.value.status_code == 401
+
+        response = asyncio.run(metrics(authorization="Bearer secret"))
+        assert "life_pilot_pipeline_stage_seconds" in response.body.decode()
@@ -0,0 +1,34 @@
+"""
+DB 커넥션 풀 계측 테스트
+- 대기/보유 시간 집계
+- Prometheus 히스토그램 렌더링
+"""
+
+from app.core.pool_metrics import PoolStats
+
+
+class TestPoolStats:
+    def test_snapshot(self):
+        stats = PoolStats()
+        stats.observe_wait(0.002)
+        stats.observe_wait(0.2)
+        stats.observe_hold(1.5)
+
+        snap = stats.snapshot()
+
+        assert snap["checkout_wait"]["count"] == 2
+        assert snap["checkout_wait"]["max_ms"] == 200.0
+        assert snap["connection_hold"]["avg_ms"] == 1500.0
+
+    def test_histogram_is_cumulative(self):
+        stats = PoolStats()
+        for seconds in (0.0005, 0.02, 0.02, 60.0):
+            stats.observe_wait(seconds)
+
+        text = stats.render_prometheus()
+
+        assert 'life_pilot_db_pool_checkout_wait_seconds_bucket{le="0.001"} 1' in text
+        assert 'life_pilot_db_pool_checkout_wait_seconds_bucket{le="0.05"} 3' in text
+        assert 'life_pilot_db_pool_checkout_wait_seconds_bucket{le="30.0"} 3' in text
+        assert 'life_pilot_db_pool_checkout_wait_seconds_bucket{le="+Inf"} 4' in text
+        assert "life_pilot_db_connection_hold_seconds_count 0" in text
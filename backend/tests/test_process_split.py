@@ -0,0 +1,44 @@
+"""
+API / 워커 프로세스 분리 테스트
+- API 프로세스는 스크래핑/LLM 의존성을 import 하지 않음
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from app.services.platforms import detect_platform
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+WORKER_ONLY_MODULES = ("playwright", "bs4", "anthropic", "httpx")
+
+
+def _imported_after(module: str) -> set[str]:
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {WORKER_ONLY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return set(filter(None, out.split(",")))
+
+
+class TestProcessSplit:
+    def test_api_does_not_import_worker_dependencies(self):
+        assert _imported_after("app.main") == set()
+
+    def test_worker_loads_pipeline(self):
+        assert {"bs4", "anthropic"} <= _imported_after("app.worker")
+
+
+class TestDetectPlatform:
+    def test_known_platforms(self):
+        assert detect_platform("https://github.com/octocat") == "github"
+        assert detect_platform("https://velog.io/@someone") == "velog"
+        assert detect_platform("https://example.com") == "other"
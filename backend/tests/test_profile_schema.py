@@ -0,0 +1,84 @@
+"""
+ParsedProfile / 구조화 출력 모델 테스트
+- LLM 출력의 느슨한 타입 정규화
+- tool 스키마 생성
+"""
+
+from app.schemas.analysis import ActionPlan, CalibrationResult
+from app.schemas.profile import GenericProfile, GitHubProfile, load_profile
+
+
+class TestLoadProfile:
+    def test_platform_model_selected(self):
+        assert isinstance(load_profile({"platform": "github"}), GitHubProfile)
+        assert isinstance(load_profile({"platform": "dribbble"}), GenericProfile)
+
+    def test_counts_are_coerced(self):
+        profile = load_profile({
+            "platform": "github",
+            "followers": "1,234",
+            "public_repos": None,
+            "pinned_repos": [{"name": "a", "stars": "1.2k"}, "broken"],
+        })
+
+        assert profile.followers == 1234
+        assert profile.public_repos == 0
+        assert [r.stars for r in profile.pinned_repos] == [1200]
+
+    def test_lists_are_cleaned(self):
+        profile = load_profile({
+            "platform": "linkedin",
+            "skills": ["Python", 3, None, " Go "],
+            "experience": "3 years",
+            "education": ["서울대", {"school": "KAIST", "degree": "석사"}],
+            "certifications": [{"name": "AWS SAA"}, "CKA"],
+        })
+
+        assert profile.skills == ["Python", "Go"]
+        assert profile.experience == []
+        assert [e.school for e in profile.education] == ["서울대", "KAIST"]
+        assert profile.certifications == ["AWS SAA", "CKA"]
+
+    def test_unknown_data_quality_falls_back_to_low(self):
+        assert load_profile({"data_quality": "excellent"}).data_quality == "low"
+        assert load_profile({"data_quality": "HIGH"}).data_quality == "high"
+
+    def test_roundtrip_through_jsonb(self):
+        profile = load_profile({"platform": "velog", "total_posts": "30"})
+        stored = profile.model_dump(mode="json")
+
+        assert load_profile(stored) == profile
+
+
+class TestStructuredOutputs:
+    def test_tool_schema_only_exposes_platform_fields(self):
+        schema = GitHubProfile.tool_schema()
+
+        assert "pinned_repos" in schema["properties"]
+        assert "experience" not in schema["properties"]
+        assert "Repo" in schema["$defs"]
+
+    def test_calibration_values_are_clamped(self):
+        result = CalibrationResult.model_validate({
+            "adjustments": {"expertise": 30, "influence": "-4"},
+            "insights": {"strengths": ["꾸준함"]},
+            "market_position_percentile": 150,
+        })
+
+        assert result.adjustments.expertise == 10
+        assert result.adjustments.influence == -4
+        assert result.market_position_percentile == 99
+
+    def test_action_fields_are_normalized(self):
+        plan = ActionPlan.model_validate({
+            "actions": [
+                {"title": "블로그", "impact_percent": 40, "target_area": "x", "difficulty": "?"},
+                "not an action",
+            ]
+        })
+
+        assert len(plan.actions) == 1
+        action = plan.actions[0]
+        assert action.impact_percent == 15
+        assert action.target_area == "expertise"
+        assert action.difficulty == "medium"
@@ -0,0 +1,162 @@
+"""
+진행 상황 스트림 테스트
+- SSE 메시지 형식
+- 알림 → 유저별 구독 큐 분배, 큐가 넘치면 스트림 종료 표시
+- 발행은 현재 트랜잭션의 pg_notify
+- 상태 요약 (진행률), 최신 스코어가 소스 수집 이후 확정됐는지
+- LISTEN 연결은 엔진과 같은 URL 정규화 / SSL 설정 사용 (Neon 쿼리 파라미터 제거)
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.analysis import summarize_score, summarize_status
+from app.core.config import settings
+from app.services import progress
+from app.services.progress import CHANNEL, ProgressBroker, format_sse, publish_progress
+
+USER_A = UUID(int=1)
+USER_B = UUID(int=2)
+
+
+class _NoListenBroker(ProgressBroker):
+    async def _ensure_listening(self) -> None:
+        pass
+
+
+def _notify(user_id: UUID, **event) -> str:
+    return json.dumps({"user_id": str(user_id), **event})
+
+
+class TestFormatSSE:
+    def test_event_and_json_data(self):
+        message = format_sse("source", {"status": "parsing"})
+
+        assert message == 'event: source\ndata: {"status": "parsing"}\n\n'
+
+
+class TestProgressBroker:
+    def test_dispatch_routes_by_user(self):
+        async def scenario():
+            broker = _NoListenBroker()
+            async with broker.subscribe(USER_A) as a, broker.subscribe(USER_B) as b:
+                broker.dispatch(_notify(USER_A, type="source", status="scraping"))
+                assert a.get_nowait() == {"type": "source", "status": "scraping"}
+                assert b.empty()
+            assert broker.subscriber_count() == 0
+
+        asyncio.run(scenario())
+
+    def test_overflow_ends_stream(self):
+        async def scenario():
+            broker = _NoListenBroker(max_queued=2)
+            async with broker.subscribe(USER_A) as queue:
+                for _ in range(3):
+                    broker.dispatch(_notify(USER_A, type="source"))
+                assert queue.get_nowait() is None
+                assert queue.empty()
+
+        asyncio.run(scenario())
+
+    def test_ignores_malformed_payload(self):
+        async def scenario():
+            broker = _NoListenBroker()
+            async with broker.subscribe(USER_A) as queue:
+                broker.dispatch("not json")
+                assert queue.empty()
+
+        asyncio.run(scenario())
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+class TestPublish:
+    def test_uses_pg_notify_in_transaction(self):
+        db = _RecordingSession()
+
+        asyncio.run(publish_progress(db, USER_A, type="scoring", phase="final"))
+
+        compiled = db.statements[0].compile(dialect=postgresql.dialect())
+        assert "pg_notify" in str(compiled)
+        channel, payload = compiled.params.values()
+        assert channel == CHANNEL
+        assert json.loads(payload) == {
+            "user_id": str(USER_A),
+            "type": "scoring",
+            "phase": "final",
+        }
+
+
+class TestSummarizeStatus:
+    def test_progress_counts_failed_as_done(self):
+        summary = summarize_status({"completed": 1, "failed": 1, "parsing": 2})
+
+        assert summary["progress"] == 50
+        assert summary["is_done"] is False
+        assert summary["total"] == 4
+
+    def test_empty(self):
+        assert summarize_status({})["progress"] == 0
+
+
+class TestSummarizeScore:
+    scraped = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def _score(self, phase: str, minutes: int):
+        return SimpleNamespace(
+            id=UUID(int=9), phase=phase, scored_at=self.scraped + timedelta(minutes=minutes)
+        )
+
+    def test_settled_score_after_sources_is_current(self):
+        for phase in ("final", "fallback"):
+            summary = summarize_score(self._score(phase, 1), self.scraped)
+            assert summary["is_current"] is True
+            assert summary["phase"] == phase
+
+    def test_stale_or_provisional_score_is_not_current(self):
+        assert summarize_score(self._score("final", -1), self.scraped)["is_current"] is False
+        assert summarize_score(self._score("provisional", 1), self.scraped)["is_current"] is False
+
+    def test_no_score(self):
+        assert summarize_score(None, self.scraped) is None
+
+
+NEON_URL = (
+    "postgresql://user:pw@ep-x.ap-southeast-1.aws.neon.tech/life_pilot"
+    "?sslmode=require&channel_binding=require"
+)
+
+
+class TestListenConnection:
+    def test_neon_url_is_normalized_like_the_engine(self, monkeypatch):
+        connects = []
+
+        class _Conn:
+            def add_termination_listener(self, callback):
+                pass
+
+            async def add_listener(self, channel, callback):
+                pass
+
+        async def fake_connect(dsn, **kwargs):
+            connects.append((dsn, kwargs))
+            return _Conn()
+
+        monkeypatch.setattr(settings, "DATABASE_URL", NEON_URL)
+        monkeypatch.setattr(progress.asyncpg, "connect", fake_connect)
+        asyncio.run(ProgressBroker()._ensure_listening())
+
+        ((dsn, kwargs),) = connects
+        assert dsn == "postgresql://user:pw@ep-x.ap-southeast-1.aws.neon.tech/life_pilot"
+        assert "ssl" in kwargs
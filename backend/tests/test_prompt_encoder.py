@@ -0,0 +1,81 @@
+"""
+보정 프롬프트 인코더 테스트
+- 토큰 예산 준수
+- 결정적 출력
+- 우선순위 높은 사실부터 포함
+"""
+
+from app.schemas.profile import load_profile
+from app.services.prompt_encoder import encode_sources, estimate_tokens
+
+
+def make_profiles():
+    linkedin = load_profile({
+        "platform": "linkedin",
+        "name": "홍길동",
+        "current_title": "Senior Software Engineer",
+        "skills": ["Python", "React", "AWS"],
+        "experience": [
+            {"title": "Senior Engineer", "company": "테크사", "duration": "3년"},
+            {"title": "Junior Engineer", "company": "스타트업", "duration": "2년"},
+        ],
+        "certifications": ["AWS Solutions Architect"],
+        "data_quality": "high",
+    })
+    github = load_profile({
+        "platform": "github",
+        "followers": 150,
+        "public_repos": 25,
+        "top_languages": ["Python", "Go"],
+        "pinned_repos": [
+            {"name": f"repo-{i}", "stars": i * 10, "language": "Python",
+             "description": "A fairly long description of the repository " * 3}
+            for i in range(10)
+        ],
+        "data_quality": "high",
+    })
+    return [linkedin, github]
+
+
+class TestEstimateTokens:
+    def test_ascii_is_cheaper_than_hangul(self):
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("가나다라") == 4
+
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+
+class TestEncodeSources:
+    def test_stays_within_budget(self):
+        for budget in (30, 80, 200):
+            encoded = encode_sources(make_profiles(), budget)
+            assert encoded.tokens <= budget
+
+    def test_output_is_deterministic_regardless_of_order(self):
+        profiles = make_profiles()
+        a = encode_sources(profiles, 150)
+        b = encode_sources(list(reversed(profiles)), 150)
+
+        assert a.text == b.text
+
+    def test_high_priority_facts_survive_small_budget(self):
+        encoded = encode_sources(make_profiles(), 60)
+
+        assert "[linkedin]" in encoded.text
+        assert "[github]" in encoded.text
+        assert "followers=150" in encoded.text
+        assert "repo-9" not in encoded.text
+        assert encoded.included_facts < encoded.total_facts
+
+    def test_lines_are_never_cut(self):
+        full = encode_sources(make_profiles(), 10_000)
+        partial = encode_sources(make_profiles(), 100)
+
+        full_lines = set(full.text.splitlines())
+        assert set(partial.text.splitlines()) <= full_lines
+
+    def test_omits_empty_fields(self):
+        encoded = encode_sources([load_profile({"platform": "velog"})], 500)
+
+        assert encoded.text == "[velog] q=low"
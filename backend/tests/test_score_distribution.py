@@ -0,0 +1,210 @@
+"""
+스코어 분포 테스트
+- 백분위: 낮은 값 비율 + 같은 버킷의 절반 (중간 순위)
+- 연차 구간 표본이 적으면 직군 전체 분포 사용
+- 최신 스코어 교체 시 이전 기여분을 빼고 새 값을 더하는 단일 UPSERT (같은 버킷은 상쇄)
+- 마이그레이션 009 의 연차 구간 CASE 가 years_band 와 같은 구간을 계산
+"""
+
+import asyncio
+import re
+import sqlite3
+import uuid
+from pathlib import Path
+
+from sqlalchemy.dialects import postgresql
+
+import app.models  # noqa: F401  (관계 대상 모델 등록)
+from app.models.score_distribution import ScoreDistributionMember
+from app.services.market_seed import years_band
+from app.services.score_distribution import (
+    ALL_BANDS,
+    MAX_BUCKET,
+    _add,
+    bucket_of,
+    percentile,
+    position,
+    remove_member,
+    update_member,
+)
+
+
+def _area(values: list[float]) -> dict:
+    counts = [0] * (MAX_BUCKET + 1)
+    for value in values:
+        counts[bucket_of(value)] += 1
+    cumulative, running = [], 0
+    for count in counts:
+        running += count
+        cumulative.append(running)
+    return {"count": len(values), "sum": sum(values), "cumulative": cumulative}
+
+
+class _Result:
+    def __init__(self, member):
+        self.member = member
+
+    def scalar_one_or_none(self):
+        return self.member
+
+
+class _Session:
+    def __init__(self, member=None):
+        self.member = member
+        self.statements = []
+        self.added = []
+        self.deleted = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.member)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def delete(self, obj):
+        self.deleted.append(obj)
+
+
+def _upsert_rows(stmt) -> list[dict]:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    rows, index = [], 0
+    while f"job_category_m{index}" in compiled.params:
+        rows.append({
+            key: compiled.params[f"{key}_m{index}"]
+            for key in ("job_category", "years_band", "area", "bucket", "count", "score_sum")
+        })
+        index += 1
+    return rows
+
+
+class TestPercentile:
+    def test_mid_rank(self):
+        area = _area([10, 20, 30, 40])
+        assert percentile(area, 30) == 62.5
+        assert percentile(area, 5) == 0.0
+        assert percentile(area, 99) == 100.0
+
+    def test_bounds(self):
+        assert bucket_of(-3) == 0
+        assert bucket_of(100) == 100
+        assert bucket_of(150) == 100
+        assert percentile({"count": 0, "sum": 0, "cumulative": [0] * 101}, 50) is None
+
+
+class TestPosition:
+    def test_uses_band_when_sample_is_large_enough(self, monkeypatch):
+        from app.services import score_distribution
+
+        monkeypatch.setattr(score_distribution.settings, "SCORE_DISTRIBUTION_MIN_BAND_SAMPLE", 2)
+        distribution = {
+            "3-5": {"total": _area([40, 60])},
+            ALL_BANDS: {"total": _area([40, 60, 80, 90])},
+        }
+        result = position(distribution, 4, {"total": 60})
+        assert result["years_band"] == "3-5"
+        assert result["percentiles"]["total"] == 75.0
+        assert result["averages"]["total"] == 50.0
+
+    def test_falls_back_to_whole_category(self, monkeypatch):
+        from app.services import score_distribution
+
+        monkeypatch.setattr(score_distribution.settings, "SCORE_DISTRIBUTION_MIN_BAND_SAMPLE", 3)
+        distribution = {
+            "3-5": {"total": _area([40, 60])},
+            ALL_BANDS: {"total": _area([40, 60, 80, 90])},
+        }
+        result = position(distribution, 4, {"total": 60, "expertise": 10})
+        assert result["years_band"] == ALL_BANDS
+        assert result["sample_size"] == 4
+        assert result["percentiles"] == {"total": 37.5}
+
+
+class TestIncrementalUpdate:
+    def test_new_member_adds_band_and_all(self):
+        db = _Session()
+        asyncio.run(update_member(db, uuid.uuid4(), "dev", 4, uuid.uuid4(), {"total": 55.5}))
+
+        rows = _upsert_rows(db.statements[1])
+        assert {(r["years_band"], r["bucket"], r["count"]) for r in rows} == {
+            ("3-5", 55, 1), (ALL_BANDS, 55, 1),
+        }
+        assert "ON CONFLICT (job_category, years_band, area, bucket) DO UPDATE" in str(
+            db.statements[1].compile(dialect=postgresql.dialect())
+        )
+        assert "FOR UPDATE" in str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert isinstance(db.added[0], ScoreDistributionMember)
+
+    def test_rescore_moves_contribution(self):
+        member = ScoreDistributionMember(
+            user_id=uuid.uuid4(), score_id=uuid.uuid4(), job_category="dev",
+            years_band="3-5", scores={"total": 40.0, "expertise": 70.2},
+        )
+        db = _Session(member)
+        asyncio.run(update_member(
+            db, member.user_id, "dev", 4, uuid.uuid4(), {"total": 62.0, "expertise": 70.6},
+        ))
+
+        rows = {(r["years_band"], r["area"], r["bucket"]): r for r in _upsert_rows(db.statements[1])}
+        assert rows[("3-5", "total", 40)]["count"] == -1
+        assert rows[("3-5", "total", 62)]["count"] == 1
+        # 같은 버킷 안의 변화는 개수 0, 합계만 조정
+        assert rows[("3-5", "expertise", 70)]["count"] == 0
+        assert rows[("3-5", "expertise", 70)]["score_sum"] == 0.4
+        assert member.scores == {"total": 62.0, "expertise": 70.6}
+        assert not db.added
+
+    def test_profile_change_moves_existing_scores(self):
+        member = ScoreDistributionMember(
+            user_id=uuid.uuid4(), score_id=uuid.uuid4(), job_category="dev",
+            years_band="0-2", scores={"total": 40.0},
+        )
+        db = _Session(member)
+        asyncio.run(update_member(db, member.user_id, "pm", 12))
+
+        rows = {(r["job_category"], r["years_band"]): r["count"] for r in _upsert_rows(db.statements[1])}
+        assert rows == {
+            ("dev", "0-2"): -1, ("dev", ALL_BANDS): -1,
+            ("pm", "10-14"): 1, ("pm", ALL_BANDS): 1,
+        }
+        assert (member.job_category, member.years_band) == ("pm", "10-14")
+
+    def test_profile_change_without_score_is_noop(self):
+        db = _Session()
+        asyncio.run(update_member(db, uuid.uuid4(), "pm", 3))
+        assert len(db.statements) == 1
+        assert not db.added
+
+    def test_remove(self):
+        member = ScoreDistributionMember(
+            user_id=uuid.uuid4(), score_id=uuid.uuid4(), job_category="dev",
+            years_band="0-2", scores={"total": 40.0},
+        )
+        db = _Session(member)
+        asyncio.run(remove_member(db, member.user_id))
+        assert {r["count"] for r in _upsert_rows(db.statements[1])} == {-1}
+        assert db.deleted == [member]
+
+    def test_deltas_cancel_in_same_bucket(self):
+        deltas = {}
+        _add(deltas, "dev", "0-2", {"total": 40.0}, -1)
+        _add(deltas, "dev", "0-2", {"total": 40.0}, +1)
+        assert all(count == 0 and total == 0 for count, total in deltas.values())
+
+
+MIGRATION_009 = Path(__file__).parents[1] / "alembic" / "versions" / "009_score_distributions.py"
+
+
+class TestBackfillYearsBand:
+    def test_migration_case_matches_years_band(self):
+        case = re.search(r"CASE\b.*?\bEND", MIGRATION_009.read_text(), re.S).group(0)
+        # 표준 SQL 이므로 sqlite 로 그대로 실행해 비교
+        conn = sqlite3.connect(":memory:")
+        try:
+            for years in [None, *range(0, 31)]:
+                (band,) = conn.execute(
+                    f"WITH u AS (SELECT ? AS years_of_experience) SELECT {case} FROM u", (years,)
+                ).fetchone()
+                assert band == years_band(years), years
+        finally:
+            conn.close()
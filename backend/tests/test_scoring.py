@@ -5,7 +5,7 @@
 """
 
 import pytest
-from app.services.scoring import CareerScorer
+from app.services.scoring import CareerScorer, scoring_fingerprint
 
 
 # ── Fixtures ──
@@ -226,3 +226,86 @@ class TestCareerScorer:
 
         # 디자인 스킬을 가진 사람은 디자인 직군에서 시장성이 같거나 더 높아야 함
         assert design_scorer.score_marketability() >= dev_scorer.score_marketability()
+
+
+class TestScoringFingerprint:
+    """스코어링 입력 지문 검증"""
+
+    def test_independent_of_source_and_key_order(self):
+        linkedin, github = make_linkedin_data(), make_github_data()
+        reordered = dict(reversed(list(linkedin.items())))
+
+        assert scoring_fingerprint([linkedin, github], "dev", 5) == scoring_fingerprint(
+            [github, reordered], "dev", 5
+        )
+
+    def test_changes_with_any_input(self):
+        base = scoring_fingerprint([make_linkedin_data()], "dev", 5)
+
+        assert base != scoring_fingerprint([make_linkedin_data(skills=["Go"])], "dev", 5)
+        assert base != scoring_fingerprint([make_linkedin_data()], "data", 5)
+        assert base != scoring_fingerprint([make_linkedin_data()], "dev", 6)
+
+
+class TestApplyCalibration:
+    """보정 적용 (provisional → final) 검증"""
+
+    BASE = {
+        "expertise": 60.0,
+        "influence": 40.0,
+        "consistency": 50.0,
+        "marketability": 70.0,
+        "potential": 55.0,
+        "total": 55.0,
+        "analysis_accuracy": 65,
+    }
+
+    def test_zero_adjustments_keep_base_scores(self):
+        from app.services.analysis import _apply_calibration
+
+        result = _apply_calibration(self.BASE, {}, "dev", 5)
+
+        for area in ("expertise", "influence", "consistency", "marketability", "potential"):
+            assert result["scores"][area] == self.BASE[area]
+        assert result["salary_min"] <= result["salary_max"]
+
+    def test_adjustments_are_applied_and_clamped(self):
+        from app.services.analysis import _apply_calibration
+
+        base = {**self.BASE, "expertise": 95.0}
+        result = _apply_calibration(
+            base, {"adjustments": {"expertise": 10, "influence": -5}}, "dev", 5
+        )
+
+        assert result["scores"]["expertise"] == 100
+        assert result["scores"]["influence"] == 35.0
+        assert result["insights"]["adjustments"]["influence"] == -5
+
+
+class TestProfileSnapshot:
+    """한 번 집계한 스냅샷을 단계 간 공유"""
+
+    def test_scorer_from_snapshot_matches_raw_input(self):
+        from app.services.profile_snapshot import ProfileSnapshot
+
+        sources = [make_linkedin_data(), make_github_data(), make_velog_data()]
+        snapshot = ProfileSnapshot.build(sources, "dev", 5)
+
+        assert CareerScorer.from_snapshot(snapshot).calculate_all() == CareerScorer(
+            sources_data=sources, job_category="dev", years_of_experience=5
+        ).calculate_all()
+
+    def test_aggregates_and_is_immutable(self):
+        import dataclasses
+
+        from app.services.profile_snapshot import ProfileSnapshot
+
+        snapshot = ProfileSnapshot.build([make_linkedin_data(), make_github_data()], None, None)
+
+        assert snapshot.job_category == "other"
+        assert snapshot.followers == 150
+        assert snapshot.stars == 80
+        assert len(snapshot.projects) == 2
+        assert "Go" in snapshot.skills
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.followers = 0
@@ -0,0 +1,74 @@
+"""
+비밀번호 해시 실행기 테스트
+- 이벤트 루프 밖(전용 스레드)에서 실행
+- 실행 중 + 대기 한도 초과 시 즉시 거절 (503)
+- 호출자가 취소돼도 스레드 작업이 끝날 때까지 자리를 차지
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.security import PasswordHasher, PasswordHasherBusy
+
+
+class TestPasswordHasher:
+    def test_runs_off_the_loop_thread(self):
+        hasher = PasswordHasher(workers=2, queue_limit=0)
+
+        async def scenario():
+            return await hasher.run(threading.get_ident)
+
+        loop_thread = threading.get_ident()
+        assert asyncio.run(scenario()) != loop_thread
+        assert hasher.pending == 0
+
+    def test_rejects_when_saturated(self):
+        hasher = PasswordHasher(workers=1, queue_limit=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.create_task(hasher.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert hasher.pending == 2
+
+            with pytest.raises(PasswordHasherBusy):
+                await hasher.run(release.wait)
+
+            release.set()
+            await asyncio.gather(*running)
+            assert hasher.pending == 0
+            # 여유가 생기면 다시 받음
+            assert await hasher.run(lambda: "ok") == "ok"
+
+        asyncio.run(scenario())
+
+    def test_cancelled_caller_holds_slot_until_thread_finishes(self):
+        hasher = PasswordHasher(workers=1, queue_limit=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_hash():
+            started.set()
+            release.wait()
+
+        async def scenario():
+            task = asyncio.create_task(hasher.run(slow_hash))
+            await asyncio.to_thread(started.wait)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            try:
+                # 스레드는 아직 bcrypt 실행 중이므로 자리를 내주지 않음
+                assert hasher.pending == 1
+                with pytest.raises(PasswordHasherBusy):
+                    await hasher.run(lambda: "ok")
+            finally:
+                release.set()
+
+            while hasher.pending:
+                await asyncio.sleep(0.01)
+            assert await hasher.run(lambda: "ok") == "ok"
+
+        asyncio.run(scenario())
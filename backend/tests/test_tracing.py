@@ -0,0 +1,132 @@
+"""
+트레이싱 테스트
+- span 부모-자식 / trace 연결, 예외 시 error 상태
+- traceparent 전파 (작업 payload → 워커)
+- asyncio 태스크로의 컨텍스트 전파
+- SQL 문 단위 span
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core import tracing
+from app.core.tracing import (
+    continue_trace,
+    current_traceparent,
+    parse_traceparent,
+    span,
+    trace_sql,
+)
+from app.services.job_queue import enqueue
+
+
+class _MemoryExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+@pytest.fixture
+def exporter():
+    memory = _MemoryExporter()
+    tracing.set_exporter(memory)
+    yield memory
+    tracing.set_exporter(None)
+
+
+class TestSpans:
+    def test_disabled_yields_none(self):
+        with span("noop") as current:
+            assert current is None
+        assert current_traceparent() is None
+
+    def test_children_share_trace(self, exporter):
+        with span("root") as root:
+            with span("child", stage="parse") as child:
+                pass
+
+        assert [s.name for s in exporter.spans] == ["child", "root"]
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert root.parent_id is None
+        assert child.attributes == {"stage": "parse"}
+
+    def test_error_status(self, exporter):
+        with pytest.raises(RuntimeError):
+            with span("boom"):
+                raise RuntimeError("bad")
+
+        assert exporter.spans[0].status == "error"
+        assert exporter.spans[0].error == "RuntimeError: bad"
+
+    def test_propagates_into_tasks(self, exporter):
+        async def child():
+            with span("task"):
+                await asyncio.sleep(0)
+
+        async def scenario():
+            with span("root") as root:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(child())
+                    tg.create_task(child())
+            return root
+
+        root = asyncio.run(scenario())
+
+        tasks = [s for s in exporter.spans if s.name == "task"]
+        assert len(tasks) == 2
+        assert all(s.parent_id == root.span_id for s in tasks)
+
+
+class TestTraceparent:
+    def test_round_trip(self, exporter):
+        with span("api") as api:
+            header = current_traceparent()
+
+        assert parse_traceparent(header) == (api.trace_id, api.span_id)
+        assert parse_traceparent("garbage") is None
+
+        with continue_trace(header, "job run_scoring") as job:
+            pass
+        assert job.trace_id == api.trace_id
+        assert job.parent_id == api.span_id
+
+    def test_enqueue_carries_trace(self, exporter):
+        added = []
+        db = SimpleNamespace(add=added.append)
+
+        async def scenario():
+            with span("POST /analysis/run"):
+                await enqueue(db, "process_all_sources", {"user_id": "u"})
+
+        asyncio.run(scenario())
+
+        assert added[0].payload["user_id"] == "u"
+        assert parse_traceparent(added[0].payload["traceparent"]) is not None
+
+    def test_enqueue_without_trace_keeps_payload(self):
+        added = []
+        db = SimpleNamespace(add=added.append)
+
+        asyncio.run(enqueue(db, "process_all_sources", {"user_id": "u"}))
+
+        assert added[0].payload == {"user_id": "u"}
+
+
+class TestSqlSpans:
+    def test_statement_span_under_current(self, exporter):
+        engine = create_engine("sqlite://")
+        trace_sql(SimpleNamespace(sync_engine=engine))
+
+        with span("root") as root:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        queries = [s for s in exporter.spans if s.name == "db.query"]
+        assert queries and queries[0].attributes["statement"] == "SELECT 1"
+        assert queries[0].parent_id == root.span_id
@@ -0,0 +1,123 @@
+"""
+조건부 응답 (ETag) 테스트
+- If-None-Match 비교 (목록 / 약한 ETag / *)
+- 스코어 버전은 id + phase, 액션 ETag 는 쿼리 파라미터별로 다름
+- 일치 시 버전 조회 한 번으로 304, 본문 조회 없음
+"""
+
+import asyncio
+import uuid
+
+from fastapi import Response
+from sqlalchemy.dialects import postgresql
+
+import app.models  # noqa: F401  (관계 대상 모델 등록)
+from app.api.v1.actions import get_actions
+from app.api.v1.scores import get_latest_score
+from app.models.user import User
+from app.services.versions import (
+    ContentVersions,
+    bump_actions_version,
+    etag_matches,
+    make_etag,
+)
+
+SCORE_ID = uuid.uuid4()
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class _VersionSession:
+    """버전 조회에만 응답하고 실행된 문장을 기록"""
+
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.row)
+
+
+class TestETagMatching:
+    def test_variants(self):
+        etag = make_etag("x", 1)
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+    def test_score_version_includes_phase(self):
+        provisional = ContentVersions(SCORE_ID, "provisional", 0)
+        final = ContentVersions(SCORE_ID, "final", 0)
+        assert provisional.score != final.score
+        assert ContentVersions(None, None, 0).score == "none"
+
+    def test_action_etag_depends_on_filters(self):
+        assert make_etag("actions", 3, None, "impact") != make_etag("actions", 3, "ml", "impact")
+        assert make_etag("actions", 3, None, "impact") != make_etag("actions", 4, None, "impact")
+
+
+class TestConditionalEndpoints:
+    def test_latest_score_not_modified_skips_heavy_query(self):
+        db = _VersionSession((0, SCORE_ID, "final"))
+        etag = make_etag("scores/latest", f"{SCORE_ID}:final")
+        response = asyncio.run(get_latest_score(
+            response=Response(), if_none_match=etag, user=User(id=uuid.uuid4()), db=db,
+        ))
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert len(db.statements) == 1
+
+    def test_actions_sets_etag_on_full_response(self):
+        class _Scalars:
+            def all(self):
+                return []
+
+        class _ListResult(_Result):
+            def scalars(self):
+                return _Scalars()
+
+        class _CountResult(_Result):
+            def all(self):
+                return [(True, 2)]
+
+        db = _VersionSession((7, None, None))
+        responses = iter([_Result((7, None, None)), _ListResult(None), _CountResult(None)])
+
+        async def execute(stmt):
+            db.statements.append(stmt)
+            return next(responses)
+
+        db.execute = execute
+        response = Response()
+        body = asyncio.run(get_actions(
+            response=response, tag=None, area=None, sort="impact", completed=False,
+            bookmarked=None, cursor=None, limit=20, if_none_match='"stale"',
+            user=User(id=uuid.uuid4()), db=db,
+        ))
+        assert body == {
+            "count": 0, "actions": [], "next_cursor": None,
+            "totals": {"pending": 0, "completed": 2},
+        }
+        assert response.headers["etag"] == make_etag(
+            "actions", 7, None, None, "impact", False, None, None, 20
+        )
+        assert len(db.statements) == 3
+
+
+class TestBump:
+    def test_increments_without_touching_updated_at(self):
+        db = _VersionSession(None)
+        asyncio.run(bump_actions_version(db, uuid.uuid4()))
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "actions_version=(users.actions_version +" in sql
+        assert "updated_at=users.updated_at" in sql
@@ -23,9 +23,17 @@ interface Action {
   is_bookmarked: boolean;
 }
 
+interface ActionTotals {
+  pending: number;
+  completed: number;
+}
+
 interface ActionsResponse {
   count: number;
   actions: Action[];
+  next_cursor: string | null;
+  // 첫 페이지에만 포함 (태그 / 영역 필터 안의 전체 개수)
+  totals: ActionTotals | null;
 }
 
 /* ── Constants ───────────────────────────────── */
@@ -75,20 +83,29 @@ export default function ActionsPage() {
   const [filterTag, setFilterTag] = useState<string>("");
   const [sort, setSort] = useState("impact");
   const [showCompleted, setShowCompleted] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [totals, setTotals] = useState<ActionTotals>({ pending: 0, completed: 0 });
 
-  const fetchActions = async () => {
+  // cursor 가 있으면 다음 페이지를 이어 붙이고, 없으면 첫 페이지부터 다시 로드
+  const fetchActions = async (cursor?: string) => {
     if (!accessToken) return;
     try {
       const params = new URLSearchParams();
       if (filterArea) params.set("area", filterArea);
       if (filterTag) params.set("tag", filterTag);
       params.set("sort", sort);
+      // 완료 항목 숨김은 서버에서 필터 (페이지가 완료 항목으로만 채워지지 않도록)
+      if (!showCompleted) params.set("completed", "false");
+      if (cursor) params.set("cursor", cursor);
 
       const data = await apiFetch<ActionsResponse>(
         `/actions?${params.toString()}`,
         { token: accessToken }
       );
-      setActions(data.actions);
+      setActions((prev) => (cursor ? [...prev, ...data.actions] : data.actions));
+      setNextCursor(data.next_cursor);
+      if (data.totals) setTotals(data.totals);
     } catch {
       toast("error", "액션 목록을 불러올 수 없습니다.");
     } finally {
@@ -96,9 +113,16 @@ export default function ActionsPage() {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchActions(nextCursor);
+    setLoadingMore(false);
+  };
+
   useEffect(() => {
     fetchActions();
-  }, [accessToken, filterArea, filterTag, sort]);
+  }, [accessToken, filterArea, filterTag, sort, showCompleted]);
 
   const handleComplete = async (actionId: string) => {
     if (!accessToken) return;
@@ -130,13 +154,10 @@ export default function ActionsPage() {
   // 모든 태그 수집
   const allTags = Array.from(new Set(actions.flatMap((a) => a.tags)));
 
-  const filteredActions = actions.filter((a) => {
-    if (!showCompleted && a.is_completed) return false;
-    return true;
-  });
-
-  const pendingCount = actions.filter((a) => !a.is_completed).length;
-  const completedCount = actions.filter((a) => a.is_completed).length;
+  // 개수는 서버 집계 (불러온 페이지만 세면 더 보기 전까지 틀림)
+  const pendingCount = totals.pending;
+  const completedCount = totals.completed;
+  const hasActions = pendingCount + completedCount > 0 || actions.length > 0;
 
   if (!isAuthenticated) return null;
 
@@ -156,7 +177,7 @@ export default function ActionsPage() {
       </p>
 
       {/* Stats */}
-      {actions.length > 0 && (
+      {hasActions && (
         <div className="mt-4 flex gap-4">
           <div className="flex items-center gap-2 rounded-lg bg-[var(--color-primary)] px-3 py-1.5 text-sm font-medium text-white">
             {pendingCount}개 진행 중
@@ -175,7 +196,7 @@ export default function ActionsPage() {
       )}
 
       {/* Filters */}
-      {actions.length > 0 && (
+      {hasActions && (
         <div className="mt-4 space-y-3">
           {/* Area Filter */}
           <div className="flex flex-wrap gap-2">
@@ -242,7 +263,7 @@ export default function ActionsPage() {
       )}
 
       {/* No Actions */}
-      {actions.length === 0 && (
+      {!hasActions && (
         <div className="mt-8 flex flex-col items-center justify-center rounded-2xl border border-[var(--border)] bg-[var(--card)] p-12 text-center">
           <p className="text-lg font-medium">아직 추천 액션이 없습니다</p>
           <p className="mt-2 text-sm text-[var(--muted-foreground)]">
@@ -251,9 +272,16 @@ export default function ActionsPage() {
         </div>
       )}
 
+      {/* 필터 / 완료 숨김으로 보이는 항목이 없음 */}
+      {hasActions && actions.length === 0 && (
+        <p className="mt-8 text-center text-sm text-[var(--muted-foreground)]">
+          조건에 맞는 액션이 없습니다.
+        </p>
+      )}
+
       {/* Action Cards */}
       <div className="mt-6 space-y-4">
-        {filteredActions.map((action) => (
+        {actions.map((action) => (
           <div
             key={action.id}
             className={`rounded-xl border bg-[var(--card)] p-5 transition ${
@@ -360,6 +388,19 @@ export default function ActionsPage() {
           </div>
         ))}
       </div>
+
+      {/* Load More */}
+      {nextCursor && (
+        <div className="mt-6 flex justify-center">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="rounded-lg border border-[var(--border)] px-4 py-2 text-sm font-medium transition hover:border-[var(--color-primary)] disabled:opacity-50"
+          >
+            {loadingMore ? "불러오는 중..." : "더 보기"}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -4,13 +4,21 @@ import { useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
 import { useAuthGuard } from "@/hooks/useAuthGuard";
 import { useToast } from "@/components/Toast";
-import { apiFetch } from "@/lib/api";
+import { apiFetch, apiStream, StreamEvent } from "@/lib/api";
 
-interface AnalysisStatus {
+interface SnapshotEvent {
   progress: number;
   is_done: boolean;
   total: number;
   status_breakdown: Record<string, number>;
+  sources: Record<string, string>;
+  // 최신 스코어 (is_current: 소스 수집 이후 final / fallback 으로 확정됨)
+  score: { id: string; phase: string; scored_at: string; is_current: boolean } | null;
+}
+
+interface SourceEvent {
+  source_id: string;
+  status: string;
 }
 
 const STEPS = [
@@ -19,6 +27,9 @@ const STEPS = [
   { label: "결과 정리 중", icon: "3" },
 ];
 
+// 소스가 모두 끝났는데 스코어링 이벤트가 오지 않으면 이 시간 뒤 이동
+const SCORING_WAIT_MS = 20000;
+
 export default function AnalyzingPage() {
   const router = useRouter();
   const { accessToken, isAuthenticated } = useAuthGuard();
@@ -39,52 +50,96 @@ export default function AnalyzingPage() {
       // Analysis may already be running
     });
 
-    // Poll for status
-    const interval = setInterval(async () => {
+    const controller = new AbortController();
+    let sources: Record<string, string> = {};
+    let finished = false;
+    let scoringTimer: ReturnType<typeof setTimeout> | undefined;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let failures = 0;
+
+    const finish = () => {
+      if (finished) return;
+      finished = true;
+      controller.abort();
+      clearTimeout(scoringTimer);
+      setProgress(100);
+      setCurrentStep(2);
+      setStatusText("분석이 완료되었어요!");
+
+      // Navigate to dashboard after brief delay
+      setTimeout(() => router.push("/dashboard"), 1500);
+    };
+
+    // Determine current step from per-source statuses
+    const render = () => {
+      const statuses = Object.values(sources);
+      const total = statuses.length;
+      const done = statuses.filter((s) => s === "completed" || s === "failed").length;
+      const value = total === 0 ? 0 : Math.floor((done / total) * 100);
+      setProgress(value);
+
+      if (statuses.includes("scraping")) {
+        setCurrentStep(0);
+        setStatusText("프로필 페이지 데이터를 수집하고 있어요");
+      } else if (statuses.includes("parsing")) {
+        setCurrentStep(1);
+        setStatusText("AI가 커리어 데이터를 분석하고 있어요");
+      } else if (value > 0) {
+        setCurrentStep(2);
+        setStatusText("분석 결과를 정리하고 있어요");
+      }
+
+      if (total > 0 && done === total && scoringTimer === undefined) {
+        scoringTimer = setTimeout(finish, SCORING_WAIT_MS);
+      }
+    };
+
+    const onEvent = ({ event, data }: StreamEvent) => {
+      failures = 0;
+      setFailCount(0);
+      if (event === "snapshot") {
+        const snapshot = data as SnapshotEvent;
+        sources = { ...snapshot.sources };
+        render();
+        // 이미 스코어링까지 끝난 뒤 들어온 경우: 더 올 이벤트가 없으므로 바로 이동
+        if (snapshot.is_done && snapshot.score?.is_current) finish();
+      } else if (event === "source") {
+        const { source_id, status } = data as SourceEvent;
+        sources = { ...sources, [source_id]: status };
+        render();
+      } else if (event === "scoring") {
+        finish();
+      }
+    };
+
+    // Stream progress; reconnect (with a fresh snapshot) whenever the stream ends
+    const connect = async () => {
       try {
-        const status = await apiFetch<AnalysisStatus>("/analysis/status", {
+        await apiStream("/analysis/events", onEvent, {
           token: accessToken,
+          signal: controller.signal,
         });
-
-        setProgress(status.progress);
-        setFailCount(0);
-
-        // Determine current step based on status
-        const breakdown = status.status_breakdown;
-        if (breakdown.scraping && breakdown.scraping > 0) {
-          setCurrentStep(0);
-          setStatusText("프로필 페이지 데이터를 수집하고 있어요");
-        } else if (breakdown.parsing && breakdown.parsing > 0) {
-          setCurrentStep(1);
-          setStatusText("AI가 커리어 데이터를 분석하고 있어요");
-        } else if (status.progress > 0) {
-          setCurrentStep(2);
-          setStatusText("분석 결과를 정리하고 있어요");
-        }
-
-        if (status.is_done) {
-          clearInterval(interval);
-          setProgress(100);
-          setCurrentStep(2);
-          setStatusText("분석이 완료되었어요!");
-
-          // Navigate to dashboard after brief delay
-          setTimeout(() => router.push("/dashboard"), 1500);
-        }
       } catch {
-        setFailCount((prev) => {
-          const next = prev + 1;
-          if (next >= 10) {
-            clearInterval(interval);
-            toast("error", "분석 상태를 확인할 수 없습니다. 대시보드에서 확인해주세요.");
-            setTimeout(() => router.push("/dashboard"), 2000);
-          }
-          return next;
-        });
+        if (controller.signal.aborted) return;
+        failures += 1;
+        setFailCount(failures);
+        if (failures >= 10) {
+          toast("error", "분석 상태를 확인할 수 없습니다. 대시보드에서 확인해주세요.");
+          setTimeout(() => router.push("/dashboard"), 2000);
+          return;
+        }
       }
-    }, 2000);
-
-    return () => clearInterval(interval);
+      if (!finished && !controller.signal.aborted) {
+        retryTimer = setTimeout(connect, 2000);
+      }
+    };
+    connect();
+
+    return () => {
+      controller.abort();
+      clearTimeout(scoringTimer);
+      clearTimeout(retryTimer);
+    };
   }, [accessToken, router, toast]);
 
   if (!isAuthenticated) return null;
@@ -63,8 +63,16 @@ interface ActionItem {
   is_completed: boolean;
 }
 
-interface ActionsResponse {
-  count: number;
+interface MarketPosition {
+  percentile: number;
+  percentile_source: "distribution" | "estimate";
+  category_user_count: number;
+}
+
+interface DashboardResponse {
+  sources: Source[];
+  score: ScoreData;
+  market_position: MarketPosition | null;
   actions: ActionItem[];
 }
 
@@ -101,6 +109,7 @@ export default function DashboardPage() {
   const { toast } = useToast();
   const [sources, setSources] = useState<Source[]>([]);
   const [scoreData, setScoreData] = useState<ScoreData | null>(null);
+  const [position, setPosition] = useState<MarketPosition | null>(null);
   const [topActions, setTopActions] = useState<ActionItem[]>([]);
   const [expandedArea, setExpandedArea] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
@@ -109,21 +118,18 @@ export default function DashboardPage() {
   useEffect(() => {
     if (!accessToken) return;
 
-    Promise.all([
-      apiFetch<Source[]>("/sources", { token: accessToken }).catch(() => []),
-      apiFetch<ScoreData>("/scores/latest", { token: accessToken }).catch(
-        () => null
-      ),
-      apiFetch<ActionsResponse>("/actions?sort=impact&completed=false", {
-        token: accessToken,
-      }).catch(() => null),
-    ]).then(([sourcesRes, scoreRes, actionsRes]) => {
-      setSources(sourcesRes);
-      setScoreData(scoreRes);
-      if (actionsRes) setTopActions(actionsRes.actions.slice(0, 3));
-      if (!sourcesRes.length && !scoreRes) setError(true);
-      setLoading(false);
-    });
+    apiFetch<DashboardResponse>("/dashboard?actions_limit=3", {
+      token: accessToken,
+    })
+      .then((res) => {
+        setSources(res.sources);
+        setScoreData(res.score);
+        setPosition(res.market_position);
+        setTopActions(res.actions);
+        if (!res.sources.length && !res.score.has_score) setError(true);
+      })
+      .catch(() => setError(true))
+      .finally(() => setLoading(false));
   }, [accessToken]);
 
   const scores = scoreData?.scores;
@@ -195,9 +201,14 @@ export default function DashboardPage() {
                 {scores.total}
               </p>
               <p className="mt-1 text-xs text-[var(--muted-foreground)]">/ 100</p>
-              {insights?.market_position_percentile && (
+              {position && (
                 <p className="mt-2 text-sm font-medium text-[var(--color-primary)]">
-                  상위 {100 - insights.market_position_percentile}%
+                  상위 {Math.max(1, Math.round(100 - position.percentile))}%
+                  {position.percentile_source === "distribution" && (
+                    <span className="ml-1 text-xs text-[var(--muted-foreground)]">
+                      (동일 직군 {position.category_user_count}명 기준)
+                    </span>
+                  )}
                 </p>
               )}
             </div>
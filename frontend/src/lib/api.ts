@@ -51,3 +51,68 @@ export async function apiFetch<T>(
   if (res.status === 204) return null as T;
   return res.json();
 }
+
+export interface StreamEvent {
+  event: string;
+  data: unknown;
+}
+
+/**
+ * Server-Sent Events stream over fetch (EventSource cannot send the
+ * Authorization header). Resolves when the server ends the stream.
+ */
+export async function apiStream(
+  endpoint: string,
+  onEvent: (event: StreamEvent) => void,
+  options: FetchOptions = {}
+): Promise<void> {
+  const { token, headers: customHeaders, ...rest } = options;
+
+  const headers: Record<string, string> = {
+    Accept: "text/event-stream",
+    ...((customHeaders as Record<string, string>) || {}),
+  };
+
+  if (token) {
+    headers["Authorization"] = `Bearer ${token}`;
+  }
+
+  const res = await fetch(`${API_BASE}/api/v1${endpoint}`, {
+    headers,
+    ...rest,
+  });
+
+  if (!res.ok || !res.body) {
+    if (res.status === 401) {
+      useAuthStore.getState().logout();
+    }
+    throw new ApiError(`HTTP ${res.status}`, res.status);
+  }
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf("\n\n");
+
+      let event = "message";
+      const data: string[] = [];
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+      }
+      // Comment-only blocks (keepalive) carry no data
+      if (data.length > 0) {
+        onEvent({ event, data: JSON.parse(data.join("\n")) });
+      }
+    }
+  }
+}